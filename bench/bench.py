@@ -0,0 +1,352 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import pygame
+
+from config import *
+from headless import HeadlessSimulation
+from level import Level
+from player import Player
+from platforms import Platform
+from projectile import Projectile
+from collectibles import Collectible
+from enemy import Enemy
+from traps import Traps
+from assistant import Assistant
+from animation import AnimationBank
+from archetype import Archetype
+from atlas import TextureAtlas
+from sound_bank import SoundBank
+from renderer import DirtyRenderer
+
+#Teclas que se mantienen presionadas y durante cuántos pasos, se repite hasta completar los pasos pedidos
+SCRIPT = (
+    ((pygame.K_RIGHT,), 240),
+    ((pygame.K_RIGHT, pygame.K_UP), 40),
+    ((pygame.K_SPACE,), 4),
+    ((), 30),
+    ((pygame.K_LEFT,), 160),
+    ((pygame.K_LEFT, pygame.K_UP), 40),
+    ((pygame.K_RIGHT, pygame.K_SPACE), 120)
+)
+
+#Factorías que construyen cada tipo de entidad a partir del archivo del nivel
+FACTORIES = (
+    ("players", Player.create_player_json),
+    ("platforms", Platform.create_platform_json),
+    ("collectibles", Collectible.create_collectible_json),
+    ("enemies", Enemy.create_enemy_json),
+    ("traps", Traps.create_traps_json)
+)
+
+#Entidades que se multiplican en los niveles de estrés
+STRESS_KEYS = ("platforms", "collectibles", "enemies", "traps")
+
+class Benchmark:
+    """
+    Clase que mide, sin ventana ni audio, cuánto tarda cargar cada nivel y cuánto cuesta cada fotograma del bucle del
+    nivel con una secuencia fija de teclas. Los resultados se guardan en un json que se puede comparar contra otro
+    guardado antes para detectar regresiones.
+    """
+    def __init__(self, steps:int=2000, repeat:int=5, factors:tuple=(10, 100)) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            steps (int, optional): Pasos fijos que se simulan por nivel. Defaults to 2000.
+            repeat (int, optional): Veces que se repite cada carga, se informa la mediana. Defaults to 5.
+            factors (tuple, optional): Multiplicadores de los niveles de estrés. Defaults to (10, 100).
+        """
+        HeadlessSimulation.init_display()
+        self.steps = steps
+        self.repeat = repeat
+        self.factors = factors
+        self.results = {}
+
+
+    @staticmethod
+    def clear_caches() -> None:
+        """
+        Método estático que vacía todas las cachés de recursos, para que la siguiente carga sea en frío.
+        """
+        Level.clear_cache()
+        Assistant.clear_cache()
+        AnimationBank.clear()
+        Archetype.clear()
+        TextureAtlas.clear()
+        Platform.clear_images()
+        Projectile.clear_shared()
+        SoundBank.clear()
+
+
+    @staticmethod
+    def summarize(samples:list) -> dict:
+        """
+        Método estático que resume una lista de tiempos.
+
+        Args:
+            samples (list): Tiempos en milisegundos.
+
+        Returns:
+            dict: Diccionario con la media, los percentiles p50, p95 y p99 y el máximo.
+        """
+        values = sorted(samples)
+        last = len(values) - 1
+        return {
+            "mean_ms": statistics.fmean(values),
+            "p50_ms": values[round(last * 0.50)],
+            "p95_ms": values[round(last * 0.95)],
+            "p99_ms": values[round(last * 0.99)],
+            "max_ms": values[-1]
+        }
+
+
+    @staticmethod
+    def script_keys(steps:int):
+        """
+        Generador que devuelve el estado del teclado de cada paso según SCRIPT.
+
+        Args:
+            steps (int): Cantidad de pasos.
+
+        Yields:
+            pygame.key.ScancodeWrapper: Teclas presionadas en el paso.
+        """
+        script = [(HeadlessSimulation.make_keys(inputs), count) for inputs, count in SCRIPT]
+        produced = 0
+        while produced < steps:
+            for keys, count in script:
+                for _ in range(min(count, steps - produced)):
+                    yield keys
+                produced += count
+                if produced >= steps:
+                    return
+
+
+    @staticmethod
+    def stress_level(data:dict, factor:int) -> dict:
+        """
+        Método estático que arma un nivel de estrés copiando "factor" veces las plataformas, enemigos, trampas y
+        frutas. Cada copia se corre un desplazamiento fijo en el eje x para que el resultado sea siempre el mismo.
+
+        Args:
+            data (dict): Documento del nivel original.
+            factor (int): Cantidad de copias de cada entidad.
+
+        Returns:
+            dict: Documento del nivel de estrés.
+        """
+        stress = {key: value for key, value in data.items() if key not in STRESS_KEYS}
+        for key in STRESS_KEYS:
+            entities = []
+            for copy in range(factor):
+                for entity in data.get(key, []):
+                    entity = dict(entity)
+                    shift = ((entity["pos_x"] + copy * 53) % (WIDTH - 100) + 1) - entity["pos_x"] if copy else 0
+                    entity["pos_x"] += shift
+                    if "right_limit" in entity:
+                        entity["right_limit"] += shift
+                        entity["left_limit"] = max(1, entity["left_limit"] + shift)
+                    entities.append(entity)
+            stress[key] = entities
+        return stress
+
+
+    def bench_load(self, name:str, json_file:str) -> None:
+        """
+        Método que mide la carga de un nivel con las factorías create_*_json, en frío (sin cachés) y en caliente.
+
+        Args:
+            name (str): Nombre del nivel en los resultados.
+            json_file (str): Archivo json del nivel.
+        """
+        cold = {key: [] for key, _ in FACTORIES}
+        warm = {key: [] for key, _ in FACTORIES}
+
+        for _ in range(self.repeat):
+            Benchmark.clear_caches()
+            for samples in (cold, warm):
+                for key, factory in FACTORIES:
+                    start = time.perf_counter()
+                    factory(json_file)
+                    samples[key].append((time.perf_counter() - start) * 1000)
+
+        result = {}
+        for label, samples in (("cold", cold), ("warm", warm)):
+            for key, values in samples.items():
+                result[f"{label}_{key}_ms"] = statistics.median(values)
+            result[f"{label}_total_ms"] = sum(result[f"{label}_{key}_ms"] for key, _ in FACTORIES)
+        self.results[f"load/{name}"] = result
+
+
+    def bench_frames(self, name:str, json_file:str) -> None:
+        """
+        Método que mide el costo de cada fotograma del nivel: un paso fijo de la simulación y el dibujo con el
+        DirtyRenderer, como en LevelScene.
+
+        Args:
+            name (str): Nombre del nivel en los resultados.
+            json_file (str): Archivo json del nivel.
+        """
+        random.seed(0)
+        simulation = HeadlessSimulation(json_file)
+        window = pygame.display.get_surface()
+        renderer = DirtyRenderer()
+        background = pygame.Surface((WIDTH, HEIGHT))
+        renderer.set_static(simulation.level.bake_static(background))
+
+        update_samples = []
+        draw_samples = []
+        for keys in Benchmark.script_keys(self.steps):
+            start = time.perf_counter()
+            status = simulation.step(keys)
+            middle = time.perf_counter()
+            renderer.begin(window)
+            renderer.present(simulation.level.draw(window, 1, False))
+            end = time.perf_counter()
+
+            update_samples.append((middle - start) * 1000)
+            draw_samples.append((end - middle) * 1000)
+            if status != "playing":
+                break
+
+        result = {"steps": len(update_samples)}
+        result.update({f"update_{key}": value for key, value in Benchmark.summarize(update_samples).items()})
+        result.update({f"draw_{key}": value for key, value in Benchmark.summarize(draw_samples).items()})
+        self.results[f"frames/{name}"] = result
+
+
+    def bench_sprites(self, json_files:list) -> None:
+        """
+        Método que mide Assistant.get_surface_sprite con todas las hojas que usan los niveles: cortarlas en frío y
+        pedirlas de nuevo con la caché llena.
+
+        Args:
+            json_files (list): Archivos json de los niveles.
+        """
+        sheets = {}
+        for json_file in json_files:
+            data = Level.parse(json_file) or {}
+            for entity in data.get("players", []) + data.get("enemies", []):
+                for animation in entity["animations"].values():
+                    sheets[PATH_IMAGE + animation["path"]] = animation["columns"]
+            for trap in data.get("traps", []):
+                sheets[PATH_IMAGE + trap["animations"]["path"]] = trap["animations"]["columns"]
+            for collectible in data.get("collectibles", []):
+                sheets[PATH_IMAGE + collectible["path"]] = 17
+
+        cold = []
+        warm = []
+        for _ in range(self.repeat):
+            Benchmark.clear_caches()
+            for samples in (cold, warm):
+                start = time.perf_counter()
+                for path, columns in sheets.items():
+                    Assistant.get_surface_sprite(path, columns, 1, False, 2)
+                samples.append((time.perf_counter() - start) * 1000)
+
+        self.results["sprites"] = {
+            "sheets": len(sheets),
+            "cold_ms": statistics.median(cold),
+            "warm_us_per_call": statistics.median(warm) * 1000 / max(1, len(sheets))
+        }
+
+
+    def run(self) -> dict:
+        """
+        Método que corre todas las mediciones: cada nivel, sus versiones de estrés y las hojas de sprite.
+
+        Returns:
+            dict: Resultados con la descripción del entorno en "meta".
+        """
+        descriptors = Level.discover()
+        json_files = [descriptor["json_file"] for descriptor in descriptors]
+
+        with tempfile.TemporaryDirectory() as folder:
+            levels = []
+            for json_file in json_files:
+                name = os.path.splitext(os.path.basename(json_file))[0]
+                levels.append((name, json_file))
+                for factor in self.factors:
+                    stress_file = os.path.join(folder, f"{name}x{factor}.json")
+                    with open(stress_file, "w") as file:
+                        json.dump(Benchmark.stress_level(Level.parse(json_file), factor), file)
+                    levels.append((f"{name}x{factor}", stress_file))
+
+            for name, json_file in levels:
+                self.bench_load(name, json_file)
+                self.bench_frames(name, json_file)
+
+        self.bench_sprites(json_files)
+
+        return {
+            "meta": {
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "machine": platform.machine(),
+                "steps": self.steps,
+                "repeat": self.repeat
+            },
+            "results": self.results
+        }
+
+
+    @staticmethod
+    def compare(current:dict, baseline:dict, threshold:float=0.1) -> list:
+        """
+        Método estático que compara dos resultados y devuelve las métricas de tiempo que empeoraron más que el umbral.
+
+        Args:
+            current (dict): Resultados nuevos.
+            baseline (dict): Resultados guardados antes.
+            threshold (float, optional): Empeoramiento relativo tolerado. Defaults to 0.1.
+
+        Returns:
+            list: Lista de tuplas (medición, métrica, antes, ahora, cambio relativo) de las regresiones.
+        """
+        regressions = []
+        for name, metrics in current["results"].items():
+            previous = baseline.get("results", {}).get(name, {})
+            for metric, value in metrics.items():
+                if not (metric.endswith("_ms") or metric.endswith("_us_per_call")) or metric not in previous:
+                    continue
+                before = previous[metric]
+                change = (value - before) / before if before else 0
+                print(f"{name:<24}{metric:<28}{before:>12.3f}{value:>12.3f}{change:>+10.1%}")
+                if change > threshold:
+                    regressions.append((name, metric, before, value, change))
+        return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mide la carga de los niveles y el costo por fotograma sin ventana.")
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--factors", type=int, nargs="*", default=[10, 100])
+    parser.add_argument("--output", default="bench/results.json")
+    parser.add_argument("--baseline", help="Resultados guardados contra los que comparar.")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = Benchmark(args.steps, args.repeat, tuple(args.factors)).run()
+
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"Resultados guardados en {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+        regressions = Benchmark.compare(results, baseline, args.threshold)
+        for name, metric, before, value, change in regressions:
+            print(f"REGRESIÓN {name} {metric}: {before:.3f} -> {value:.3f} ({change:+.1%})")
+        sys.exit(1 if regressions else 0)
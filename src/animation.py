@@ -0,0 +1,71 @@
+import pygame
+
+from assistant import Assistant
+
+class Animation(tuple):
+    """
+    Clase que representa los fotogramas de una animación. Se usa igual que la tupla que devuelve
+    Assistant.get_surface_sprite, pero además guarda en "rotated" los mismos fotogramas girados 180 grados, que son
+    los que se muestran cuando una entidad muere.
+    """
+    def __new__(cls, frames, rotated=None):
+        """
+        Constructor de la clase.
+
+        Args:
+            frames (iterable): Fotogramas de la animación.
+            rotated (iterable, optional): Fotogramas girados 180 grados. Si no se pasan se calculan. Defaults to None.
+        """
+        animation = super().__new__(cls, frames)
+        if rotated is None:
+            rotated = (pygame.transform.rotate(frame, 180) for frame in animation)
+        animation.rotated = tuple(rotated)
+        return animation
+
+
+class AnimationBank:
+    """
+    Clase auxiliar que arma una sola vez, por hoja de sprite, todas las variantes de una animación: hacia la derecha,
+    volteada hacia la izquierda, y las dos giradas 180 grados. Las variantes se comparten entre todas las entidades,
+    así que ninguna instancia tiene que voltear ni girar fotogramas mientras se juega.
+    """
+    _sheets = {}
+
+    @staticmethod
+    def get(path:str, columns:int, rows:int=1, flip:bool=False, scale:int|float=1) -> Animation | None:
+        """
+        Método estático que devuelve una animación compartida, armando sus variantes solo la primera vez.
+
+        Args:
+            path (str): La ruta donde se encuentra la hoja de sprite.
+            columns (int): Cantidad de columnas que tiene el sprite.
+            rows (int, optional): Cantidad de filas que tiene el sprite. Defaults to 1.
+            flip (bool, optional): Si es True devuelve la variante volteada. Defaults to False.
+            scale (int | float, optional): Tamaño al que se escala cada fotograma. Defaults to 1.
+
+        Returns:
+            Animation | None: La animación pedida, None si los parámetros no son válidos. Es compartida, no se
+            deben modificar sus fotogramas.
+        """
+        key = (path, columns, rows, scale)
+
+        variants = AnimationBank._sheets.get(key)
+        if variants is None:
+            frames = Assistant.get_surface_sprite(path, columns, rows, False, scale)
+            if frames is None:
+                return None
+            right = Animation(frames)
+            left = Animation((pygame.transform.flip(frame, True, False) for frame in frames),
+                             (pygame.transform.flip(frame, False, True) for frame in frames))
+            variants = (right, left)
+            AnimationBank._sheets[key] = variants
+
+        return variants[1] if flip else variants[0]
+
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Método estático que libera todas las animaciones armadas.
+        """
+        AnimationBank._sheets.clear()
@@ -0,0 +1,37 @@
+import json
+
+class Archetype:
+    """
+    Clase base de los arquetipos de las entidades. Un arquetipo guarda lo que comparten todas las entidades armadas a
+    partir de la misma descripción del json del nivel (animaciones, sonidos, velocidades, radios), así cada instancia
+    solo guarda su propio estado: posición, velocidad, estado y fotograma.
+    """
+    __slots__ = ()
+    _archetypes = {}
+
+    @staticmethod
+    def shared(archetype_class:type, *args) -> "Archetype":
+        """
+        Método estático que devuelve el arquetipo que corresponde a los argumentos, armándolo solo la primera vez.
+
+        Args:
+            archetype_class (type): Clase del arquetipo, por ejemplo PlayerArchetype.
+            *args: Datos del json con los que se arma el arquetipo.
+
+        Returns:
+            Archetype: Arquetipo compartido, no se debe modificar.
+        """
+        key = (archetype_class, json.dumps(args, sort_keys=True))
+        archetype = Archetype._archetypes.get(key)
+        if archetype is None:
+            archetype = archetype_class(*args)
+            Archetype._archetypes[key] = archetype
+        return archetype
+
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Método estático que olvida todos los arquetipos armados.
+        """
+        Archetype._archetypes.clear()
@@ -1,16 +1,28 @@
 import pygame
+from collections import OrderedDict
+
+from atlas import TextureAtlas
 
 class Assistant:
     """
     Clase auxiliar para manejar los sprite sheet.
 
+    Mantiene una caché de fotogramas compartida por todo el proceso, indexada por (path, columns, rows, flip, scale),
+    para que cada hoja de sprite se decodifique y se corte una sola vez aunque la pidan muchas entidades.
     """
+    CACHE_MAX_SIZE = 128
+
+    _sprite_cache = OrderedDict()
+    _image_store = {}
+    cache_hits = 0
+    cache_misses = 0
 
     @staticmethod
-    def get_surface_sprite(path: str, columns: int, rows: int, flip=False, scale=1) -> list | None:
+    def get_surface_sprite(path: str, columns: int, rows: int, flip=False, scale=1) -> tuple | None:
         """
         Método estático que genera coordenadas de una hoja de sprite, para manejar las animaciones.
         Calcula el ancho y alto dependiendo las columnas y las filas del sprite sheet.
+        Si la misma hoja ya se pidió con los mismos parámetros se devuelve la tupla guardada en la caché.
 
         Args:
             path (str): La ruta donde se encuentra la hoja de sprite.
@@ -20,32 +32,139 @@ class Assistant:
             scale (int or float optional): Tamaño al que se quiere escalar la imagen. Defaults to 1.
 
         Returns:
-            list | None: Si la validación fue exitosa retorna la lista que en cada indice contendrá cada fotograma
-            de la imagen, None en caso de no cumplirse la validación.
-        """       
+            tuple | None: Si la validación fue exitosa retorna la tupla que en cada indice contendrá cada fotograma
+            de la imagen, None en caso de no cumplirse la validación. La tupla es compartida, no se deben modificar
+            sus fotogramas.
+        """
         if isinstance(path, str) and path and isinstance(columns, int) and columns and isinstance(rows, int) and rows:
-            sprite_list = []
+            key = (path, columns, rows, bool(flip), scale)
 
-            image_surface = pygame.image.load(path)
-            wide_frame = int(image_surface.get_width() / columns)
-            high_frame = int(image_surface.get_height() / rows)
-            wide_frame_scaling = int(wide_frame * scale)
-            high_frame_scaling = int(high_frame * scale)
-
-            for fila in range(rows):
-                for columna in range(columns):
-                    x = columna * wide_frame
-                    y = fila * high_frame
-                    frame_surface = image_surface.subsurface(x, y, wide_frame, high_frame)
-
-                    if scale != 1:
-                        frame_surface = pygame.transform.scale(frame_surface, (wide_frame_scaling, high_frame_scaling)).convert_alpha()
-                    if flip:
-                        frame_surface = pygame.transform.flip(frame_surface, True, False).convert_alpha()
-                    
-                    sprite_list.append(frame_surface)
-
-            return sprite_list
+            sprite_tuple = Assistant._sprite_cache.get(key)
+            if sprite_tuple is not None:
+                Assistant.cache_hits += 1
+                Assistant._sprite_cache.move_to_end(key)
+                return sprite_tuple
+
+            Assistant.cache_misses += 1
+            sprite_tuple = Assistant._slice_sprite(path, columns, rows, flip, scale)
+
+            Assistant._sprite_cache[key] = sprite_tuple
+            if len(Assistant._sprite_cache) > Assistant.CACHE_MAX_SIZE:
+                Assistant._sprite_cache.popitem(last=False)
+
+            return sprite_tuple
         else:
             return None
 
+
+    @staticmethod
+    def _slice_sprite(path: str, columns: int, rows: int, flip: bool, scale: int | float) -> tuple:
+        """
+        Método estático que carga la hoja de sprite desde el disco y la corta en fotogramas.
+
+        Args:
+            path (str): La ruta donde se encuentra la hoja de sprite.
+            columns (int): Cantidad de columnas que tiene el sprite.
+            rows (int): Cantidad de filas que tiene el sprite.
+            flip (bool): Si es True voltea cada fotograma.
+            scale (int | float): Tamaño al que se escala cada fotograma.
+
+        Returns:
+            tuple: Tupla con los fotogramas de la hoja.
+        """
+        sprite_list = []
+
+        image_surface = Assistant.load_image(path)
+        wide_frame = int(image_surface.get_width() / columns)
+        high_frame = int(image_surface.get_height() / rows)
+        wide_frame_scaling = int(wide_frame * scale)
+        high_frame_scaling = int(high_frame * scale)
+
+        for fila in range(rows):
+            for columna in range(columns):
+                x = columna * wide_frame
+                y = fila * high_frame
+                frame_surface = image_surface.subsurface(x, y, wide_frame, high_frame)
+
+                if scale != 1:
+                    frame_surface = pygame.transform.scale(frame_surface, (wide_frame_scaling, high_frame_scaling))
+                if flip:
+                    frame_surface = pygame.transform.flip(frame_surface, True, False)
+                if scale != 1 or flip:
+                    frame_surface = frame_surface.convert_alpha()
+
+                sprite_list.append(frame_surface)
+
+        return tuple(sprite_list)
+
+
+    @staticmethod
+    def load_image(path: str) -> pygame.Surface:
+        """
+        Método estático que devuelve la imagen cruda de una hoja de sprite. Si la imagen ya fue decodificada de antemano
+        (por ejemplo por el Preloader) se usa esa, si está en un atlas se devuelve como subsuperficie del atlas, y si
+        no se carga desde el disco.
+
+        Args:
+            path (str): La ruta donde se encuentra la imagen.
+
+        Returns:
+            pygame.Surface: La imagen decodificada.
+        """
+        image_surface = Assistant._image_store.get(path)
+        if image_surface is None:
+            image_surface = TextureAtlas.get(path)
+        if image_surface is None:
+            image_surface = pygame.image.load(path)
+        return image_surface
+
+
+    @staticmethod
+    def provide_image(path: str, image_surface: pygame.Surface) -> None:
+        """
+        Método estático que registra una imagen ya decodificada para que get_surface_sprite no tenga que leer el disco.
+
+        Args:
+            path (str): La ruta de la imagen.
+            image_surface (pygame.Surface): La imagen decodificada.
+        """
+        if isinstance(path, str) and path and isinstance(image_surface, pygame.Surface):
+            Assistant._image_store[path] = image_surface
+
+
+    @staticmethod
+    def release_images(paths) -> None:
+        """
+        Método estático que libera las imágenes registradas con provide_image una vez que ya no se necesitan.
+
+        Args:
+            paths (iterable): Rutas de las imágenes a liberar.
+        """
+        for path in paths:
+            Assistant._image_store.pop(path, None)
+
+
+    @staticmethod
+    def cache_info() -> dict:
+        """
+        Método estático que informa el estado de la caché de fotogramas.
+
+        Returns:
+            dict: Diccionario con los aciertos, los fallos, la cantidad de hojas guardadas y el tamaño máximo.
+        """
+        return {
+            "hits": Assistant.cache_hits,
+            "misses": Assistant.cache_misses,
+            "size": len(Assistant._sprite_cache),
+            "max_size": Assistant.CACHE_MAX_SIZE
+        }
+
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Método estático que vacía la caché de fotogramas y reinicia los contadores.
+        """
+        Assistant._sprite_cache.clear()
+        Assistant.cache_hits = 0
+        Assistant.cache_misses = 0
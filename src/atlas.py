@@ -0,0 +1,201 @@
+import os
+import json
+import argparse
+import pygame
+
+from config import *
+
+class TextureAtlas:
+    """
+    Clase que sirve las hojas de sprite desde atlas armados de antemano con "build". Cada atlas es una imagen grande
+    con muchas hojas empaquetadas y un índice json indica dónde quedó cada una; pedir una hoja devuelve una
+    subsuperficie del atlas, así se abre y decodifica un archivo por atlas en lugar de uno por hoja. Si no hay índice
+    las hojas se cargan del disco como siempre.
+    """
+    _index = None
+    _pages = {}
+
+    @staticmethod
+    def load_index(index_path:str=PATH_ATLAS+"atlas.json") -> dict:
+        """
+        Método estático que lee el índice de los atlas la primera vez que se necesita.
+
+        Args:
+            index_path (str, optional): Ruta del índice. Defaults to PATH_ATLAS+"atlas.json".
+
+        Returns:
+            dict: Índice con las páginas y la ubicación de cada hoja, vacío si no existe.
+        """
+        if TextureAtlas._index is None:
+            try:
+                with open(index_path, "r") as file:
+                    TextureAtlas._index = json.load(file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                TextureAtlas._index = {"pages": [], "sprites": {}}
+        return TextureAtlas._index
+
+
+    @staticmethod
+    def contains(path:str) -> bool:
+        """
+        Método estático que indica si una hoja está en algún atlas.
+
+        Args:
+            path (str): Ruta de la hoja, por ejemplo PATH_IMAGE + "Personaje/Ninja Frog/Idle (32x32).png".
+
+        Returns:
+            bool: True si la hoja se puede servir desde un atlas.
+        """
+        return isinstance(path, str) and path.startswith(PATH_IMAGE) and \
+            path[len(PATH_IMAGE):] in TextureAtlas.load_index()["sprites"]
+
+
+    @staticmethod
+    def get(path:str) -> pygame.Surface | None:
+        """
+        Método estático que devuelve una hoja como subsuperficie de su atlas, cargando la página si hace falta.
+
+        Args:
+            path (str): Ruta de la hoja.
+
+        Returns:
+            pygame.Surface | None: La hoja, o None si no está en ningún atlas.
+        """
+        if not TextureAtlas.contains(path):
+            return None
+
+        page, x, y, width, height = TextureAtlas.load_index()["sprites"][path[len(PATH_IMAGE):]]
+        page_surface = TextureAtlas._pages.get(page)
+        if page_surface is None:
+            page_surface = pygame.image.load(PATH_ATLAS + TextureAtlas.load_index()["pages"][page])
+            if pygame.display.get_surface() is not None:
+                page_surface = page_surface.convert_alpha()
+            TextureAtlas._pages[page] = page_surface
+        return page_surface.subsurface(x, y, width, height)
+
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Método estático que libera las páginas cargadas y olvida el índice, por ejemplo luego de volver a armarlo.
+        """
+        TextureAtlas._index = None
+        TextureAtlas._pages.clear()
+
+
+    @staticmethod
+    def sheet_paths(folder:str=PATH_JSON) -> list:
+        """
+        Método estático que junta las hojas de sprite que usan los niveles: las compartidas y todas las rutas que
+        aparecen en los archivos nivel_N.json.
+
+        Args:
+            folder (str, optional): Carpeta de los niveles. Defaults to PATH_JSON.
+
+        Returns:
+            list: Rutas relativas a PATH_IMAGE, sin repetir.
+        """
+        from level import Level
+        from preloader import Preloader
+
+        paths = [SHEET_PLATFORMS[len(PATH_IMAGE):], SHEET_COLLECTED[len(PATH_IMAGE):], SHEET_BULLET[len(PATH_IMAGE):]]
+        for descriptor in Level.discover(folder):
+            data = Level.parse(descriptor["json_file"])
+            if data is not None:
+                paths += Preloader.image_paths(data)
+        return list(dict.fromkeys(paths))
+
+
+    @staticmethod
+    def pack(sizes:dict, page_size:int, padding:int=1) -> tuple:
+        """
+        Método estático que ubica rectángulos en páginas con el algoritmo de estantes: se ordenan de mayor a menor
+        alto y se van colocando de izquierda a derecha, abriendo un estante nuevo cuando no entran.
+
+        Args:
+            sizes (dict): Diccionario nombre: (ancho, alto).
+            page_size (int): Lado de cada página.
+            padding (int, optional): Separación en píxeles entre rectángulos. Defaults to 1.
+
+        Returns:
+            tuple: Tupla (placements, pages) con un diccionario nombre: [página, x, y, ancho, alto] y una lista con
+            el tamaño usado de cada página.
+        """
+        placements = {}
+        pages = []
+        x = y = shelf_height = 0
+
+        for name, (width, height) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+            if width > page_size or height > page_size:
+                continue
+            if pages and x + width > page_size:
+                x = 0
+                y += shelf_height + padding
+                shelf_height = 0
+            if not pages or y + height > page_size:
+                pages.append([0, 0])
+                x = y = shelf_height = 0
+
+            placements[name] = [len(pages) - 1, x, y, width, height]
+            pages[-1][0] = max(pages[-1][0], x + width)
+            pages[-1][1] = max(pages[-1][1], y + height)
+            x += width + padding
+            shelf_height = max(shelf_height, height)
+
+        return placements, pages
+
+
+    @staticmethod
+    def build(paths:list, output:str=PATH_ATLAS, page_size:int=ATLAS_PAGE_SIZE) -> dict:
+        """
+        Método estático que arma los atlas y su índice. Se corre fuera del juego cada vez que cambian las imágenes
+        de los niveles, por ejemplo con "python src/atlas.py".
+
+        Args:
+            paths (list): Rutas de las hojas relativas a PATH_IMAGE.
+            output (str, optional): Carpeta donde se guardan las páginas y el índice. Defaults to PATH_ATLAS.
+            page_size (int, optional): Lado máximo de cada página. Defaults to ATLAS_PAGE_SIZE.
+
+        Returns:
+            dict: Índice guardado en "atlas.json".
+        """
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+        images = {}
+        for path in paths:
+            try:
+                images[path] = pygame.image.load(PATH_IMAGE + path).convert_alpha()
+            except (FileNotFoundError, pygame.error):
+                continue
+
+        placements, pages = TextureAtlas.pack({path: image.get_size() for path, image in images.items()}, page_size)
+
+        os.makedirs(output, exist_ok=True)
+        page_names = []
+        for number, size in enumerate(pages):
+            page_surface = pygame.Surface(size, pygame.SRCALPHA)
+            for path, (page, x, y, width, height) in placements.items():
+                if page == number:
+                    page_surface.blit(images[path], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            page_names.append(f"atlas_{number}.png")
+            pygame.image.save(page_surface, os.path.join(output, page_names[-1]))
+
+        index = {"pages": page_names, "sprites": dict(sorted(placements.items()))}
+        with open(os.path.join(output, "atlas.json"), "w") as file:
+            json.dump(index, file, indent=4)
+
+        TextureAtlas.clear()
+        return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Empaqueta las hojas de sprite de los niveles en atlas.")
+    parser.add_argument("--output", default=PATH_ATLAS)
+    parser.add_argument("--size", type=int, default=ATLAS_PAGE_SIZE)
+    args = parser.parse_args()
+
+    pygame.init()
+    paths = TextureAtlas.sheet_paths()
+    index = TextureAtlas.build(paths, args.output, args.size)
+    print(f"{len(index['sprites'])} hojas de {len(paths)} en {len(index['pages'])} atlas")
@@ -3,12 +3,60 @@ import json
 
 from config import *
 from assistant import Assistant
+from archetype import Archetype
+from sound_bank import SoundBank
+
+class CollectibleArchetype(Archetype):
+    """
+    Clase que guarda lo que comparten todos los recolectables de la misma fruta, tipo y escala: los fotogramas, el
+    sonido y los tiempos de la animación.
+    """
+    __slots__ = ("image_collectible", "image_collected", "frame_rate", "collected_delay", "type", "sound")
+
+    def __init__(self, path:str, type:str, scale:int|float) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            path (str): Ruta de la imagen.
+            type (str): Tipo de recolectable, "special" o "normal".
+            scale (int | float): Escala de la imagen.
+        """
+        self.image_collectible = Assistant.get_surface_sprite(PATH_IMAGE+path,17,1,False,scale)
+        self.image_collected = Assistant.get_surface_sprite(SHEET_COLLECTED,6,1,False,2)
+        self.frame_rate = 30
+        self.collected_delay = 60
+        self.type = type
+        if self.type == "special":
+            self.sound = SoundBank.get("fruit_special.mp3", 0.1)
+        else:
+            self.sound = SoundBank.get("recoleccion.mp3", 0.1)
+
+
+    @staticmethod
+    def get(path:str, type:str, scale:int|float) -> "CollectibleArchetype":
+        """
+        Método estático que devuelve el arquetipo compartido para esa fruta, tipo y escala.
+
+        Args:
+            path (str): Ruta de la imagen.
+            type (str): Tipo de recolectable, "special" o "normal".
+            scale (int | float): Escala de la imagen.
+
+        Returns:
+            CollectibleArchetype: Arquetipo compartido.
+        """
+        return Archetype.shared(CollectibleArchetype, path, type, scale)
+
 
 class Collectible:
     """
     Clase que instancia objetos de tipo Collectible que serán utilizados en este juego para que el Player los recolecte y
-    sume puntos a su score.
+    sume puntos a su score. Lo que no cambia entre recolectables iguales vive en su CollectibleArchetype.
     """
+    __slots__ = ("archetype", "frame", "animation", "rect", "rect_collision", "animation_elapsed_time", "collected",
+                 "collected_elapsed_time")
+
     def __init__(self, pos_x:int, pos_y:int, path:str, type:str, scale:int|float) -> None:
         """
         Constructor de la clase.
@@ -20,26 +68,25 @@ class Collectible:
         """
         if(isinstance(pos_x, int) and pos_x and isinstance(pos_y, int) and pos_y and isinstance(path, str) and path and
            isinstance(type, str) and type and isinstance(scale, (int, float)) and scale):
-            self.image_collectible = Assistant.get_surface_sprite(PATH_IMAGE+path,17,1,False,scale)
-            self.image_collected = Assistant.get_surface_sprite(PATH_IMAGE+"Varios/Cositas/Items/Fruits/Collected.png",6,1,False,2)
+            self.archetype = CollectibleArchetype.get(path, type, scale)
             self.frame = 0
-            self.animation = self.image_collected
-            self.image = self.animation[self.frame]
-            self.rect = self.image.get_rect()
+            self.animation = self.archetype.image_collected
+            self.rect = self.animation[self.frame].get_rect()
             self.rect.x = pos_x
             self.rect.y = pos_y
             self.rect_collision = pygame.Rect(self.rect.x+20, self.rect.y+15, (self.rect.w//3+2), self.rect.h-37)
             self.animation_elapsed_time = 0
-            self.frame_rate = 30
             self.collected = False
-            self.counter = 0
-            self.type = type
-            if self.type == "special":
-                self.sound = pygame.mixer.Sound(PATH_SOUND+"fruit_special.mp3")
-            else:
-                self.sound = pygame.mixer.Sound(PATH_SOUND+"recoleccion.mp3")
-            self.sound.set_volume(0.1)
-    
+            self.collected_elapsed_time = 0
+
+
+    @property
+    def animations(self) -> tuple:
+        """
+        Animaciones que puede mostrar el recolectable, la normal y la de recolectado. Las usa el EntityStore.
+        """
+        return (self.archetype.image_collectible, self.archetype.image_collected)
+
 
     @staticmethod
     def create_collectible_json(json_file:str) -> list | None:
@@ -53,34 +100,48 @@ class Collectible:
             list: Retorna la lista de Collectibles o None en caso de error.
         """
         try:
-            collectible_list = []
-
             with open (json_file, "r") as file:
                 data = json.load(file)
 
-                if "collectibles" in data:
-                    collectibles_data = data["collectibles"]
-
-                    for collectible in collectibles_data:
-                        pos_x = collectible["pos_x"]
-                        pos_y = collectible["pos_y"]
-                        path = collectible["path"]
-                        type = collectible["type"]
-                        scale = collectible["scale"]
-
-                        collectible = Collectible(pos_x, pos_y, path, type, scale)
-                        collectible_list.append(collectible)
-                        
-            return collectible_list
+            return Collectible.create_collectible_list(data)
 
         except (FileNotFoundError, json.JSONDecodeError):
             return None
 
+
+    @staticmethod
+    def create_collectible_list(data:dict) -> list:
+        """
+        Método estático que construye los recolectables a partir del documento del nivel ya parseado.
+
+        Args:
+            data (dict): Documento del nivel, se usa la clave "collectibles".
+
+        Returns:
+            list: Retorna la lista de Collectibles, vacía si el documento no tiene la clave.
+        """
+        collectible_list = []
+
+        if isinstance(data, dict) and "collectibles" in data:
+            collectibles_data = data["collectibles"]
+
+            for collectible in collectibles_data:
+                pos_x = collectible["pos_x"]
+                pos_y = collectible["pos_y"]
+                path = collectible["path"]
+                type = collectible["type"]
+                scale = collectible["scale"]
+
+                collectible = Collectible(pos_x, pos_y, path, type, scale)
+                collectible_list.append(collectible)
+
+        return collectible_list
+
     
     def do_animation(self, delta_ms:int) -> None:
         """
         Método que se encarga las animaciones. Se encarga de establecer en 0 el frame cada vez que el tiempo sea mayor al
-        al atributo self.frame_rate.
+        al atributo self.archetype.frame_rate.
         También muestra la animación "self.image_collected" si es que el player colisiona con la instancia de la clase.
 
         Args:
@@ -89,14 +150,14 @@ class Collectible:
         if isinstance(delta_ms, int) and delta_ms:
             self.animation_elapsed_time += delta_ms
 
-            if self.animation_elapsed_time >= self.frame_rate:
+            if self.animation_elapsed_time >= self.archetype.frame_rate:
                 self.animation_elapsed_time = 0
                 self.frame = (self.frame + 1) % len(self.animation)
             
             if self.collected:
-                self.animation = self.image_collected
+                self.animation = self.archetype.image_collected
             else:
-                self.animation = self.image_collectible
+                self.animation = self.archetype.image_collectible
 
     
     def update(self, delta_ms:int) -> None:
@@ -110,12 +171,15 @@ class Collectible:
             self.do_animation(delta_ms)
 
     
-    def draw(self, window:pygame.Surface) -> None:
+    def draw(self, window:pygame.Surface) -> pygame.Rect | None:
         """
         Método que se encarga de dibujar los objetos Collectibles en la ventana.
 
         Args:
             window (pygame.Surface): Es la ventana principal del juego.
+
+        Returns:
+            pygame.Rect | None: Zona de la ventana donde se dibujó, None si la ventana no es válida.
         """
         if isinstance(window, pygame.Surface) and window:
             if self.collected:
@@ -123,8 +187,7 @@ class Collectible:
             else:
                 frame = self.frame
                 
-            self.image = self.animation[frame]
-            window.blit(self.image, self.rect)
+            return window.blit(self.animation[frame], self.rect)
 
 
 
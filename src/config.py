@@ -6,6 +6,41 @@ HEIGHT = 800
 PATH_IMAGE = "src/Recursos/Image/"
 PATH_SOUND = "src/Recursos/Sound/"
 
+#Ruta de los archivos de nivel
+PATH_JSON = "src/Files Json/"
+
+#Hojas de sprite compartidas por todas las instancias
+SHEET_PLATFORMS = PATH_IMAGE+"Varios/Bloques/sheet1.png"
+SHEET_COLLECTED = PATH_IMAGE+"Varios/Cositas/Items/Fruits/Collected.png"
+SHEET_BULLET = PATH_IMAGE+"Varios/Cositas/Enemies/Trunk/Bullet.png"
+
+#Atlas con las hojas de sprite empaquetadas (se arman con "python src/atlas.py")
+PATH_ATLAS = "src/Recursos/Atlas/"
+ATLAS_PAGE_SIZE = 2048
+
+#Memoria máxima (en bytes) que puede ocupar la precarga del siguiente nivel
+PRELOAD_MEMORY_BUDGET = 64 * 1024 * 1024
+
+#Capa estática (fondo y plataformas) guardada en disco por nivel
+STATIC_LAYER_CACHE = False
+PATH_CACHE = "src/Cache/"
+
+#Lado en píxeles de cada celda de la grilla de colisiones
+GRID_CELL_SIZE = 100
+
+#Cantidad mínima de trampas o frutas de un nivel para animarlas en lote con NumPy (si está instalado)
+ENTITY_STORE_MIN = 64
+
+#Cantidad de proyectiles preasignados por Player
+PROJECTILE_POOL_SIZE = 16
+
+#Cantidad máxima de veces que un mismo efecto de sonido puede sonar a la vez
+SOUND_MAX_VOICES = 3
+
+#Efectos de sonido que usan las entidades de los niveles
+SOUND_EFFECTS = ("salto.mp3", "muerte_player.mp3", "muerte_enemigo.mp3", "recoleccion.mp3", "fruit_special.mp3",
+                 "disparo.mp3")
+
 #Direcciones
 DIRECTION_L = -1
 DIRECTION_R = 1
@@ -24,6 +59,28 @@ GREY = (128, 128, 128)
 #Fotogramas por segundos
 FPS = 120
 
+#Milisegundos que avanza cada paso fijo de la simulación, y tiempo máximo que se simula por fotograma
+FIXED_STEP_MS = 8
+MAX_FRAME_MS = 100
+
+#Profiler: fotogramas que entran en los percentiles, etapas que guarda la traza, cada cuánto se actualiza el panel
+#y dónde se exporta la traza (".csv" o ".json")
+PROFILER_HISTORY = 600
+PROFILER_TRACE_LIMIT = 200000
+PROFILER_OVERLAY_MS = 250
+PROFILER_TRACE = PATH_CACHE + "profile.csv"
+
+#Grabación de las teclas de cada nivel jugado, para reproducirlo luego con "python src/replay.py"
+RECORD_INPUTS = False
+PATH_REPLAYS = PATH_CACHE + "Replays/"
+
+#Ranking: base SQLite y el ranking en json de versiones anteriores, que se importa una sola vez
+RANKING_DB = "ranking.db"
+RANKING_JSON = "ranking.json"
+RANKING_PAGE_SIZE = 8
+RANKING_PAGE_CACHE = 3
+RANKING_ROW_HEIGHT = 65
+
 #Ruta de fuentes
 FONT_BREAKING = "src/Recursos/Fonts/breaking/Breaking.ttf"
 
@@ -3,13 +3,64 @@ import json
 import random
 
 from config import *
-from assistant import Assistant
+from animation import AnimationBank
+from archetype import Archetype
+from sound_bank import SoundBank
+from spatial import SpatialGrid
+
+class EnemyArchetype(Archetype):
+    """
+    Clase que guarda lo que comparten todos los enemigos armados con las mismas animaciones: los fotogramas, el sonido
+    de muerte y las constantes de movimiento y ataque.
+    """
+    __slots__ = ("still_r", "still_l", "walking_r", "walking_l", "running_r", "running_l", "gravity", "move_rate",
+                 "frame_rate", "patrol_wait_limit", "attack_range", "sound_death")
+
+    def __init__(self, animations:dict) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            animations (dict): Un diccionario que contiene las animaciones y el numero de columna por animación.
+        """
+        self.still_r = AnimationBank.get(PATH_IMAGE + animations["still_r"]["path"],animations["still_r"]["columns"], 1, True, 2)
+        self.still_l = AnimationBank.get(PATH_IMAGE + animations["still_l"]["path"],animations["still_l"]["columns"],1,False, 2)
+        self.walking_r = AnimationBank.get(PATH_IMAGE + animations["walking_r"]["path"],animations["walking_r"]["columns"],1, True, 2)
+        self.walking_l = AnimationBank.get(PATH_IMAGE + animations["walking_l"]["path"],animations["walking_l"]["columns"], 1, False, 2)
+        self.running_r = AnimationBank.get(PATH_IMAGE + animations["running_r"]["path"],animations["running_r"]["columns"],1, False, 2)
+        self.running_l = AnimationBank.get(PATH_IMAGE + animations["running_l"]["path"],animations["running_l"]["columns"],1, True, 2)
+        self.gravity = 3
+        self.move_rate = 16
+        self.frame_rate = 30
+        self.patrol_wait_limit = 2000
+        self.attack_range = 200
+        self.sound_death = SoundBank.get("muerte_enemigo.mp3", 1)
+
+
+    @staticmethod
+    def get(animations:dict) -> "EnemyArchetype":
+        """
+        Método estático que devuelve el arquetipo compartido para esas animaciones.
+
+        Args:
+            animations (dict): Un diccionario que contiene las animaciones y el numero de columna por animación.
+
+        Returns:
+            EnemyArchetype: Arquetipo compartido.
+        """
+        return Archetype.shared(EnemyArchetype, animations)
+
 
 class Enemy:
     """
     Clase que instancia objetos de tipo Enemy que serán utilizados en este juego para tratar de matar al Player.
-    
+    Lo que no cambia entre enemigos con las mismas animaciones vive en su EnemyArchetype.
     """
+    __slots__ = ("archetype", "frame", "direction", "animation", "rect", "rect_collision_head", "rect_collision_body",
+                 "rect_collision_feet", "right_limit", "left_limit", "move_x", "movement_elapsed_time",
+                 "animation_elapsed_time", "was_hit", "patrol_state", "patrol_wait_time", "elapsed_time_of_death",
+                 "is_falling", "prev_x", "prev_y", "grid", "grid_index")
+
     def __init__(self, animations:dict, pos_x:int, pos_y:int, right_limit:int, left_limit:int) -> None:
         """
         Constructor de la clase.
@@ -23,17 +74,11 @@ class Enemy:
         """
         if(isinstance(animations, dict) and animations and isinstance(pos_x, int) and pos_x and isinstance(pos_y, int) and
            pos_y and isinstance(right_limit, int) and right_limit and isinstance(left_limit, int) and left_limit):         
-            self.still_r = Assistant.get_surface_sprite(PATH_IMAGE + animations["still_r"]["path"],animations["still_r"]["columns"], 1, True, 2)
-            self.still_l = Assistant.get_surface_sprite(PATH_IMAGE + animations["still_l"]["path"],animations["still_l"]["columns"],1,False, 2)
-            self.walking_r = Assistant.get_surface_sprite(PATH_IMAGE + animations["walking_r"]["path"],animations["walking_r"]["columns"],1, True, 2)
-            self.walking_l = Assistant.get_surface_sprite(PATH_IMAGE + animations["walking_l"]["path"],animations["walking_l"]["columns"], 1, False, 2)
-            self.running_r = Assistant.get_surface_sprite(PATH_IMAGE + animations["running_r"]["path"],animations["running_r"]["columns"],1, False, 2)
-            self.running_l = Assistant.get_surface_sprite(PATH_IMAGE + animations["running_l"]["path"],animations["running_l"]["columns"],1, True, 2)
+            self.archetype = EnemyArchetype.get(animations)
             self.frame = 0
             self.direction = DIRECTION_R
-            self.animation = self.walking_r
-            self.image = self.animation[self.frame]
-            self.rect = self.image.get_rect()
+            self.animation = self.archetype.walking_r
+            self.rect = self.animation[self.frame].get_rect()
             self.rect.x = pos_x
             self.rect.y = pos_y
             self.rect_collision_head = pygame.Rect(self.rect.x+10, self.rect.y+15, self.rect.w-18, 5)
@@ -42,22 +87,19 @@ class Enemy:
             self.right_limit = right_limit
             self.left_limit = left_limit
             self.move_x = 0
-            self.gravity = 3
             self.movement_elapsed_time = 0
-            self.move_rate = 10
             self.animation_elapsed_time = 0
-            self.frame_rate = 30
-            self.rotate_image = pygame.transform.rotate(self.image, 180)
             self.was_hit = False
             self.patrol_state = "moving"
             self.patrol_wait_time = 0
-            self.attack_range = 200
             self.elapsed_time_of_death = 0
-            self.sound_death = pygame.mixer.Sound(PATH_SOUND+"muerte_enemigo.mp3")
-            self.sound_death.set_volume(1)
             self.is_falling = False
-            
-        
+            self.prev_x = self.rect.x
+            self.prev_y = self.rect.y
+            self.grid = None
+            self.grid_index = None
+
+
     @staticmethod
     def create_enemy_json(json_file:str) -> list | None:
         """
@@ -71,68 +113,86 @@ class Enemy:
             list: Retorna la lista de Enemies o None en caso de error.
         """
         try:
-            enemy_list = []
-
             with open (json_file, "r") as file:
                 data = json.load(file)
 
-                if "enemies" in data:
-                    enemy_data = data["enemies"]
-
-                    for enemy in enemy_data:
-                        animations = enemy["animations"]
-                        pos_x = enemy["pos_x"]
-                        pos_y = enemy["pos_y"]
-                        right_limit = enemy["right_limit"]
-                        left_limit = enemy["left_limit"]
-                    
-                        enemy = Enemy(animations, pos_x, pos_y, right_limit, left_limit)
-                        enemy_list.append(enemy)
+            return Enemy.create_enemy_list(data)
 
-            return enemy_list
-        
         except (FileNotFoundError, json.JSONDecodeError):
             return None
 
 
-    def patrol(self) -> None:
+    @staticmethod
+    def create_enemy_list(data:dict) -> list:
+        """
+        Método estático que construye los Enemies a partir del documento del nivel ya parseado.
+
+        Args:
+            data (dict): Documento del nivel, se usa la clave "enemies".
+
+        Returns:
+            list: Retorna la lista de Enemies, vacía si el documento no tiene la clave.
+        """
+        enemy_list = []
+
+        if isinstance(data, dict) and "enemies" in data:
+            enemy_data = data["enemies"]
+
+            for enemy in enemy_data:
+                animations = enemy["animations"]
+                pos_x = enemy["pos_x"]
+                pos_y = enemy["pos_y"]
+                right_limit = enemy["right_limit"]
+                left_limit = enemy["left_limit"]
+
+                enemy = Enemy(animations, pos_x, pos_y, right_limit, left_limit)
+                enemy_list.append(enemy)
+
+        return enemy_list
+
+
+    def patrol(self, delta_ms:int) -> None:
         """
         Método que maneja los movimientos de patrullaje del enemigo, el enemigo va ir de izquierda a derecha entre
-        las coordenadas "right_limit" y "left_limit", cuando llega a cualquiera de los limites se queda esperando 2 seg
-        y vuelve a patrullar para el lado contrario.
+        las coordenadas "right_limit" y "left_limit", cuando llega a cualquiera de los limites se queda esperando
+        "patrol_wait_limit" milisegundos (2 seg) y vuelve a patrullar para el lado contrario.
+
+        Args:
+            delta_ms (int): Milisegundos que pasaron desde el paso de movimiento anterior.
         """
         if self.patrol_state == "moving":
             if self.direction == DIRECTION_R:
-                self.animation = self.walking_r
+                self.animation = self.archetype.walking_r
                 if self.rect.x >= self.right_limit:
-                    self.animation = self.still_l
+                    self.animation = self.archetype.still_l
                     self.direction = DIRECTION_L
                     self.patrol_state = "waiting"
             elif self.direction == DIRECTION_L:
-                self.animation = self.walking_l
+                self.animation = self.archetype.walking_l
                 if self.rect.x <= self.left_limit:
-                    self.animation = self.still_r
+                    self.animation = self.archetype.still_r
                     self.direction = DIRECTION_R
                     self.patrol_state = "waiting"
             self.add_x(self.direction)
         elif self.patrol_state == "waiting":
             if self.direction == DIRECTION_R:
-                self.animation = self.still_l
+                self.animation = self.archetype.still_l
             else:
-                self.animation = self.still_r
-            self.patrol_wait_time += 1
-            if self.patrol_wait_time >= 120:
+                self.animation = self.archetype.still_r
+            self.patrol_wait_time += delta_ms
+            if self.patrol_wait_time >= self.archetype.patrol_wait_limit:
                 self.patrol_wait_time = 0
                 self.patrol_state = "moving"
 
     
-    def attack(self, player) -> None:
+    def attack(self, player, delta_ms:int) -> None:
         """
         Método que maneja el ataque del enemigo, si el Player se acerca hasta "attack_range" el enemigo comienza 
         a perseguirlo hasta que se aleje el Player vuelve a patrullar.
 
         Args:
             player (Player): Es una instancia de la clase Player.
+            delta_ms (int): Milisegundos que pasaron desde el paso de movimiento anterior.
         """
         if player:
             distance_x = player.rect.x - self.rect.x
@@ -141,19 +201,19 @@ class Enemy:
             if not self.is_falling:
                 if distance_x == 0:
                     if self.direction == DIRECTION_R:
-                        self.animation = self.still_r
+                        self.animation = self.archetype.still_r
                     else:
-                        self.animation = self.still_l
-                elif abs(distance_x) < self.attack_range and abs(distance_y) <= 180:
+                        self.animation = self.archetype.still_l
+                elif abs(distance_x) < self.archetype.attack_range and abs(distance_y) <= 180:
                     if distance_x > 0:
                         self.direction = DIRECTION_L
-                        self.animation = self.running_l
+                        self.animation = self.archetype.running_l
                     else:
                         self.direction = DIRECTION_R
-                        self.animation = self.running_r
+                        self.animation = self.archetype.running_r
                     self.add_x(-self.direction)
                 else:
-                    self.patrol()
+                    self.patrol(delta_ms)
 
     
     def respawn(self) -> None:
@@ -171,6 +231,7 @@ class Enemy:
         self.rect_collision_feet.y = self.rect.y+52
         self.is_falling = True
         self.was_hit = False
+        self.update_grid()
             
         
     def collided_player(self, player, delta_ms:int) -> None:
@@ -185,9 +246,9 @@ class Enemy:
         if player and isinstance(delta_ms, int) and delta_ms:
             if player.rect_collision_feet.colliderect(self.rect_collision_head) and not self.was_hit and not player.falling:
                 self.was_hit = True
-                self.sound_death.play()
+                self.archetype.sound_death.play()
             if self.was_hit:
-                self.add_y(self.gravity)
+                self.add_y(self.archetype.gravity)
                 self.move_x = 0
                 if self.rect.bottom >= HEIGHT:
                     self.elapsed_time_of_death += delta_ms
@@ -206,24 +267,23 @@ class Enemy:
         """
         if isinstance(platform_list, list) and platform_list:
             if self.is_falling:
-                self.add_y(self.gravity)
-                self.animation = self.still_l
+                self.add_y(self.archetype.gravity)
+                self.animation = self.archetype.still_l
                 self.move_x = 0
-            for platform in platform_list:
+            self.is_falling = True
+            for platform in SpatialGrid.nearby(platform_list, self.rect_collision_feet):
                 if self.rect_collision_feet.colliderect(platform.rect):
                     self.is_falling = False
                     break
-                else:
-                    self.is_falling = True
-                        
-                if self.rect.bottom >= GROUND+69 :
-                    self.is_falling = False
+
+            if self.rect.bottom >= GROUND+69 :
+                self.is_falling = False
 
             
     def do_movement(self, delta_ms:int, player) -> None:
         """
-        Método que se encarga de los movimientos. Se encarga de establecer en 0 el frame cada vez que el tiempo sea mayor al
-        al atributo self.frame_rate.
+        Método que se encarga de los movimientos. El enemigo se mueve una vez cada "move_rate" milisegundos y el tiempo
+        sobrante se conserva para el siguiente paso, así la velocidad no depende de los fotogramas por segundo.
 
         Args:
             delta_ms (int): Variable que hace referencia al tiempo transcurrido desde que se actualizo la pantalla.
@@ -232,23 +292,23 @@ class Enemy:
         if isinstance(delta_ms, int) and delta_ms and player:
             self.movement_elapsed_time += delta_ms
 
-            if self.movement_elapsed_time >= self.move_rate:
-                self.movement_elapsed_time = 0
+            while self.movement_elapsed_time >= self.archetype.move_rate:
+                self.movement_elapsed_time -= self.archetype.move_rate
 
-                self.attack(player)
+                self.attack(player, self.archetype.move_rate)
 
     
     def do_animation(self, delta_ms:int) -> None:
         """
         Método que se encarga las animaciones. Se encarga de establecer en 0 el frame cada vez que el tiempo sea mayor al
-        al atributo self.frame_rate.
+        al atributo self.archetype.frame_rate.
 
         Args:
             delta_ms (int): Variable que hace referencia al tiempo transcurrido desde que se actualizo la pantalla.
         """
         if isinstance(delta_ms, int) and delta_ms:
             self.animation_elapsed_time += delta_ms
-            if self.animation_elapsed_time >= self.frame_rate:
+            if self.animation_elapsed_time >= self.archetype.frame_rate:
                 self.animation_elapsed_time = 0
                 self.frame = abs(self.frame + 1) % len(self.animation)
 
@@ -265,6 +325,7 @@ class Enemy:
             self.rect_collision_head.x += delta_x
             self.rect_collision_body.x += delta_x
             self.rect_collision_feet.x += delta_x
+            self.update_grid()
 
     
     def add_y(self, delta_y:int) -> None:
@@ -279,6 +340,15 @@ class Enemy:
             self.rect_collision_head.y += delta_y
             self.rect_collision_body.y += delta_y
             self.rect_collision_feet.y += delta_y
+            self.update_grid()
+
+
+    def update_grid(self) -> None:
+        """
+        Método que avisa a la grilla de enemigos del nivel (si el enemigo pertenece a una) que el enemigo se movió.
+        """
+        if self.grid is not None:
+            self.grid.move(self)
 
     
     def update(self, delta_ms:int, platform_list:list, player) -> None:
@@ -291,26 +361,34 @@ class Enemy:
             player (Player): Es una instancia de la clase Player.
         """
         if isinstance(delta_ms, int) and delta_ms and isinstance(platform_list, list) and platform_list and  player:
+            self.prev_x = self.rect.x
+            self.prev_y = self.rect.y
+
             self.do_movement(delta_ms, player)
             self.do_animation(delta_ms)
             self.collided_player(player, delta_ms)
             self.collided_platform(platform_list)
 
             
-    def draw(self, window:pygame.Surface) -> None:
+    def draw(self, window:pygame.Surface, alpha:float=1) -> pygame.Rect | None:
         """
         Método que se encarga de dibujar al enemigo en la ventana.
 
         Args:
             window (pygame.Surface): Es la ventana principal del juego.
+            alpha (float, optional): Fracción del paso de simulación transcurrida desde el último update, se usa para
+            interpolar la posición entre el paso anterior y el actual. Defaults to 1.
+
+        Returns:
+            pygame.Rect | None: Zona de la ventana donde se dibujó, None si la ventana no es válida.
         """
         if isinstance(window, pygame.Surface) and window:
             if self.frame >= len(self.animation):
                 self.frame = 0
-            self.image = self.animation[self.frame]
-            
+            position = (self.prev_x + (self.rect.x - self.prev_x) * alpha, self.prev_y + (self.rect.y - self.prev_y) * alpha)
+
             if self.was_hit:
-                window.blit(self.rotate_image, self.rect)
+                return window.blit(self.animation.rotated[self.frame], position)
             else:
-                window.blit(self.image, self.rect)
+                return window.blit(self.animation[self.frame], position)
                 
@@ -0,0 +1,183 @@
+import pygame
+
+from config import *
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class EntityStore:
+    """
+    Clase que guarda en arrays de NumPy (un array por atributo) el estado de animación de muchas entidades del mismo
+    tipo que no se mueven, como las trampas y las frutas: posición, tiempo acumulado, fotograma y animación actual.
+    Así "update" avanza los fotogramas de todas con unas pocas operaciones vectorizadas en lugar de llamar a
+    "do_animation" de cada una, y "draw" las dibuja con un solo "blits" leyendo de los arrays. También guarda el
+    centro y el radio de cada entidad para probar colisiones de círculo contra todas a la vez con "collide".
+
+    Mientras el EntityStore está activo es el dueño del fotograma y del tiempo de animación; "sync" los vuelve a
+    copiar en las entidades.
+    """
+    def __init__(self, entities:list, state:str=None) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            entities (list): Lista de entidades del nivel. Se guarda la referencia, si la lista cambia el EntityStore
+            se vuelve a armar solo.
+            state (str, optional): Nombre del atributo booleano que hace que la entidad pase a su segunda animación,
+            por ejemplo "collected" en las frutas. Defaults to None.
+        """
+        self.entities = entities
+        self.state = state
+        self.load()
+
+
+    @staticmethod
+    def create(entities:list, state:str=None, minimum:int=ENTITY_STORE_MIN) -> "EntityStore | None":
+        """
+        Método estático que arma un EntityStore solo si vale la pena: NumPy tiene que estar instalado y la lista tener
+        al menos "minimum" entidades.
+
+        Args:
+            entities (list): Lista de entidades del nivel.
+            state (str, optional): Ver el constructor. Defaults to None.
+            minimum (int, optional): Cantidad mínima de entidades. Defaults to ENTITY_STORE_MIN.
+
+        Returns:
+            EntityStore | None: El EntityStore, o None si las entidades se tienen que actualizar de a una.
+        """
+        if numpy is None or not isinstance(entities, list) or len(entities) < minimum:
+            return None
+        return EntityStore(entities, state)
+
+
+    def load(self) -> None:
+        """
+        Método que copia a los arrays el estado de todas las entidades de la lista.
+        """
+        self.loaded = list(self.entities)
+        count = len(self.loaded)
+
+        self.animations = [entity.animations for entity in self.loaded]
+        self.x = numpy.fromiter((entity.rect.x for entity in self.loaded), numpy.int32, count)
+        self.y = numpy.fromiter((entity.rect.y for entity in self.loaded), numpy.int32, count)
+        self.elapsed = numpy.fromiter((entity.animation_elapsed_time for entity in self.loaded), numpy.int32, count)
+        self.frame = numpy.fromiter((entity.frame for entity in self.loaded), numpy.int32, count)
+        self.frame_rate = numpy.fromiter((entity.archetype.frame_rate for entity in self.loaded), numpy.int32, count)
+        self.center_x = numpy.fromiter((entity.rect.centerx for entity in self.loaded), numpy.int64, count)
+        self.center_y = numpy.fromiter((entity.rect.centery for entity in self.loaded), numpy.int64, count)
+        self.radius = numpy.fromiter((getattr(entity, "radius", 0) for entity in self.loaded), numpy.int64, count)
+        self.lengths = numpy.zeros((count, 2), numpy.int32)
+        self.variant = numpy.zeros(count, numpy.int32)
+        self.active = numpy.zeros(count, bool)
+
+        for index, animations in enumerate(self.animations):
+            self.lengths[index, :] = [len(animation) for animation in animations]
+            if self.state is not None:
+                self.variant[index] = 1 if self.loaded[index].animation is animations[-1] else 0
+                self.active[index] = getattr(self.loaded[index], self.state)
+
+
+    def sync(self) -> None:
+        """
+        Método que copia el fotograma, el tiempo de animación y la animación actual de los arrays a las entidades.
+        """
+        for index, entity in enumerate(self.loaded):
+            entity.frame = int(self.frame[index])
+            entity.animation_elapsed_time = int(self.elapsed[index])
+            if self.state is not None:
+                entity.animation = self.animations[index][self.variant[index]]
+
+
+    def refresh(self) -> None:
+        """
+        Método que vuelve a armar los arrays si se agregaron o sacaron entidades de la lista, por ejemplo cuando el
+        Player termina de recolectar una fruta.
+        """
+        if len(self.loaded) != len(self.entities):
+            self.sync()
+            self.load()
+
+
+    def update(self, delta_ms:int) -> None:
+        """
+        Método que avanza las animaciones de todas las entidades, igual que "do_animation" de cada una.
+
+        Args:
+            delta_ms (int): Variable que hace referencia al tiempo transcurrido desde el paso anterior.
+        """
+        if isinstance(delta_ms, int) and delta_ms:
+            self.refresh()
+            if self.state is not None:
+                self.active = numpy.fromiter((getattr(entity, self.state) for entity in self.loaded), bool,
+                                             len(self.loaded))
+
+            self.elapsed += delta_ms
+            due = self.elapsed >= self.frame_rate
+            self.elapsed[due] = 0
+            length = self.lengths[numpy.arange(len(self.loaded)), self.variant]
+            self.frame[due] = (self.frame[due] + 1) % length[due]
+
+            if self.state is not None:
+                self.variant = self.active.astype(numpy.int32)
+
+
+    def draw(self, window:pygame.Surface) -> list:
+        """
+        Método que dibuja todas las entidades con un solo "blits".
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+
+        Returns:
+            list: Zonas de la ventana donde se dibujó cada entidad.
+        """
+        if not isinstance(window, pygame.Surface) or not self.loaded:
+            return []
+
+        self.refresh()
+        frame = self.frame
+        if self.state is not None:
+            length = self.lengths[numpy.arange(len(self.loaded)), self.variant]
+            frame = numpy.where(self.active, numpy.minimum(frame, length - 1), frame)
+
+        blits = [(self.animations[index][variant][frame], (x, y)) for index, (variant, frame, x, y) in
+                 enumerate(zip(self.variant.tolist(), frame.tolist(), self.x.tolist(), self.y.tolist()))]
+        return window.blits(blits)
+
+
+    def collide_many(self, centers, radii) -> "numpy.ndarray":
+        """
+        Método que prueba varios círculos contra todas las entidades a la vez, comparando distancias al cuadrado.
+
+        Args:
+            centers (array_like): Centros (x, y) de los círculos a probar, uno por fila.
+            radii (array_like): Radio de cada círculo, o un solo radio para todos.
+
+        Returns:
+            numpy.ndarray: Matriz booleana con una fila por círculo y una columna por entidad, True donde se tocan.
+        """
+        self.refresh()
+        centers = numpy.asarray(centers, numpy.int64).reshape(-1, 2)
+        radii = numpy.broadcast_to(numpy.asarray(radii, numpy.int64), (len(centers),))
+
+        delta_x = self.center_x[numpy.newaxis, :] - centers[:, 0:1]
+        delta_y = self.center_y[numpy.newaxis, :] - centers[:, 1:2]
+        reach = self.radius[numpy.newaxis, :] + radii[:, numpy.newaxis]
+
+        return delta_x * delta_x + delta_y * delta_y < reach * reach
+
+
+    def collide(self, center:tuple, radius:int) -> "numpy.ndarray":
+        """
+        Método que prueba un círculo contra todas las entidades a la vez.
+
+        Args:
+            center (tuple): Centro (x, y) del círculo.
+            radius (int): Radio del círculo.
+
+        Returns:
+            numpy.ndarray: Índices (en "loaded") de las entidades que toca el círculo.
+        """
+        return numpy.flatnonzero(self.collide_many([center], radius)[0])
@@ -1,17 +1,20 @@
-import pygame, sys
-import json, os
+import pygame
+import os
 
 from config import *
 from button import *
-from player import Player
-from platforms import Platform
-from collectibles import Collectible
-from enemy import Enemy
-from traps import Traps
+from level import Level
+from preloader import Preloader
+from snapshot import LevelSnapshot
+from ranking import RankingStore
+from sound_bank import SoundBank
+from scene import SceneManager
+from scenes import MainScene
 
 class Game:
     """
-    Clase principal del juego, donde se manejan los eventos y los cambios de pantallas.
+    Clase principal del juego, guarda el estado compartido entre pantallas. Los cambios de pantalla los maneja el
+    SceneManager.
     """
     def __init__(self) -> None:
         """
@@ -28,14 +31,17 @@ class Game:
         self.font = pygame.font.Font(FONT_BREAKING, 46)
         self.font_pause = pygame.font.Font(FONT_BREAKING, 150)
         self.start_time = None
-        self.score_level_1 = 0
-        self.score_level_2 = 0
-        self.score_level_3 = 0
-        self.score_total = self.score_level_1 + self.score_level_2 + self.score_level_3
+        self.levels = Level.discover()
+        self.scores = []
         self.color_active = WHITE 
         self.color_passive = GREY
         self.active = False
         self.elapsed_time = None
+        self.preloader = Preloader()
+        self.checkpoints = {}
+        self.ranking = RankingStore()
+        SoundBank.preload(SOUND_EFFECTS)
+        self.scenes = SceneManager(self.clock)
                 
         self.main_screen_buttons = [
             Button((400, 400), PATH_IMAGE + "Botones/boton_play.jpg", PATH_IMAGE + "Botones/boton_play_hover.jpg", (350,100)),
@@ -45,6 +51,9 @@ class Game:
         self.controls_screen_buttons = [
             Button((420, 700), PATH_IMAGE + "Botones/boton_back.jpg", PATH_IMAGE + "Botones/boton_back_hover.jpg", (350,100))
         ]
+        self.leaderboard_buttons = [
+            Button((925, 710), PATH_IMAGE + "Botones/boton_back.jpg", PATH_IMAGE + "Botones/boton_back_hover.jpg", (250,72))
+        ]
         self.pause_screen_buttons = [
             Button((10,10),PATH_IMAGE+"Botones/Play.png",PATH_IMAGE+"Botones/Play.png",(80,80)),
             Button((10,110),PATH_IMAGE+"Botones/Volume.png",PATH_IMAGE+"Botones/Volume.png",(80,80)),
@@ -61,498 +70,102 @@ class Game:
         ]
 
 
-    def main_screen(self) -> None:
+    def run(self) -> None:
         """
-        Pantalla principal que se muestra al ejecutar el juego, con botones de "Play", "Controls" y "Exit".
+        Método que arranca el juego desde la pantalla principal y corre el bucle hasta que se cierra la ventana.
         """
-        background = pygame.image.load(PATH_IMAGE + "Fondos/fondo_principal.jpg").convert()
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-
-        pygame.mixer.music.load(PATH_SOUND+"Sound_menu.ogg")
-        pygame.mixer.music.set_volume(0.1)
-        pygame.mixer.music.play(-1)
-
-        while True:
+        self.scenes.run(MainScene(self), self.window)
+        self.ranking.close()
+        pygame.quit()
 
-            self.clock.tick(FPS)
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    for button in self.main_screen_buttons:
-                        if button.rect.collidepoint(event.pos):
-                            if button == self.main_screen_buttons[0]:
-                                self.level_one_screen()
-                            if button == self.main_screen_buttons[1]:
-                                self.screen_controls()
-                            if button == self.main_screen_buttons[2]:
-                                pygame.quit()
-                                sys.exit()
-
-            self.render(self.main_screen_buttons, background)
-    
-    
-    def screen_controls(self) -> None:
+    @property
+    def score_total(self) -> int:
         """
-        Pantalla donde se muestran los controles a usar en el juego se accede a ella mediante los botones que tiene la
-        pantalla principal. 
+        Score acumulado de todos los niveles jugados en la partida actual.
         """
-        background = pygame.image.load(PATH_IMAGE + "Fondos/fondo_controlss.jpg").convert()
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-
-        while True:
-
-            self.clock.tick(FPS)
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    for button in self.controls_screen_buttons:
-                        if button.rect.collidepoint(event.pos):
-                            if button == self.controls_screen_buttons[0]:
-                                self.main_screen()
-
-            self.render(self.controls_screen_buttons, background)
-
-
-    def level_one_screen(self) -> None:
-        """
-        Pantalla del nivel 1 se instancias todos los objetos que intervendrán en el juego, se muestra el tiempo desde
-        que se empezó el nivel la cantidad de vidas, y el score.
-        """
-        background = pygame.image.load(PATH_IMAGE + "Fondos/fondo_nivel_1.jpg").convert()
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-
-        pygame.mixer.music.load(PATH_SOUND+"nivel_1.ogg")
-        pygame.mixer.music.set_volume(0.1)
-        pygame.mixer.music.play(-1)
-
-        list_player = Player.create_player_json("src/Files Json/nivel_1.json")
-        list_platforms = Platform.create_platform_json("src/Files Json/nivel_1.json")
-        list_collectibles = Collectible.create_collectible_json("src/Files Json/nivel_1.json")
-        list_enemy = Enemy.create_enemy_json("src/Files Json/nivel_1.json")
-        list_tramps = Traps.create_traps_json("src/Files Json/nivel_1.json")
-        
-        self.start_time = pygame.time.get_ticks()
-
-        while True:
-            
-            delta_ms = self.clock.tick(FPS)
-            self.window.blit(background, background.get_rect())
-    
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.pause_screen()
-                        self.start_time += pygame.time.get_ticks() - self.pause_start
-            
-            keys = pygame.key.get_pressed()
-
-            self.elapsed_time = (pygame.time.get_ticks() - self.start_time) // 1000
-            minutes = self.elapsed_time // 60
-            seconds = self.elapsed_time % 60
-            text_surface = self.font.render(f"Tiempo: {minutes:02d}:{seconds:02d}", True, BLUE)
-            text_rect = text_surface.get_rect(topleft=(10, 5))
-            self.window.blit(text_surface, text_rect)
-
-            for tramp in list_tramps:
-                tramp.update(delta_ms)
-                tramp.draw(self.window)
-
-            for platform in list_platforms:
-                platform.draw(self.window)
-
-            for rewards in list_collectibles:
-                rewards.update(delta_ms)
-                rewards.draw(self.window)
-            
-            for enemy in list_enemy:
-                enemy.update(delta_ms, list_platforms, list_player[0])            
-                enemy.draw(self.window)
-               
-            for player in list_player:
-                player.update(delta_ms, list_platforms, list_collectibles, list_enemy, list_tramps, keys)
-                player.draw(self.window)
-                player.draw_lives(self.window)
+        return sum(self.scores)
 
-                self.score_level_1 = player.score
-                
-                if player.lives == 0 and player.rect.y > HEIGHT:
-                    self.game_over_screen()
-
-            score_text = f"Score: {self.score_level_1}"
-            render_text = self.font.render(score_text, True, BLUE)
-            self.window.blit(render_text, (1000, 5))
-            
-            if len(list_collectibles) == 0:
-                self.level_two_screen()
 
-            pygame.display.update()   
-        
-        
-    def level_two_screen(self) -> None:
+    def preload_level(self, index:int) -> None:
         """
-        Pantalla del nivel 2 se instancias todos los objetos que intervendrán en el juego, se muestra el tiempo desde
-        que se empezó el nivel la cantidad de vidas, y el score.
-        """
-        background = pygame.image.load(PATH_IMAGE + "Fondos/fondo_level_2.jpg").convert()
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-
-        pygame.mixer.music.load(PATH_SOUND+"nivel_2.mp3")
-        pygame.mixer.music.set_volume(0.1)
-        pygame.mixer.music.play(-1)
-
-        list_player = Player.create_player_json("src/Files Json/nivel_2.json")
-        list_platforms = Platform.create_platform_json("src/Files Json/nivel_2.json")
-        list_collectibles = Collectible.create_collectible_json("src/Files Json/nivel_2.json")
-        list_enemy = Enemy.create_enemy_json("src/Files Json/nivel_2.json")
-        list_tramps = Traps.create_traps_json("src/Files Json/nivel_2.json")
-
-        while True:
-
-            delta_ms = self.clock.tick(FPS)
-            self.window.blit(background, background.get_rect())
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.pause_screen()
-                        self.start_time += pygame.time.get_ticks() - self.pause_start
-            
-            keys = pygame.key.get_pressed()
-
-            self.elapsed_time = (pygame.time.get_ticks() - self.start_time) // 1000
-            minutes = self.elapsed_time // 60
-            seconds = self.elapsed_time % 60
-            text_surface = self.font.render(f"Tiempo: {minutes:02d}:{seconds:02d}", True, BLUE)
-            text_rect = text_surface.get_rect(topleft=(10, 5))
-            self.window.blit(text_surface, text_rect)
-
-            for tramp in list_tramps:
-                tramp.update(delta_ms)
-                tramp.draw(self.window)
+        Método que le pide al Preloader que vaya preparando un nivel, si existe y no tiene ya un punto de control.
 
-            for platform in list_platforms:
-                platform.draw(self.window)
-
-            for rewards in list_collectibles:
-                rewards.update(delta_ms)
-                rewards.draw(self.window)
-            
-            for enemy in list_enemy:
-                enemy.update(delta_ms, list_platforms, list_player[0])            
-                enemy.draw(self.window)
-            
-            for player in list_player:
-                player.update(delta_ms, list_platforms, list_collectibles, list_enemy, list_tramps, keys)
-                player.draw(self.window)
-                player.draw_lives(self.window)
-
-                self.score_level_2 = player.score
-                
-                if player.lives == 0 and player.rect.y > HEIGHT:
-                    self.game_over_screen()
-
-            score_text = f"Score: {self.score_level_1+self.score_level_2}"
-            render_text = self.font.render(score_text, True, BLUE)
-            self.window.blit(render_text, (1000, 5))
-            
-            if len(list_collectibles) == 0:
-                self.level_three_screen()
-
-            pygame.display.update() 
-
-
-    def level_three_screen(self) -> None:
-        """
-        Pantalla del nivel 3 se instancias todos los objetos que intervendrán en el juego, se muestra el tiempo desde
-        que se empezó el nivel la cantidad de vidas, y el score.
+        Args:
+            index (int): Posición del nivel en la lista "levels".
         """
-        background = pygame.image.load(PATH_IMAGE + "Fondos/fondo_level_3.jpg").convert()
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-
-        pygame.mixer.music.load(PATH_SOUND+"sound_level_3.ogg")
-        pygame.mixer.music.set_volume(0.1)
-        pygame.mixer.music.play(-1)
-
-        list_player = Player.create_player_json("src/Files Json/nivel_3.json")
-        list_platforms = Platform.create_platform_json("src/Files Json/nivel_3.json")
-        list_collectibles = Collectible.create_collectible_json("src/Files Json/nivel_3.json")
-        list_enemy = Enemy.create_enemy_json("src/Files Json/nivel_3.json")
-        list_tramps = Traps.create_traps_json("src/Files Json/nivel_3.json")
-        
-        while True:
+        if isinstance(index, int) and 0 <= index < len(self.levels):
+            descriptor = self.levels[index]
+            if descriptor["json_file"] in self.checkpoints:
+                return
+            self.preloader.request(descriptor["json_file"], descriptor["background"], descriptor["music"])
 
-            delta_ms = self.clock.tick(FPS)
-            self.window.blit(background, background.get_rect())
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.pause_screen()
-                        self.start_time += pygame.time.get_ticks() - self.pause_start
-            
-            keys = pygame.key.get_pressed()
-
-            self.elapsed_time = (pygame.time.get_ticks() - self.start_time) // 1000
-            minutes = self.elapsed_time // 60
-            seconds = self.elapsed_time % 60
-            text_surface = self.font.render(f"Tiempo: {minutes:02d}:{seconds:02d}", True, BLUE)
-            text_rect = text_surface.get_rect(topleft=(10, 5))
-            self.window.blit(text_surface, text_rect)
-
-            for tramp in list_tramps:
-                tramp.update(delta_ms)
-                tramp.draw(self.window)
-
-            for platform in list_platforms:
-                platform.draw(self.window)
-
-            for rewards in list_collectibles:
-                rewards.update(delta_ms)
-                rewards.draw(self.window)
-            
-            for enemy in list_enemy:
-                enemy.update(delta_ms, list_platforms, list_player[0])            
-                enemy.draw(self.window)
-               
-            for player in list_player:
-                player.update(delta_ms, list_platforms, list_collectibles, list_enemy, list_tramps, keys)
-                player.draw(self.window)
-                player.draw_lives(self.window)
 
-                self.score_level_3 = player.score
-                
-                if player.lives == 0:
-                    self.game_over_screen()
-
-            score_text = f"Score: {self.score_level_3+self.score_level_2+self.score_level_1}"
-            render_text = self.font.render(score_text, True, BLUE)
-            self.window.blit(render_text, (1000, 5))
-            
-            if len(list_collectibles) == 0: 
-                self.winner_screen()
-
-            self.score_total = self.score_level_1 + self.score_level_2 + self.score_level_3
-            
-            pygame.display.update()   
-        
-        
-    def pause_screen(self) -> None:
+    def drop_checkpoints(self) -> None:
         """
-        Pantalla de pausa, se accede presionando la tecla "esc", tiene botones para volver al menu principal, para silenciar
-        la música de fondo del nivel, para volver activar el sonido y para reanudar el juego.
+        Método que libera el punto de control (nivel, fondo y snapshot) guardado para reintentar el nivel actual.
+        Se llama al superar el nivel y al volver al menu principal.
         """
-        background = pygame.image.load(PATH_IMAGE + "Fondos/window_pause.png")
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-
-        text_surface = self.font_pause.render("Pause", True, (BLACK))
-
-        self.pause_start = pygame.time.get_ticks()
-        paused = True
-        
-        while paused:
-
-            self.clock.tick(FPS)
+        self.checkpoints.clear()
 
-            text_rect = text_surface.get_rect(center=(WIDTH // 2, HEIGHT // 7))
-            self.window.blit(text_surface, text_rect)
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
 
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        paused = False
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    for button in self.pause_screen_buttons:
-                        if button.rect.collidepoint(event.pos):
-                            if button == self.pause_screen_buttons[0]:
-                                paused = False
-                            if button == self.pause_screen_buttons[1]:
-                                pygame.mixer.music.play()
-                            if button == self.pause_screen_buttons[2]:
-                                pygame.mixer.music.stop()
-                            if button == self.pause_screen_buttons[3]:
-                                self.main_screen()
-
-            self.render(self.pause_screen_buttons, background)
-
-
-    def game_over_screen(self) -> None:
-        """
-        Pantalla que se muestra si el player perdió sus 3 vidas.
+    def load_level(self, descriptor:dict) -> tuple:
         """
-        background = pygame.image.load(PATH_IMAGE + "Fondos/fondo_game_over.jpg").convert()
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+        Método que prepara un nivel para jugarlo. Si es el mismo nivel que se estaba jugando (un reintento) se
+        reutiliza restaurando el snapshot que se tomó al cargarlo, sin leer el disco ni construir entidades; si no, se
+        usa el del Preloader o se carga en el momento y su punto de control reemplaza al anterior. También arranca la
+        música del nivel.
 
-        pygame.mixer.music.load(PATH_SOUND+"sound_game_over.mp3")
-        pygame.mixer.music.set_volume(0.1)
+        Args:
+            descriptor (dict): Descripción del nivel devuelta por "Level.discover".
+
+        Returns:
+            tuple: Tupla (level, background) con el nivel construido y el fondo ya escalado.
+        """
+        checkpoint = self.checkpoints.get(descriptor["json_file"])
+        preloaded = None
+        if checkpoint is None or LevelSnapshot.restore(checkpoint[0], checkpoint[2]) is None:
+            checkpoint = None
+            preloaded = self.preloader.take(descriptor["json_file"])
+
+        if checkpoint is not None:
+            level, background, _ = checkpoint
+            music = None
+        elif preloaded:
+            level, background, music = preloaded
+        else:
+            level = Level(descriptor["json_file"])
+            background = pygame.image.load(descriptor["background"]).convert()
+            background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+            music = None
+
+        if checkpoint is None:
+            self.checkpoints.clear()
+            self.checkpoints[descriptor["json_file"]] = (level, background, LevelSnapshot.capture(level))
+
+        if music is not None:
+            pygame.mixer.music.load(music, os.path.splitext(descriptor["music"])[1][1:])
+        else:
+            pygame.mixer.music.load(descriptor["music"])
+        pygame.mixer.music.set_volume(descriptor["music_volume"])
         pygame.mixer.music.play(-1)
 
-        while True:
-            self.clock.tick(FPS)
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    for button in self.screen_game_over_buttons:
-                        if button.rect.collidepoint(event.pos):
-                            if button == self.screen_game_over_buttons[0]:
-                                self.level_one_screen()
-                            if button == self.screen_game_over_buttons[1]:
-                                self.main_screen()
-                            
-            self.render(self.screen_game_over_buttons, background)
-
-
-    def winner_screen(self) -> None:
-        """
-        Pantalla que se muestra luego de ganar los 3 niveles y pide el nombre del usuario par aguardarlo junto
-        con el tiempo que tardo en terminar el juego y los puntos que hizo durante todo el juego.
-        """
-        background = pygame.image.load(PATH_IMAGE + "Fondos/fondo_winner.jpg").convert()
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-
-        pygame.mixer.music.load(PATH_SOUND+"winner.mp3")
-        pygame.mixer.music.set_volume(0.5)
-        pygame.mixer.music.play()
-
-        username = ""
-        input_rect = pygame.Rect(400, 570, 400, 50)
-        
-        color = self.color_passive
-
-        while True:
-
-            self.clock.tick(FPS)
-            self.window.blit(background, background.get_rect())
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    if input_rect.collidepoint(event.pos):
-                        self.active = True
-                    else:
-                        self.active = False
+        return level, background
 
-                if event.type == pygame.KEYDOWN:
-                    if self.active:
-                        if event.key == pygame.K_BACKSPACE:
-                            username = username[:-1]
-                        else:
-                            username += event.unicode
-                    if event.key == pygame.K_RETURN:
-                        self.upload_json(username, self.elapsed_time, self.score_total)
-                        self.play_again()
-
-            if self.active:
-                color = self.color_active
-            else:
-                color = self.color_passive
-
-            pygame.draw.rect(self.window, color, input_rect, 2)
-
-            text_surface = self.font.render(username, True, WHITE)
-            self.window.blit(text_surface, (input_rect.x + 5, input_rect.y-2))
-
-            input_rect.w = max(400, text_surface.get_width()+9)
-
-            pygame.display.update()
-
-    
-    def play_again(self) -> None:
-        """
-        Pantalla que se muestra luego de ingresar el nombre del usuario. Tiene botones para reiniciar el juego y para 
-        volver al menu principal.
-        """
-        background = pygame.image.load(PATH_IMAGE + "Fondos/fondo.jpg").convert()
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-
-        while True:
-            self.clock.tick(FPS)
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    for button in self.play_again_buttons:
-                        if button.rect.collidepoint(event.pos):
-                            if button == self.play_again_buttons[0]:
-                                self.level_one_screen()
-                            if button == self.play_again_buttons[1]:
-                                self.main_screen()
-                            
-            self.render(self.play_again_buttons, background)
-            
 
     def upload_json(self, username: str, game_time: int, score: int) -> None:
         """
-        Función para subir la información del ranking a un json, crea una lista de diccionarios con los datos, verifica si existe
-        el archivo json, si no existe crea una lista vacía y agrega los datos a la lista, luego los ordena primero por
-        score de forma descendente y luego por tiempo de forma ascendente y reescribe el archivo json con los datos
-        ordenados.
+        Función para subir la información de una partida ganada al ranking. Se agrega una fila a la base del
+        RankingStore, que la ubica en su índice ordenado por score y tiempo.
 
         Args:
             username (str): Nombre que ingresa el usuario.
-            game_time (str): Tiempo que tardó el usuario en completar el nivel.
+            game_time (int): Segundos que tardó el usuario en completar el juego.
             score (int): Puntos totales que hizo el usuario durante el juego.
         """
         if(isinstance(username, str) and username and isinstance(game_time, int) and game_time 
            and isinstance(score, int) and score):
-            username = username.strip()
-
-            minutes = int(game_time) // 60
-            seconds = int(game_time) % 60
-            game_time_str = f"{minutes:02d}:{seconds:02d}"
-
-            data = {
-                "Username": username,
-                "Game_time": game_time_str,
-                "Score": score
-            }
-
-            if os.path.exists("ranking.json"):
-                with open("ranking.json", "r") as file:
-                    ranking = json.load(file)
-            else:
-                ranking = []
-
-            ranking.append(data)
-
-            ranking = sorted(ranking, key=lambda x: (-x["Score"], x["Game_time"]))
-
-            with open("ranking.json", "w", encoding="utf-8") as file:
-                json.dump(ranking, file, indent=2, ensure_ascii=False)
+            self.ranking.insert(username.strip(), game_time, score)
 
 
     def render(self, buttons:list, background:pygame.Surface) -> None:
@@ -568,6 +181,4 @@ class Game:
 
             for button in buttons:
                 button.draw(self.window)
-                button.update()
-
-            pygame.display.update()
\ No newline at end of file
+                button.update()
\ No newline at end of file
@@ -0,0 +1,192 @@
+import os
+import time
+import argparse
+import pygame
+
+from config import *
+from level import Level
+from profiler import Profiler
+from snapshot import LevelSnapshot
+
+INPUT_SCANCODES = {
+    pygame.K_UP: pygame.KSCAN_UP,
+    pygame.K_LEFT: pygame.KSCAN_LEFT,
+    pygame.K_RIGHT: pygame.KSCAN_RIGHT,
+    pygame.K_SPACE: pygame.KSCAN_SPACE,
+    pygame.K_ESCAPE: pygame.KSCAN_ESCAPE
+}
+
+class HeadlessSimulation:
+    """
+    Clase que corre un nivel sin ventana ni audio (drivers "dummy" de SDL) avanzando la simulación con un paso de tiempo
+    fijo. Sirve para probar niveles con bots o hacer barridos de balance mucho más rápido que en tiempo real.
+    """
+    def __init__(self, json_file:str=PATH_JSON+"nivel_1.json", dt_ms:int=FIXED_STEP_MS) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            json_file (str, optional): Archivo json del nivel a simular. Defaults to PATH_JSON+"nivel_1.json".
+            dt_ms (int, optional): Milisegundos que avanza cada paso. Defaults to FIXED_STEP_MS.
+        """
+        HeadlessSimulation.init_display()
+        self.dt_ms = dt_ms
+        self.level = Level(json_file)
+        self.frame = 0
+        self.elapsed_ms = 0
+
+
+    @staticmethod
+    def init_display() -> None:
+        """
+        Método estático que inicializa pygame con los drivers "dummy" de video y audio. Hace falta una ventana (aunque
+        no se muestre) para poder convertir las imágenes.
+        """
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+        pygame.init()
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((WIDTH, HEIGHT))
+
+
+    @staticmethod
+    def make_keys(inputs) -> pygame.key.ScancodeWrapper:
+        """
+        Método estático que arma el mismo objeto que devuelve "pygame.key.get_pressed" a partir de una lista de teclas.
+
+        Args:
+            inputs (iterable): Teclas presionadas, por ejemplo {pygame.K_RIGHT, pygame.K_SPACE}.
+
+        Returns:
+            pygame.key.ScancodeWrapper: Estado del teclado con esas teclas presionadas.
+        """
+        pressed = [False] * 512
+        for key in inputs:
+            pressed[INPUT_SCANCODES[key]] = True
+        return pygame.key.ScancodeWrapper(pressed)
+
+
+    def step(self, inputs=()) -> str:
+        """
+        Método que avanza un paso fijo de la simulación con las teclas indicadas.
+
+        Args:
+            inputs (iterable | pygame.key.ScancodeWrapper, optional): Teclas presionadas en este paso. Defaults to ().
+
+        Returns:
+            str: Estado del nivel luego del paso, "playing", "lost" o "cleared".
+        """
+        if isinstance(inputs, pygame.key.ScancodeWrapper):
+            keys = inputs
+        else:
+            keys = HeadlessSimulation.make_keys(inputs)
+
+        Profiler.begin_frame()
+        self.level.update(self.dt_ms, keys)
+        Profiler.end_frame()
+        self.frame += 1
+        self.elapsed_ms += self.dt_ms
+
+        return self.status()
+
+
+    def checkpoint(self) -> bytes:
+        """
+        Método que toma un snapshot del nivel junto con el tiempo simulado y el estado del azar.
+
+        Returns:
+            bytes: Snapshot para pasarle a "rewind".
+        """
+        return LevelSnapshot.capture(self.level, self.elapsed_ms, True)
+
+
+    def rewind(self, snapshot:bytes) -> bool:
+        """
+        Método que vuelve la simulación (nivel, reloj y azar) al momento en que se tomó el snapshot.
+
+        Args:
+            snapshot (bytes): Snapshot devuelto por "checkpoint".
+
+        Returns:
+            bool: True si se pudo restaurar.
+        """
+        clock = LevelSnapshot.restore(self.level, snapshot)
+        if clock is None:
+            return False
+        self.elapsed_ms = clock
+        self.frame = clock // self.dt_ms
+        return True
+
+
+    def status(self) -> str:
+        """
+        Método que indica el estado del nivel.
+
+        Returns:
+            str: "lost" si el Player perdió, "cleared" si recolectó todo, "playing" de lo contrario.
+        """
+        if self.level.is_lost():
+            return "lost"
+        if self.level.is_cleared():
+            return "cleared"
+        return "playing"
+
+
+    def run(self, frames:int, inputs=()) -> dict:
+        """
+        Método que avanza varios pasos con las mismas teclas, o hasta que el nivel termine.
+
+        Args:
+            frames (int): Cantidad máxima de pasos.
+            inputs (iterable, optional): Teclas presionadas en todos los pasos. Defaults to ().
+
+        Returns:
+            dict: Estado final de la simulación, ver "state".
+        """
+        keys = HeadlessSimulation.make_keys(inputs)
+        for _ in range(frames):
+            if self.step(keys) != "playing":
+                break
+        return self.state()
+
+
+    def state(self) -> dict:
+        """
+        Método que resume el estado de la simulación.
+
+        Returns:
+            dict: Diccionario con el paso, el tiempo simulado, el score, las vidas, las frutas restantes y el estado.
+        """
+        player = self.level.players[0]
+        return {
+            "frame": self.frame,
+            "elapsed_ms": self.elapsed_ms,
+            "score": player.score,
+            "lives": player.lives,
+            "collectibles": len(self.level.collectibles),
+            "status": self.status()
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simula un nivel sin ventana y mide los pasos por segundo.")
+    parser.add_argument("json_file", nargs="?", default=PATH_JSON+"nivel_1.json")
+    parser.add_argument("--frames", type=int, default=10000)
+    parser.add_argument("--dt", type=int, default=FIXED_STEP_MS)
+    parser.add_argument("--profile", help="Ruta (.csv o .json) donde exportar la traza del Profiler.")
+    args = parser.parse_args()
+
+    if args.profile:
+        Profiler.toggle()
+    simulation = HeadlessSimulation(args.json_file, args.dt)
+    start = time.perf_counter()
+    result = simulation.run(args.frames, (pygame.K_RIGHT,))
+    seconds = time.perf_counter() - start
+
+    result["steps_per_second"] = round(simulation.frame / seconds)
+    print(result)
+
+    if args.profile:
+        Profiler.export(args.profile)
+        for name, stats in Profiler.report().items():
+            print(f"{name:<20} p50={stats['p50']:.3f} p95={stats['p95']:.3f} p99={stats['p99']:.3f}")
@@ -0,0 +1,253 @@
+import abc
+import pygame
+
+from config import *
+
+class GlyphAtlas:
+    """
+    Clase que renderiza una sola vez cada carácter de un conjunto (por defecto los dígitos y los dos puntos) con una
+    fuente y un color, así escribir un número es solo copiar glifos ya rasterizados.
+    """
+    def __init__(self, font:pygame.font.Font, color:tuple, characters:str="0123456789:") -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            font (pygame.font.Font): Fuente con la que se renderizan los glifos.
+            color (tuple): Color del texto.
+            characters (str, optional): Caracteres que incluye el atlas. Defaults to "0123456789:".
+        """
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self.glyphs = {}
+        for character in characters:
+            self.glyph(character)
+
+
+    def glyph(self, character:str) -> pygame.Surface:
+        """
+        Método que devuelve el glifo de un carácter, renderizándolo y agregándolo al atlas si todavía no estaba.
+
+        Args:
+            character (str): Carácter a buscar.
+
+        Returns:
+            pygame.Surface: Glifo con alpha premultiplicado.
+        """
+        glyph = self.glyphs.get(character)
+        if glyph is None:
+            glyph = self.font.render(character, True, self.color).convert_alpha().premul_alpha()
+            self.glyphs[character] = glyph
+        return glyph
+
+
+class HudElement(abc.ABC):
+    """
+    Clase base de los elementos del HUD. Cada elemento guarda la superficie ya compuesta de su último valor y solo la
+    vuelve a componer cuando el valor cambia; dibujarlo es un único blit.
+    """
+    def __init__(self, position:tuple) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            position (tuple): Esquina superior izquierda donde se dibuja el elemento.
+        """
+        self.position = position
+        self.value = None
+        self.surface = None
+        self.renders = 0
+
+
+    @staticmethod
+    def compose(size:tuple, parts:list) -> pygame.Surface:
+        """
+        Método estático que junta varias superficies con alpha premultiplicado en una sola, respetando la
+        transparencia de los bordes aunque las partes se superpongan.
+
+        Args:
+            size (tuple): Ancho y alto de la superficie final.
+            parts (list): Lista de tuplas (superficie, posición) en el orden en que se dibujan.
+
+        Returns:
+            pygame.Surface: Superficie compuesta, con alpha premultiplicado.
+        """
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        for image, position in parts:
+            surface.blit(image, position, special_flags=pygame.BLEND_PREMULTIPLIED)
+        return surface
+
+
+    @abc.abstractmethod
+    def render(self, value) -> pygame.Surface:
+        """
+        Método que compone la superficie para un valor. Lo implementa cada elemento.
+
+        Args:
+            value: Valor a mostrar.
+
+        Returns:
+            pygame.Surface: Superficie compuesta, con alpha premultiplicado.
+        """
+
+
+    def draw(self, window:pygame.Surface, value) -> pygame.Rect | None:
+        """
+        Método que dibuja el elemento con el valor indicado, componiéndolo de nuevo solo si el valor cambió.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+            value: Valor a mostrar.
+
+        Returns:
+            pygame.Rect | None: Zona de la ventana donde se dibujó, None si la ventana no es válida.
+        """
+        if isinstance(window, pygame.Surface) and window:
+            if value != self.value or self.surface is None:
+                self.value = value
+                self.surface = self.render(value)
+                self.renders += 1
+            return window.blit(self.surface, self.position, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+class HudText(HudElement):
+    """
+    Elemento del HUD con una etiqueta fija seguida de un valor, por ejemplo "Score: 650". La etiqueta se renderiza
+    una vez y el valor se arma con los glifos del atlas.
+    """
+    def __init__(self, atlas:GlyphAtlas, label:str, position:tuple) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            atlas (GlyphAtlas): Atlas con los glifos de la fuente y el color del texto.
+            label (str): Texto fijo que va antes del valor.
+            position (tuple): Esquina superior izquierda donde se dibuja el texto.
+        """
+        super().__init__(position)
+        self.atlas = atlas
+        self.label = atlas.font.render(label, True, atlas.color).convert_alpha().premul_alpha()
+
+
+    def render(self, value) -> pygame.Surface:
+        """
+        Método que compone la etiqueta y el valor.
+
+        Args:
+            value (str | int): Valor a mostrar a continuación de la etiqueta.
+
+        Returns:
+            pygame.Surface: Superficie compuesta, con alpha premultiplicado.
+        """
+        parts = [(self.label, (0, 0))]
+        x = self.label.get_width()
+        for character in str(value):
+            glyph = self.atlas.glyph(character)
+            parts.append((glyph, (x, 0)))
+            x += glyph.get_width()
+        return HudElement.compose((x, self.atlas.height), parts)
+
+
+class HudLives(HudElement):
+    """
+    Elemento del HUD con los corazones de las vidas del Player: rojos por las vidas que le quedan y grises por las
+    que perdió.
+    """
+    heart_red = None
+    heart_gray = None
+
+    def __init__(self, position:tuple=(500, 10), spacing:int=30, max_lives:int=3) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            position (tuple, optional): Esquina superior izquierda del primer corazón. Defaults to (500, 10).
+            spacing (int, optional): Distancia en píxeles entre corazones. Defaults to 30.
+            max_lives (int, optional): Cantidad total de corazones. Defaults to 3.
+        """
+        super().__init__(position)
+        self.spacing = spacing
+        self.max_lives = max_lives
+        HudLives.load_hearts()
+
+
+    @staticmethod
+    def load_hearts() -> None:
+        """
+        Método estático que carga las imágenes de los corazones la primera vez que se necesitan.
+        """
+        if HudLives.heart_red is None:
+            heart_red = pygame.image.load(PATH_IMAGE+"Varios/lives.png").convert_alpha()
+            HudLives.heart_red = pygame.transform.scale(heart_red, (60, 50)).premul_alpha()
+            heart_gray = pygame.image.load(PATH_IMAGE+"Varios/live_lost.png").convert_alpha()
+            HudLives.heart_gray = pygame.transform.scale(heart_gray, (60, 50)).premul_alpha()
+
+
+    def render(self, value) -> pygame.Surface:
+        """
+        Método que compone la fila de corazones.
+
+        Args:
+            value (int): Vidas que le quedan al Player.
+
+        Returns:
+            pygame.Surface: Superficie compuesta, con alpha premultiplicado.
+        """
+        lives = max(0, min(value, self.max_lives))
+        parts = []
+        for i in range(self.max_lives):
+            heart = HudLives.heart_red if i < lives else HudLives.heart_gray
+            parts.append((heart, (i * self.spacing, 0)))
+        width = (self.max_lives - 1) * self.spacing + HudLives.heart_red.get_width()
+        return HudElement.compose((width, HudLives.heart_red.get_height()), parts)
+
+
+class Hud:
+    """
+    Clase que agrupa el HUD de un nivel: el tiempo, las vidas y el score. Cada elemento se vuelve a componer solo
+    cuando cambia su valor, en lugar de renderizar el texto con la fuente en cada fotograma.
+    """
+    def __init__(self, font:pygame.font.Font, color:tuple=BLUE) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            font (pygame.font.Font): Fuente del texto.
+            color (tuple, optional): Color del texto. Defaults to BLUE.
+        """
+        atlas = GlyphAtlas(font, color)
+        self.timer = HudText(atlas, "Tiempo: ", (10, 5))
+        self.score = HudText(atlas, "Score: ", (1000, 5))
+        self.lives = HudLives()
+
+
+    def draw_timer(self, window:pygame.Surface, elapsed_time:int) -> pygame.Rect | None:
+        """
+        Método que dibuja el tiempo de la partida con el formato mm:ss.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+            elapsed_time (int): Segundos transcurridos.
+
+        Returns:
+            pygame.Rect | None: Zona de la ventana donde se dibujó.
+        """
+        minutes = elapsed_time // 60
+        seconds = elapsed_time % 60
+        return self.timer.draw(window, f"{minutes:02d}:{seconds:02d}")
+
+
+    def draw_status(self, window:pygame.Surface, lives:int, score:int) -> list:
+        """
+        Método que dibuja las vidas del Player y el score.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+            lives (int): Vidas que le quedan al Player.
+            score (int): Score acumulado de la partida.
+
+        Returns:
+            list: Zonas de la ventana donde se dibujó.
+        """
+        return [self.lives.draw(window, lives), self.score.draw(window, score)]
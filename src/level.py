@@ -0,0 +1,376 @@
+import pygame
+import json
+import os
+import re
+import hashlib
+import time
+
+from config import *
+
+from player import Player
+from platforms import Platform
+from collectibles import Collectible
+from enemy import Enemy
+from traps import Traps
+from spatial import SpatialGrid, DynamicGrid
+from entity_store import EntityStore
+from profiler import Profiler
+
+class Level:
+    """
+    Clase que carga un nivel desde su archivo Json. El archivo se parsea una sola vez y con ese documento se construyen
+    todas las listas de entidades del nivel.
+
+    El documento parseado se guarda en memoria para que reiniciar el nivel no vuelva a leer el disco.
+    """
+    _parsed_cache = {}
+
+    def __init__(self, json_file:str, build:bool=True) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            json_file (str): Archivo json del nivel.
+            build (bool, optional): Si es False solo se parsea el documento y las entidades se construyen después
+            con "build_steps". Defaults to True.
+        """
+        self.json_file = json_file
+        self.data = None
+        self.players = []
+        self.platforms = SpatialGrid()
+        self.collectibles = []
+        self.built_collectibles = []
+        self.enemies = DynamicGrid()
+        self.traps = DynamicGrid()
+        self.trap_store = None
+        self.collectible_store = None
+        self.static_layer = None
+        self.parse_ms = 0
+        self.build_ms = 0
+        self.loaded = False
+
+        if isinstance(json_file, str) and json_file:
+            start = time.perf_counter()
+            self.data = Level.parse(json_file)
+            self.parse_ms = (time.perf_counter() - start) * 1000
+
+            if self.data is not None and build:
+                for _ in self.build_steps():
+                    pass
+
+
+    def build_steps(self):
+        """
+        Generador que construye las entidades del nivel de a una por vez, para poder repartir la construcción entre
+        varios fotogramas. Cuando termina el nivel queda marcado como cargado y, si hay muchas trampas o frutas, se
+        arman sus EntityStore.
+
+        Yields:
+            int: Cantidad de entidades construidas hasta el momento.
+        """
+        factories = (
+            ("players", Player.create_player_list, self.players),
+            ("platforms", Platform.create_platform_list, self.platforms),
+            ("collectibles", Collectible.create_collectible_list, self.collectibles),
+            ("enemies", Enemy.create_enemy_list, self.enemies),
+            ("traps", Traps.create_traps_list, self.traps)
+        )
+        built = 0
+
+        if self.data is not None and not self.loaded:
+            for key, factory, entity_list in factories:
+                for item in self.data.get(key, []):
+                    start = time.perf_counter()
+                    entity_list.extend(factory({key: [item]}))
+                    self.build_ms += (time.perf_counter() - start) * 1000
+                    built += 1
+                    yield built
+
+            self.built_collectibles = list(self.collectibles)
+            self.trap_store = EntityStore.create(self.traps)
+            self.traps.store = self.trap_store
+            self.collectible_store = EntityStore.create(self.collectibles, "collected")
+            self.loaded = True
+
+
+    def update(self, delta_ms:int, keys:pygame.key.ScancodeWrapper) -> None:
+        """
+        Método que avanza un paso la simulación de todas las entidades del nivel.
+
+        Args:
+            delta_ms (int): Variable que hace referencia al tiempo transcurrido desde el paso anterior.
+            keys (pygame.key.ScancodeWrapper): Lista de teclas presionadas.
+        """
+        with Profiler.scope("traps.update"):
+            if self.trap_store is not None:
+                self.trap_store.update(delta_ms)
+            else:
+                for tramp in self.traps:
+                    tramp.update(delta_ms)
+
+        with Profiler.scope("collectibles.update"):
+            if self.collectible_store is not None:
+                self.collectible_store.update(delta_ms)
+            else:
+                for rewards in self.collectibles:
+                    rewards.update(delta_ms)
+
+        with Profiler.scope("enemies.update"):
+            for enemy in self.enemies:
+                enemy.update(delta_ms, self.platforms, self.players[0])
+
+        with Profiler.scope("player.update"):
+            for player in self.players:
+                player.update(delta_ms, self.platforms, self.collectibles, self.enemies, self.traps, keys)
+
+
+    def draw(self, window:pygame.Surface, alpha:float=1, static:bool=True) -> list:
+        """
+        Método que dibuja todas las entidades del nivel. Las vidas del Player las dibuja el HUD de la pantalla.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+            alpha (float, optional): Fracción del paso fijo transcurrida desde el último update, las entidades que se
+            mueven se dibujan interpoladas entre su posición anterior y la actual. Defaults to 1.
+            static (bool, optional): Si es False las plataformas ya están en la ventana (ver "draw_static") y solo se
+            vuelven a dibujar recortadas a la zona de cada trampa, ya que las trampas van detrás. Defaults to True.
+
+        Returns:
+            list: Zonas de la ventana donde se dibujaron las entidades que no son plataformas.
+        """
+        rects = []
+
+        with Profiler.scope("traps.draw"):
+            if self.trap_store is not None:
+                rects.extend(self.trap_store.draw(window))
+            else:
+                for tramp in self.traps:
+                    rects.append(tramp.draw(window))
+
+        with Profiler.scope("platforms.draw"):
+            if static:
+                self.draw_static(window)
+            else:
+                clip = window.get_clip()
+                for rect in rects:
+                    if rect is not None:
+                        window.set_clip(rect.clip(clip))
+                        for platform in SpatialGrid.nearby(self.platforms, rect):
+                            platform.draw(window)
+                window.set_clip(clip)
+
+        with Profiler.scope("collectibles.draw"):
+            if self.collectible_store is not None:
+                rects.extend(self.collectible_store.draw(window))
+            else:
+                for rewards in self.collectibles:
+                    rects.append(rewards.draw(window))
+
+        with Profiler.scope("enemies.draw"):
+            for enemy in self.enemies:
+                rects.append(enemy.draw(window, alpha))
+
+        with Profiler.scope("player.draw"):
+            for player in self.players:
+                rects.extend(player.draw(window, alpha))
+
+        return [rect for rect in rects if rect is not None]
+
+
+    def draw_static(self, surface:pygame.Surface) -> None:
+        """
+        Método que dibuja las plataformas, la parte del nivel que no cambia nunca.
+
+        Args:
+            surface (pygame.Surface): Ventana o capa estática donde dibujar.
+        """
+        for platform in self.platforms:
+            platform.draw(surface)
+
+
+    def bake_static(self, background:pygame.Surface, background_path:str=None) -> pygame.Surface:
+        """
+        Método que compone en una sola superficie el fondo y todas las plataformas, así la parte fija del nivel se
+        dibuja con un único blit. Si STATIC_LAYER_CACHE está activo y se indica la ruta del fondo, la capa se guarda
+        en PATH_CACHE y las siguientes veces se lee de ahí; el nombre del archivo incluye un hash de las plataformas,
+        del fondo y de la hoja de bloques, así que cualquier cambio genera una capa nueva. La capa queda guardada en
+        el nivel, así reintentarlo no la vuelve a componer.
+
+        Args:
+            background (pygame.Surface): Fondo ya escalado al tamaño de la ventana.
+            background_path (str, optional): Ruta de la imagen de fondo, hace falta para usar la caché en disco.
+            Defaults to None.
+
+        Returns:
+            pygame.Surface: Capa estática convertida al formato de la ventana.
+        """
+        if self.static_layer is not None:
+            return self.static_layer
+
+        cache_path = None
+        if STATIC_LAYER_CACHE and isinstance(background_path, str) and background_path:
+            cache_path = self.static_cache_path(background_path)
+            if cache_path is not None and os.path.exists(cache_path):
+                try:
+                    self.static_layer = pygame.image.load(cache_path).convert()
+                    return self.static_layer
+                except pygame.error:
+                    pass
+
+        static_layer = background.convert()
+        self.draw_static(static_layer)
+
+        if cache_path is not None:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                pygame.image.save(static_layer, cache_path)
+            except (pygame.error, OSError):
+                pass
+
+        self.static_layer = static_layer
+        return static_layer
+
+
+    def static_cache_path(self, background_path:str) -> str | None:
+        """
+        Método que arma la ruta del archivo de caché de la capa estática.
+
+        Args:
+            background_path (str): Ruta de la imagen de fondo.
+
+        Returns:
+            str | None: Ruta dentro de PATH_CACHE, None si el fondo o la hoja de bloques no existen.
+        """
+        try:
+            key = json.dumps({
+                "platforms": self.data.get("platforms", []) if isinstance(self.data, dict) else [],
+                "background": background_path,
+                "size": [WIDTH, HEIGHT],
+                "modified": [os.path.getmtime(background_path), os.path.getmtime(SHEET_PLATFORMS)]
+            }, sort_keys=True)
+        except OSError:
+            return None
+
+        name = os.path.splitext(os.path.basename(self.json_file))[0]
+        digest = hashlib.md5(key.encode()).hexdigest()[:12]
+        return os.path.join(PATH_CACHE, f"static_{name}_{digest}.bmp")
+
+
+    @property
+    def score(self) -> int:
+        """
+        Score del Player en este nivel.
+        """
+        return self.players[0].score if self.players else 0
+
+
+    @property
+    def lives(self) -> int:
+        """
+        Vidas que le quedan al Player.
+        """
+        return self.players[0].lives if self.players else 0
+
+
+    def is_lost(self) -> bool:
+        """
+        Método que indica si el Player perdió todas sus vidas y ya cayó fuera de la pantalla.
+
+        Returns:
+            bool: True si el nivel se perdió.
+        """
+        for player in self.players:
+            if player.lives == 0 and player.rect.y > HEIGHT:
+                return True
+        return False
+
+
+    def is_cleared(self) -> bool:
+        """
+        Método que indica si ya se recolectaron todas las frutas del nivel.
+
+        Returns:
+            bool: True si el nivel se ganó.
+        """
+        return len(self.collectibles) == 0
+
+
+    @staticmethod
+    def parse(json_file:str) -> dict | None:
+        """
+        Método estático que devuelve el documento del nivel, leyéndolo del disco solo la primera vez.
+
+        Args:
+            json_file (str): Archivo json del nivel.
+
+        Returns:
+            dict | None: El documento parseado o None si el archivo no existe o no es un Json válido.
+        """
+        if json_file in Level._parsed_cache:
+            return Level._parsed_cache[json_file]
+
+        try:
+            with open (json_file, "r") as file:
+                data = json.load(file)
+
+            Level._parsed_cache[json_file] = data
+            return data
+
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+
+    @staticmethod
+    def discover(folder:str=PATH_JSON) -> list:
+        """
+        Método estático que busca los archivos "nivel_N.json" de la carpeta y arma la descripción de cada nivel con la
+        sección "settings" de su Json. Agregar un nivel nuevo solo requiere agregar su archivo.
+
+        Args:
+            folder (str, optional): Carpeta donde están los archivos de nivel. Defaults to PATH_JSON.
+
+        Returns:
+            list: Lista de diccionarios ordenada por número de nivel, cada uno con "number", "json_file", "background",
+            "music" y "music_volume".
+        """
+        descriptors = []
+
+        if os.path.isdir(folder):
+            for file_name in os.listdir(folder):
+                match = re.fullmatch(r"nivel_(\d+)\.json", file_name)
+                if match:
+                    json_file = os.path.join(folder, file_name)
+                    data = Level.parse(json_file)
+                    if data is not None and "settings" in data:
+                        settings = data["settings"]
+                        descriptors.append({
+                            "number": int(match.group(1)),
+                            "json_file": json_file,
+                            "background": PATH_IMAGE+settings["background"],
+                            "music": PATH_SOUND+settings["music"],
+                            "music_volume": settings.get("music_volume", 0.1)
+                        })
+
+        return sorted(descriptors, key=lambda descriptor: descriptor["number"])
+
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Método estático que olvida los documentos parseados, por ejemplo si se editaron los archivos de nivel.
+        """
+        Level._parsed_cache.clear()
+
+
+    def timings(self) -> dict:
+        """
+        Método que informa cuanto tardó cada etapa de la carga del nivel.
+
+        Returns:
+            dict: Diccionario con los milisegundos de parseo y de construcción de entidades.
+        """
+        return {
+            "json_file": self.json_file,
+            "parse_ms": self.parse_ms,
+            "build_ms": self.build_ms
+        }
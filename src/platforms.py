@@ -7,8 +7,12 @@ from assistant import Assistant
 class Platform:
     """
     Clase que instancia objetos de tipo Platform que serán utilizados en este juego para que el Player pueda subirse en ellas.
-    
+    Las plataformas del mismo tipo y tamaño comparten la misma imagen escalada.
     """
+    __slots__ = ("image", "rect", "collided", "rect_collision_top", "rect_collision_bottom", "rect_collision_left",
+                 "rect_collision_right")
+    _images = {}
+
     def __init__(self, pos_x:int, pos_y:int, width:int, height, type:int, collided:bool) -> None:
         """
         Constructor de la clase.
@@ -24,8 +28,7 @@ class Platform:
         if(isinstance(pos_x, int) and pos_x and isinstance(pos_y, int) and pos_y and isinstance(width, int) 
            and width and isinstance(height, int) and height and isinstance(type, int) and type and 
            isinstance(collided, bool) and collided):
-            self.image = Assistant.get_surface_sprite(PATH_IMAGE+"Varios/Bloques/sheet1.png",8,8)[type]
-            self.image =  pygame.transform.scale(self.image, (width, height))
+            self.image = Platform.get_image(type, width, height)
             self.rect = self.image.get_rect()
             self.rect.x = pos_x
             self.rect.y = pos_y
@@ -37,6 +40,36 @@ class Platform:
                 self.rect_collision_right = pygame.Rect(self.rect.x+45, self.rect.y, 5, 49)
                 
 
+    @staticmethod
+    def get_image(type:int, width:int, height:int) -> pygame.Surface:
+        """
+        Método estático que devuelve la imagen de un tipo de plataforma escalada, escalándola solo la primera vez que
+        se pide con ese tamaño.
+
+        Args:
+            type (int): Tipo de plataforma, índice en la hoja de bloques.
+            width (int): Anchura de la plataforma.
+            height (int): Altura de la plataforma.
+
+        Returns:
+            pygame.Surface: Imagen compartida, no se debe modificar.
+        """
+        key = (type, width, height)
+        image = Platform._images.get(key)
+        if image is None:
+            image = pygame.transform.scale(Assistant.get_surface_sprite(SHEET_PLATFORMS,8,8)[type], (width, height))
+            Platform._images[key] = image
+        return image
+
+
+    @staticmethod
+    def clear_images() -> None:
+        """
+        Método estático que libera las imágenes escaladas compartidas por las plataformas.
+        """
+        Platform._images.clear()
+
+
     @staticmethod
     def create_platform_json(json_file:str) -> list | None:
         """
@@ -50,40 +83,57 @@ class Platform:
             list: Retorna la lista de Plataformas o None en caso de error.
         """
         try:
-            platform_list = []
-
             with open (json_file, "r") as file:
                 data = json.load(file)
 
-                if "platforms" in data:
-                    platform_data = data["platforms"]
-
-                    for platform in platform_data:
-                        pos_x = platform["pos_x"]
-                        pos_y = platform["pos_y"]
-                        width = platform["width"]
-                        height = platform["height"]
-                        type = platform["type"]
-                        collided = platform.get("collided", False)
-
-                        platform = Platform(pos_x, pos_y, width, height, type, collided)
-                        platform_list.append(platform)
-            
-            return platform_list
+            return Platform.create_platform_list(data)
 
         except (FileNotFoundError, json.JSONDecodeError):
             return None
+
+
+    @staticmethod
+    def create_platform_list(data:dict) -> list:
+        """
+        Método estático que construye las Plataformas a partir del documento del nivel ya parseado.
+
+        Args:
+            data (dict): Documento del nivel, se usa la clave "platforms".
+
+        Returns:
+            list: Retorna la lista de Plataformas, vacía si el documento no tiene la clave.
+        """
+        platform_list = []
+
+        if isinstance(data, dict) and "platforms" in data:
+            platform_data = data["platforms"]
+
+            for platform in platform_data:
+                pos_x = platform["pos_x"]
+                pos_y = platform["pos_y"]
+                width = platform["width"]
+                height = platform["height"]
+                type = platform["type"]
+                collided = platform.get("collided", False)
+
+                platform = Platform(pos_x, pos_y, width, height, type, collided)
+                platform_list.append(platform)
+
+        return platform_list
         
 
-    def draw(self, window:pygame.Surface) -> None:
+    def draw(self, window:pygame.Surface) -> pygame.Rect | None:
         """
         Método que se encarga de dibujar la plataforma en la ventana.
 
         Args:
             window (pygame.Surface): Es la ventana principal del juego.
+
+        Returns:
+            pygame.Rect | None: Zona de la ventana donde se dibujó, None si la ventana no es válida.
         """
         if isinstance(window, pygame.Surface) and window:
-            window.blit(self.image, self.rect)
+            return window.blit(self.image, self.rect)
             
         
             
\ No newline at end of file
@@ -2,15 +2,71 @@ import pygame
 import json
 
 from config import *
-from assistant import Assistant
-from projectile import Projectile
+from animation import AnimationBank
+from archetype import Archetype
+from sound_bank import SoundBank
+from projectile import ProjectilePool
+from spatial import SpatialGrid
+
+
+class PlayerArchetype(Archetype):
+    """
+    Clase que guarda lo que comparten todos los Players armados con las mismas animaciones: los fotogramas, los sonidos
+    y las constantes de movimiento.
+    """
+    __slots__ = ("still_r", "still_l", "walking_r", "walking_l", "jumping_r", "jumping_l", "gravity", "walking_speed",
+                 "jumping_power", "jump_height", "frame_rate", "move_rate", "hit_cooldown_time", "sound_jump",
+                 "sound_death", "radius")
+
+    def __init__(self, animations:dict) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            animations (dict): Un diccionario que contiene las animaciones y el numero de columna por animación.
+        """
+        self.still_r = AnimationBank.get(PATH_IMAGE+animations["still_r"]["path"],animations["still_r"]["columns"],1,False,2)
+        self.still_l = AnimationBank.get(PATH_IMAGE+animations["still_l"]["path"],animations["still_l"]["columns"],1,True,2)
+        self.walking_r = AnimationBank.get(PATH_IMAGE+animations["walking_r"]["path"],animations["walking_r"]["columns"],1,False,2)
+        self.walking_l = AnimationBank.get(PATH_IMAGE+animations["walking_l"]["path"],animations["walking_l"]["columns"],1,True,2)
+        self.jumping_r = AnimationBank.get(PATH_IMAGE+animations["jumping_r"]["path"],animations["jumping_r"]["columns"],1,False,2)
+        self.jumping_l = AnimationBank.get(PATH_IMAGE+animations["jumping_l"]["path"],animations["jumping_l"]["columns"],1,True,2)
+        self.gravity = 8
+        self.walking_speed = 5
+        self.jumping_power = 25
+        self.jump_height = 136
+        self.frame_rate = 35
+        self.move_rate = 16
+        self.hit_cooldown_time = 500
+        self.sound_jump = SoundBank.get("salto.mp3", 0.1)
+        self.sound_death = SoundBank.get("muerte_player.mp3", 0.3)
+        self.radius = 31
+
+
+    @staticmethod
+    def get(animations:dict) -> "PlayerArchetype":
+        """
+        Método estático que devuelve el arquetipo compartido para esas animaciones.
+
+        Args:
+            animations (dict): Un diccionario que contiene las animaciones y el numero de columna por animación.
+
+        Returns:
+            PlayerArchetype: Arquetipo compartido.
+        """
+        return Archetype.shared(PlayerArchetype, animations)
 
 
 class Player:
     """
     Clase que instancia objetos de tipo Player que serán utilizados por los usuarios de este juego.
-
+    Lo que no cambia entre Players con las mismas animaciones vive en su PlayerArchetype.
     """
+    __slots__ = ("archetype", "frame", "direction", "animation", "rect", "rect_collision_feet", "rect_collision_body",
+                 "move_x", "move_y", "lives", "score", "y_start_jump", "is_jumping", "animation_elapsed_time",
+                 "movement_elapsed_time", "falling", "hit_cooldown", "prev_x", "prev_y", "projectile", "is_shooting",
+                 "facing_right", "can_shooting")
+
     def __init__(self, animations:dict, pos_x:int, pos_y:int) -> None:
         """
         Constructor de la clase.
@@ -20,26 +76,12 @@ class Player:
             pos_x (int): Un entero que representa la posición en el eje x en el cual comenzara el Player.
             pos_y (int): Un entero que representa la posición en el eje y en el cual comenzara el Player.
         """
-        super().__init__()
-        """
-        Constructor de a clase de la cual hereda la clase Player.
-        """
         if isinstance(animations, dict) and animations and isinstance(pos_x, int) and pos_x and isinstance(pos_y, int) and pos_y:
-            self.still_r = Assistant.get_surface_sprite(PATH_IMAGE+animations["still_r"]["path"],animations["still_r"]["columns"],1,False,2)
-            self.still_l = Assistant.get_surface_sprite(PATH_IMAGE+animations["still_l"]["path"],animations["still_l"]["columns"],1,True,2)
-            self.walking_r = Assistant.get_surface_sprite(PATH_IMAGE+animations["walking_r"]["path"],animations["walking_r"]["columns"],1,False,2)
-            self.walking_l = Assistant.get_surface_sprite(PATH_IMAGE+animations["walking_l"]["path"],animations["walking_l"]["columns"],1,True,2)
-            self.jumping_r = Assistant.get_surface_sprite(PATH_IMAGE+animations["jumping_r"]["path"],animations["jumping_r"]["columns"],1,False,2)
-            self.jumping_l = Assistant.get_surface_sprite(PATH_IMAGE+animations["jumping_l"]["path"],animations["jumping_l"]["columns"],1,True,2)
-            self.heart_red = pygame.image.load(PATH_IMAGE+"Varios/lives.png").convert_alpha()
-            self.heart_red = pygame.transform.scale(self.heart_red, (60, 50))
-            self.heart_gray = pygame.image.load(PATH_IMAGE+"Varios/live_lost.png").convert_alpha()
-            self.heart_gray = pygame.transform.scale(self.heart_gray, (60, 50))
+            self.archetype = PlayerArchetype.get(animations)
             self.frame = 0
             self.direction = DIRECTION_R
-            self.animation = self.still_r
-            self.image = self.animation[self.frame]
-            self.rect = self.image.get_rect()
+            self.animation = self.archetype.still_r
+            self.rect = self.animation[self.frame].get_rect()
             self.rect.x = pos_x
             self.rect.y = pos_y
             self.rect_collision_feet = pygame.Rect((self.rect.x+20), (self.rect.y+self.rect.h-3), (self.rect.w//3+4),4)
@@ -48,28 +90,26 @@ class Player:
             self.move_y = 0
             self.lives = 3
             self.score = 0
-            self.gravity = 8
-            self.walking_speed = 5
-            self.jumping_power = 25
             self.y_start_jump = 0
-            self.jump_height = 136
             self.is_jumping = False
             self.animation_elapsed_time = 0
-            self.frame_rate = 35
             self.movement_elapsed_time = 0
-            self.move_rate = 10
-            self.rotated_image = pygame.transform.rotate(self.image, 180)
             self.falling = False
             self.hit_cooldown = 0
-            self.projectile = pygame.sprite.Group()
+            self.prev_x = self.rect.x
+            self.prev_y = self.rect.y
+            self.projectile = ProjectilePool()
             self.is_shooting = False
             self.facing_right = True
             self.can_shooting = False
-            self.sound_jump = pygame.mixer.Sound(PATH_SOUND+"salto.mp3")
-            self.sound_jump.set_volume(0.1)
-            self.sound_death = pygame.mixer.Sound(PATH_SOUND+"muerte_player.mp3")
-            self.sound_death.set_volume(0.3)
-            self.radius = 31
+
+
+    @property
+    def radius(self) -> int:
+        """
+        Radio del Player para las colisiones de círculo con las trampas.
+        """
+        return self.archetype.radius
 
 
     @staticmethod
@@ -85,42 +125,56 @@ class Player:
             list: Retorna la lista de Players o None en caso de error.
         """
         try:
-            player_list = []
-
             with open (json_file, "r") as file:
                 data = json.load(file)
 
-                if "players" in data:
-                    player_data = data["players"]
+            return Player.create_player_list(data)
 
-                    for player in player_data:
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
 
-                        animations = player["animations"]
-                        pos_x = player["pos_x"]
-                        pos_y = player["pos_y"]
 
-                        player = Player(animations, pos_x, pos_y)
-                        player_list.append(player)
+    @staticmethod
+    def create_player_list(data:dict) -> list:
+        """
+        Método estático que construye los Players a partir del documento del nivel ya parseado.
 
-            return player_list
+        Args:
+            data (dict): Documento del nivel, se usa la clave "players".
 
-        except (FileNotFoundError, json.JSONDecodeError):
-            return None
+        Returns:
+            list: Retorna la lista de Players, vacía si el documento no tiene la clave.
+        """
+        player_list = []
+
+        if isinstance(data, dict) and "players" in data:
+            player_data = data["players"]
+
+            for player in player_data:
+
+                animations = player["animations"]
+                pos_x = player["pos_x"]
+                pos_y = player["pos_y"]
+
+                player = Player(animations, pos_x, pos_y)
+                player_list.append(player)
+
+        return player_list
 
 
     def still(self) -> None:
         """
         Método que carga la imagen "quieto" del Player dependiendo de para que lado este posicionado el Player.
         """
-        if self.animation != self.still_r and self.animation != self.still_l:
+        if self.animation != self.archetype.still_r and self.animation != self.archetype.still_l:
             self.move_x = 0
             self.move_y = 0
             self.frame = 0
 
             if self.direction == DIRECTION_R:
-                self.animation = self.still_r
+                self.animation = self.archetype.still_r
             else:
-                self.animation = self.still_l
+                self.animation = self.archetype.still_l
 
 
     def walking(self, direction:int) -> None:
@@ -132,16 +186,16 @@ class Player:
             direction (int): Dirección que va a tener el Player en el momento al cual se llame a este método.
         """
         if isinstance(direction, int) and direction:
-            if self.direction != direction or (self.animation != self.walking_r and self.animation != self.walking_l):
+            if self.direction != direction or (self.animation != self.archetype.walking_r and self.animation != self.archetype.walking_l):
                 self.frame = 0
                 self.direction = direction
 
                 if self.direction == DIRECTION_R:
-                    self.move_x = self.walking_speed
-                    self.animation = self.walking_r
+                    self.move_x = self.archetype.walking_speed
+                    self.animation = self.archetype.walking_r
                 else:
-                    self.move_x = -self.walking_speed
-                    self.animation = self.walking_l
+                    self.move_x = -self.archetype.walking_speed
+                    self.animation = self.archetype.walking_l
 
 
     def jumping(self) -> None:
@@ -154,14 +208,14 @@ class Player:
             self.frame = 0
             self.is_jumping = True
             self.y_start_jump = self.rect.y
-            self.sound_jump.play()
+            self.archetype.sound_jump.play()
 
             if self.direction == DIRECTION_R:
-                self.move_y = -self.jumping_power
-                self.animation = self.jumping_r
+                self.move_y = -self.archetype.jumping_power
+                self.animation = self.archetype.jumping_r
             else:
-                self.move_y = -self.jumping_power
-                self.animation = self.jumping_l
+                self.move_y = -self.archetype.jumping_power
+                self.animation = self.archetype.jumping_l
         else:
             self.is_jumping = False
             self.still()
@@ -172,13 +226,9 @@ class Player:
         Método que se encarga de los disparos del Player si es que puede disparar.
         """
         if self.can_shooting:
-            if self.direction == DIRECTION_R:
-                projectile = Projectile(self.rect.x+20, self.rect.y+40)
-            else:
+            if self.direction != DIRECTION_R:
                 self.facing_right = False
-                projectile = Projectile(self.rect.x+20, self.rect.y+40)
-                projectile.speed *= -1
-            self.projectile.add(projectile)
+            self.projectile.acquire(self.rect.x+20, self.rect.y+40, self.direction)
 
 
     def respawn(self) -> None:
@@ -217,7 +267,8 @@ class Player:
             if self.rect.y >= GROUND:
                 is_platform = True
             else:
-                for platform in platform_list:
+                nearby_rect = self.rect_collision_feet.union(self.rect_collision_body)
+                for platform in SpatialGrid.nearby(platform_list, nearby_rect):
                     if platform.collided:
                         if self.rect_collision_feet.colliderect(platform.rect_collision_top):
                             is_platform = True
@@ -230,28 +281,29 @@ class Player:
             return None
 
 
-    def collided_collectibles(self, collectibles_list:list) -> None:
+    def collided_collectibles(self, collectibles_list:list, delta_ms:int) -> None:
         """
         Método que verifica si el Player colisiono con una objeto recogible, si es asi elimina el objeto de la lista
-        y le suma 100 al score del Player.
+        (luego de mostrar su animación de recolectado) y le suma 100 al score del Player.
 
         Args:
             collectibles_list (list): Lista de objetos recolectables.
+            delta_ms (int): Variable que hace referencia al tiempo transcurrido desde que se actualizo la pantalla.
         """
         if isinstance(collectibles_list, list) and collectibles_list:
             for collectibles in collectibles_list:
                 if self.rect_collision_body.colliderect(collectibles.rect):
                     collectibles.collected = True
-                    collectibles.sound.play()
+                    collectibles.archetype.sound.play()
                 if collectibles.collected:
-                    collectibles.counter += 1
-                    if collectibles.counter > 7:
+                    collectibles.collected_elapsed_time += delta_ms
+                    if collectibles.collected_elapsed_time > collectibles.archetype.collected_delay:
                         collectibles_list.remove(collectibles)
-                        if collectibles.type == "special":
+                        if collectibles.archetype.type == "special":
                             self.score += 150
                         else:
                             self.score += 100
-                        if collectibles.type == "special":
+                        if collectibles.archetype.type == "special":
                             self.can_shooting = True
                     break
 
@@ -265,32 +317,44 @@ class Player:
             enemy_list (list): Lista de enemigos.
         """
         if isinstance(enemy_list, list) and enemy_list:
-            for enemy in enemy_list:
+            for enemy in SpatialGrid.nearby(enemy_list, self.rect_collision_body):
                 if(enemy.rect_collision_body.colliderect(self.rect_collision_body) and not self.falling and
-                   self.hit_cooldown == 0):
+                   self.hit_cooldown <= 0):
                     self.falling = True
                     self.move_x = 0
                     self.lives -= 1
-                    self.hit_cooldown = 60
-                    self.sound_death.play()
+                    self.hit_cooldown = self.archetype.hit_cooldown_time
+                    self.archetype.sound_death.play()
 
 
     def collided_tramps(self, trap_list:list) -> None:
         """
         Método que verifica si el Player colisiono con una trampa, si asi es se muestra la animación "golpeado"
-        y el Player pierde una vida.
+        y el Player pierde una vida. Si las trampas tienen un EntityStore se prueban todas a la vez, si no solo se
+        revisan las trampas cuyo centro puede estar a menos de la suma de los radios.
 
         Args:
             trap_list (list): Lista de trampas.
         """
-        if isinstance(trap_list, list) and trap_list:
-            for trap in trap_list:
-                if trap.has_collided(self) and not self.falling and self.hit_cooldown == 0:
+        store = getattr(trap_list, "store", None)
+        if store is not None:
+            if not self.falling and self.hit_cooldown <= 0 and len(store.collide(self.rect_collision_body.center, self.radius)):
+                self.falling = True
+                self.move_x = 0
+                self.lives -= 1
+                self.hit_cooldown = self.archetype.hit_cooldown_time
+                self.archetype.sound_death.play()
+        elif isinstance(trap_list, list) and trap_list:
+            reach = self.radius + getattr(trap_list, "max_radius", 0)
+            area = pygame.Rect(0, 0, reach * 2, reach * 2)
+            area.center = self.rect_collision_body.center
+            for trap in SpatialGrid.nearby(trap_list, area):
+                if trap.has_collided(self) and not self.falling and self.hit_cooldown <= 0:
                     self.falling = True
                     self.move_x = 0
                     self.lives -= 1
-                    self.hit_cooldown = 60
-                    self.sound_death.play()
+                    self.hit_cooldown = self.archetype.hit_cooldown_time
+                    self.archetype.sound_death.play()
 
 
     def apply_gravity(self, platform_list:list) -> None:
@@ -302,7 +366,7 @@ class Player:
         """
         if isinstance(platform_list, list) and platform_list:
             if not self.collided_platform(platform_list):
-                self.add_y(self.gravity)
+                self.add_y(self.archetype.gravity)
             elif self.is_jumping:
                 self.jumping()
 
@@ -311,7 +375,8 @@ class Player:
         """
         Método que realiza el movimiento del personaje en el juego. Actualiza la posición del personaje según el tiempo
         transcurrido y aplica la gravedad. El movimiento se basa en las variables de movimiento (move_x y move_y) y
-        el tiempo delta_ms.
+        el tiempo delta_ms: se mueve una vez cada "move_rate" milisegundos y el tiempo sobrante se conserva para el
+        siguiente paso, así la velocidad no depende de los fotogramas por segundo.
 
         Args:
             delta_ms (int): Variable que hace referencia al tiempo transcurrido desde que se actualizo la pantalla.
@@ -320,11 +385,11 @@ class Player:
         if isinstance(delta_ms, int) and delta_ms and isinstance(platform_list, list) and platform_list:
             self.movement_elapsed_time += delta_ms
 
-            if self.movement_elapsed_time >= self.move_rate:
-                if (abs(self.y_start_jump) - abs(self.rect.y)) > self.jump_height and self.is_jumping:
+            while self.movement_elapsed_time >= self.archetype.move_rate:
+                if (abs(self.y_start_jump) - abs(self.rect.y)) > self.archetype.jump_height and self.is_jumping:
                     self.move_y = 0
 
-                self.movement_elapsed_time = 0
+                self.movement_elapsed_time -= self.archetype.move_rate
                 self.add_x(self.move_x)
                 self.add_y(self.move_y)
 
@@ -334,7 +399,7 @@ class Player:
     def do_animation(self, delta_ms:int) -> None:
         """
         Método que se encarga las animaciones. Se encarga de establecer en 0 el frame cada vez que el tiempo sea mayor al
-        al atributo self.frame_rate.
+        al atributo self.archetype.frame_rate.
 
         Args:
             delta_ms (int): Variable que hace referencia al tiempo transcurrido desde que se actualizo la pantalla.
@@ -342,7 +407,7 @@ class Player:
         if isinstance(delta_ms, int) and delta_ms:
             self.animation_elapsed_time += delta_ms
 
-            if self.animation_elapsed_time >= self.frame_rate:
+            if self.animation_elapsed_time >= self.archetype.frame_rate:
                 self.animation_elapsed_time = 0
 
                 self.frame = (self.frame + 1) % len(self.animation)
@@ -422,10 +487,13 @@ class Player:
            isinstance(collectibles_list, list) and collectibles_list and isinstance(enemy_list, list) and enemy_list and
            isinstance(trap_list, list) and trap_list) and isinstance(keys, pygame.key.ScancodeWrapper) and keys:
 
+            self.prev_x = self.rect.x
+            self.prev_y = self.rect.y
+
             self.controls(keys)
             self.do_movement(delta_ms, platform_list)
             self.do_animation(delta_ms)
-            self.collided_collectibles(collectibles_list)
+            self.collided_collectibles(collectibles_list, delta_ms)
             self.collided_enemy(enemy_list)
             self.collided_tramps(trap_list)
             self.projectile.update(enemy_list, trap_list, platform_list)
@@ -434,48 +502,30 @@ class Player:
                 self.add_y(2)
 
             if self.hit_cooldown > 0:
-                self.hit_cooldown -= 1
+                self.hit_cooldown -= delta_ms
             self.respawn()
 
 
-    def draw(self, window:pygame.Surface) -> None:
+    def draw(self, window:pygame.Surface, alpha:float=1) -> list:
         """
         Método que se encarga de dibujar al Player en la ventana.
 
         Args:
             window (pygame.Surface): Es la ventana principal del juego.
+            alpha (float, optional): Fracción del paso de simulación transcurrida desde el último update, se usa para
+            interpolar la posición entre el paso anterior y el actual. Defaults to 1.
+
+        Returns:
+            list: Zonas de la ventana donde se dibujaron el Player y sus proyectiles.
         """
+        rects = []
         if isinstance(window, pygame.Surface) and window:
-            self.image = self.animation[self.frame]
+            position = (self.prev_x + (self.rect.x - self.prev_x) * alpha, self.prev_y + (self.rect.y - self.prev_y) * alpha)
 
             if self.falling:
-                window.blit(self.rotated_image, self.rect)
+                rects.append(window.blit(self.animation.rotated[self.frame], position))
             else:
-                window.blit(self.image, self.rect)
-                self.projectile.draw(window)
-    
-
-    def draw_lives(self, window:pygame.Surface) -> None:
-        """
-        Método que dibuja las vidas del Player en la ventana del juego.
-
-        Args:
-            window (pygame.Surface): Es la ventana principal del juego.
-        """
-        if isinstance(window, pygame.Surface) and window:
-            heart_x = 500
-            heart_y = 10
-            heart_spacing = 30 
-
-            for i in range(self.lives):
-                heart_rect = self.heart_red.get_rect()
-                heart_rect.x = heart_x + i * heart_spacing
-                heart_rect.y = heart_y
-                window.blit(self.heart_red, heart_rect)
-
-
-            for i in range(self.lives, 3):
-                heart_rect = self.heart_gray.get_rect()
-                heart_rect.x = heart_x + i * heart_spacing
-                heart_rect.y = heart_y
-                window.blit(self.heart_gray, heart_rect)
\ No newline at end of file
+                rects.append(window.blit(self.animation[self.frame], position))
+                for projectile in self.projectile:
+                    rects.append(window.blit(projectile.image, projectile.rect))
+        return rects
@@ -0,0 +1,235 @@
+import pygame
+import io
+import threading
+
+from config import *
+from assistant import Assistant
+from atlas import TextureAtlas
+from level import Level
+
+class Preloader:
+    """
+    Clase que prepara el siguiente nivel mientras se juega el actual.
+
+    Un hilo secundario lee el Json, decodifica el fondo y todas las hojas de sprite del nivel y lee la música a memoria.
+    En el hilo principal, "pump" se llama una vez por fotograma y va haciendo de a poco lo que pygame exige hacer ahí:
+    convertir las imágenes y construir las entidades. Al llegar la transición "take" entrega el nivel ya armado.
+    """
+    def __init__(self, memory_budget:int=PRELOAD_MEMORY_BUDGET) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            memory_budget (int, optional): Bytes máximos de imágenes decodificadas que se guardan por adelantado.
+            Defaults to PRELOAD_MEMORY_BUDGET.
+        """
+        self.memory_budget = memory_budget
+        self.memory_used = 0
+        self.json_file = None
+        self.background_path = None
+        self.music_path = None
+        self.background = None
+        self.music = None
+        self.level = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._decoded = []
+        self._provided_paths = []
+        self._build_steps = None
+        self._decode_done = False
+        self._finished = False
+
+
+    def request(self, json_file:str, background_path:str, music_path:str) -> None:
+        """
+        Método que empieza a precargar un nivel en un hilo secundario. Si ese nivel ya se está precargando no hace nada.
+
+        Args:
+            json_file (str): Archivo json del nivel.
+            background_path (str): Ruta de la imagen de fondo del nivel.
+            music_path (str): Ruta de la música del nivel.
+        """
+        if isinstance(json_file, str) and json_file and json_file != self.json_file:
+            self.cancel()
+            self.json_file = json_file
+            self.background_path = background_path
+            self.music_path = music_path
+            self._decode_done = False
+            self._finished = False
+            self._thread = threading.Thread(target=self._decode, args=(json_file, background_path, music_path), daemon=True)
+            self._thread.start()
+
+
+    def _decode(self, json_file:str, background_path:str, music_path:str) -> None:
+        """
+        Método que corre en el hilo secundario, decodifica las imágenes sin convertirlas respetando el presupuesto de
+        memoria. Las imágenes que no entran se cargarán de forma normal al construir el nivel.
+
+        Args:
+            json_file (str): Archivo json del nivel.
+            background_path (str): Ruta de la imagen de fondo del nivel.
+            music_path (str): Ruta de la música del nivel.
+        """
+        data = Level.parse(json_file)
+        paths = [background_path]
+        if data is not None:
+            paths += [SHEET_PLATFORMS, SHEET_COLLECTED]
+            paths += [PATH_IMAGE+path for path in Preloader.image_paths(data)]
+
+        for path in dict.fromkeys(paths):
+            if self.json_file != json_file:
+                return
+            if TextureAtlas.contains(path):
+                continue
+            try:
+                image_surface = pygame.image.load(path)
+            except (FileNotFoundError, pygame.error):
+                continue
+            size = image_surface.get_width() * image_surface.get_height() * image_surface.get_bytesize()
+            with self._lock:
+                if self.json_file != json_file:
+                    return
+                if self.memory_used + size > self.memory_budget:
+                    continue
+                self.memory_used += size
+                self._decoded.append((path, image_surface))
+
+        try:
+            with open(music_path, "rb") as file:
+                music = io.BytesIO(file.read())
+        except (FileNotFoundError, TypeError):
+            music = None
+
+        with self._lock:
+            if self.json_file == json_file:
+                self.music = music
+                self._decode_done = True
+
+
+    @staticmethod
+    def image_paths(data) -> list:
+        """
+        Método estático que recorre el documento del nivel y junta todas las rutas de imágenes que aparecen.
+
+        Args:
+            data (dict | list): Documento del nivel o una parte de él.
+
+        Returns:
+            list: Lista de rutas relativas a PATH_IMAGE.
+        """
+        paths = []
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if key == "path" and isinstance(value, str):
+                    paths.append(value)
+                else:
+                    paths += Preloader.image_paths(value)
+        elif isinstance(data, list):
+            for value in data:
+                paths += Preloader.image_paths(value)
+        return paths
+
+
+    def pump(self, max_steps:int=1) -> None:
+        """
+        Método que se llama una vez por fotograma desde el hilo principal. Entrega las imágenes ya decodificadas y
+        luego construye las entidades del nivel de a poco.
+
+        Args:
+            max_steps (int, optional): Cantidad máxima de trabajos que se hacen en este fotograma. Defaults to 1.
+        """
+        if self.json_file is None or self._finished:
+            return
+
+        for _ in range(max_steps):
+            with self._lock:
+                item = self._decoded.pop(0) if self._decoded else None
+                decode_done = self._decode_done
+
+            if item is not None:
+                path, image_surface = item
+                if path == self.background_path:
+                    self.background = pygame.transform.scale(image_surface.convert(), (WIDTH, HEIGHT))
+                else:
+                    Assistant.provide_image(path, image_surface)
+                    self._provided_paths.append(path)
+            elif decode_done:
+                if self._build_steps is None:
+                    self.level = Level(self.json_file, False)
+                    self._build_steps = self.level.build_steps()
+                if next(self._build_steps, None) is None:
+                    self._finished = True
+                    self._release()
+                    break
+            else:
+                break
+
+
+    def is_ready(self, json_file:str) -> bool:
+        """
+        Método que indica si el nivel pedido ya está completamente preparado.
+
+        Args:
+            json_file (str): Archivo json del nivel.
+
+        Returns:
+            bool: True si el nivel ya está construido, False de lo contrario.
+        """
+        return self.json_file == json_file and self._finished
+
+
+    def take(self, json_file:str) -> tuple | None:
+        """
+        Método que entrega el nivel precargado. Si la precarga no terminó se completa en el momento, de modo que lo ya
+        decodificado se aprovecha igual.
+
+        Args:
+            json_file (str): Archivo json del nivel.
+
+        Returns:
+            tuple | None: Tupla (level, background, music) o None si ese nivel no se estaba precargando o no se pudo
+            construir.
+            "music" es un archivo en memoria o None si hay que cargarla desde el disco.
+        """
+        if self.json_file != json_file:
+            return None
+
+        self._thread.join()
+        while not self.is_ready(json_file):
+            self.pump(len(self._decoded) + 1)
+
+        if self.background is None:
+            self.background = pygame.image.load(self.background_path).convert()
+            self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+
+        preloaded = (self.level, self.background, self.music)
+        self.cancel()
+
+        if not preloaded[0].loaded:
+            return None
+        return preloaded
+
+
+    def _release(self) -> None:
+        """
+        Método que libera las imágenes crudas entregadas al Assistant, una vez que ya están cortadas en la caché.
+        """
+        Assistant.release_images(self._provided_paths)
+        self._provided_paths = []
+        self._build_steps = None
+
+
+    def cancel(self) -> None:
+        """
+        Método que descarta la precarga en curso y libera la memoria que ocupaba.
+        """
+        with self._lock:
+            self.json_file = None
+            self._decoded = []
+            self.memory_used = 0
+            self._decode_done = False
+        self._finished = False
+        self._release()
+        self.background = None
+        self.music = None
+        self.level = None
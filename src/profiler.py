@@ -0,0 +1,268 @@
+import os
+import csv
+import json
+import time
+import pygame
+from collections import deque
+from contextlib import nullcontext
+
+from config import *
+
+class ProfileScope:
+    """
+    Clase que mide cuánto tarda un bloque "with" y se lo suma a su nombre en el fotograma actual del Profiler.
+    """
+    __slots__ = ("name", "start")
+
+    def __init__(self, name:str) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            name (str): Nombre de la etapa, por ejemplo "player.update".
+        """
+        self.name = name
+        self.start = 0
+
+
+    def __enter__(self) -> "ProfileScope":
+        self.start = time.perf_counter()
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        Profiler.add(self.name, (time.perf_counter() - self.start) * 1000)
+
+
+class Profiler:
+    """
+    Clase que mide cuánto tarda cada etapa de los fotogramas. Las etapas se marcan con "with Profiler.scope(nombre):";
+    los tiempos de un mismo nombre dentro de un fotograma se suman (por ejemplo los pasos fijos de la simulación) y al
+    cerrar el fotograma se guardan en un historial del que salen los percentiles p50, p95 y p99. Las etapas pueden
+    estar anidadas, cada una informa su tiempo total.
+
+    Con F3 se muestra u oculta el panel con los tiempos y con F4 se exporta la traza a PROFILER_TRACE. Mientras está
+    apagado "scope" devuelve siempre el mismo contexto vacío, así que medir no cuesta nada.
+    """
+    enabled = False
+    frame_count = 0
+
+    _null_scope = nullcontext()
+    _scopes = {}
+    _frame = {}
+    _history = {}
+    _trace = deque(maxlen=PROFILER_TRACE_LIMIT)
+    _frame_start = 0
+    _font = None
+    _overlay = None
+    _overlay_time = 0
+
+    @staticmethod
+    def scope(name:str):
+        """
+        Método estático que devuelve el contexto que mide una etapa.
+
+        Args:
+            name (str): Nombre de la etapa.
+
+        Returns:
+            ProfileScope | nullcontext: Contexto para usar con "with".
+        """
+        if not Profiler.enabled:
+            return Profiler._null_scope
+        scope = Profiler._scopes.get(name)
+        if scope is None:
+            scope = ProfileScope(name)
+            Profiler._scopes[name] = scope
+        return scope
+
+
+    @staticmethod
+    def add(name:str, elapsed_ms:float) -> None:
+        """
+        Método estático que suma tiempo a una etapa en el fotograma actual.
+
+        Args:
+            name (str): Nombre de la etapa.
+            elapsed_ms (float): Milisegundos a sumar.
+        """
+        Profiler._frame[name] = Profiler._frame.get(name, 0) + elapsed_ms
+
+
+    @staticmethod
+    def toggle() -> bool:
+        """
+        Método estático que prende o apaga el Profiler. Al prenderlo se descarta el historial anterior.
+
+        Returns:
+            bool: True si quedó prendido.
+        """
+        Profiler.enabled = not Profiler.enabled
+        if Profiler.enabled:
+            Profiler.reset()
+        return Profiler.enabled
+
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Método estático que descarta el historial, la traza y el fotograma en curso. El fotograma en curso se cuenta
+        desde ahora, ya que al prenderlo a mitad de un fotograma "begin_frame" no lo marcó.
+        """
+        Profiler._frame_start = time.perf_counter()
+        Profiler.frame_count = 0
+        Profiler._frame.clear()
+        Profiler._history.clear()
+        Profiler._trace.clear()
+        Profiler._overlay = None
+
+
+    @staticmethod
+    def begin_frame() -> None:
+        """
+        Método estático que marca el comienzo de un fotograma.
+        """
+        if Profiler.enabled:
+            Profiler._frame_start = time.perf_counter()
+
+
+    @staticmethod
+    def end_frame() -> None:
+        """
+        Método estático que cierra el fotograma: guarda el tiempo de cada etapa y el total ("frame") en el historial y
+        en la traza.
+        """
+        if Profiler.enabled:
+            Profiler.add("frame", (time.perf_counter() - Profiler._frame_start) * 1000)
+            for name, elapsed_ms in Profiler._frame.items():
+                history = Profiler._history.get(name)
+                if history is None:
+                    history = deque(maxlen=PROFILER_HISTORY)
+                    Profiler._history[name] = history
+                history.append(elapsed_ms)
+                Profiler._trace.append((Profiler.frame_count, name, elapsed_ms))
+            Profiler._frame.clear()
+            Profiler.frame_count += 1
+
+
+    @staticmethod
+    def percentiles(name:str) -> dict | None:
+        """
+        Método estático que calcula los percentiles de una etapa sobre los últimos PROFILER_HISTORY fotogramas.
+
+        Args:
+            name (str): Nombre de la etapa.
+
+        Returns:
+            dict | None: Diccionario con "p50", "p95", "p99" en milisegundos y "count", None si la etapa no se midió.
+        """
+        history = Profiler._history.get(name)
+        if not history:
+            return None
+
+        values = sorted(history)
+        last = len(values) - 1
+        return {
+            "p50": values[round(last * 0.50)],
+            "p95": values[round(last * 0.95)],
+            "p99": values[round(last * 0.99)],
+            "count": len(values)
+        }
+
+
+    @staticmethod
+    def report() -> dict:
+        """
+        Método estático que resume todas las etapas medidas.
+
+        Returns:
+            dict: Diccionario nombre: percentiles, ordenado por p95 de mayor a menor.
+        """
+        summary = {name: Profiler.percentiles(name) for name in Profiler._history}
+        return dict(sorted(summary.items(), key=lambda item: -item[1]["p95"]))
+
+
+    @staticmethod
+    def export(path:str=PROFILER_TRACE) -> bool:
+        """
+        Método estático que guarda la traza para analizarla fuera del juego. Si la ruta termina en ".csv" se guarda
+        una fila por etapa y fotograma, si no un json con el resumen y la traza.
+
+        Args:
+            path (str, optional): Ruta del archivo. Defaults to PROFILER_TRACE.
+
+        Returns:
+            bool: True si se pudo guardar.
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            if path.endswith(".csv"):
+                with open(path, "w", newline="") as file:
+                    writer = csv.writer(file)
+                    writer.writerow(["frame", "scope", "ms"])
+                    writer.writerows((frame, name, round(elapsed_ms, 4)) for frame, name, elapsed_ms in Profiler._trace)
+            else:
+                with open(path, "w") as file:
+                    json.dump({
+                        "frames": Profiler.frame_count,
+                        "summary": Profiler.report(),
+                        "trace": [[frame, name, round(elapsed_ms, 4)] for frame, name, elapsed_ms in Profiler._trace]
+                    }, file, indent=2)
+            return True
+
+        except OSError:
+            return False
+
+
+    @staticmethod
+    def draw(window:pygame.Surface, position:tuple=(10, 60)) -> pygame.Rect | None:
+        """
+        Método estático que dibuja el panel con los percentiles de cada etapa. El panel se vuelve a componer cada
+        PROFILER_OVERLAY_MS milisegundos, el resto de los fotogramas es un único blit.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+            position (tuple, optional): Esquina superior izquierda del panel. Defaults to (10, 60).
+
+        Returns:
+            pygame.Rect | None: Zona de la ventana donde se dibujó, None si el Profiler está apagado.
+        """
+        if not Profiler.enabled or not isinstance(window, pygame.Surface):
+            return None
+
+        now = pygame.time.get_ticks()
+        if Profiler._overlay is None or now - Profiler._overlay_time >= PROFILER_OVERLAY_MS:
+            Profiler._overlay = Profiler.compose()
+            Profiler._overlay_time = now
+        return window.blit(Profiler._overlay, position)
+
+
+    @staticmethod
+    def compose() -> pygame.Surface:
+        """
+        Método estático que arma la superficie del panel con una línea por etapa.
+
+        Returns:
+            pygame.Surface: Panel con fondo semitransparente.
+        """
+        if Profiler._font is None:
+            Profiler._font = pygame.font.SysFont("monospace", 16)
+
+        lines = [f"{'etapa':<20}{'p50':>8}{'p95':>8}{'p99':>8}"]
+        for name, stats in Profiler.report().items():
+            lines.append(f"{name:<20}{stats['p50']:>8.2f}{stats['p95']:>8.2f}{stats['p99']:>8.2f}")
+
+        rendered = [Profiler._font.render(line, True, WHITE) for line in lines]
+        width = max(surface.get_width() for surface in rendered) + 12
+        height = sum(surface.get_height() for surface in rendered) + 12
+
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        y = 6
+        for surface in rendered:
+            overlay.blit(surface, (6, y))
+            y += surface.get_height()
+        return overlay
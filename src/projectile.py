@@ -1,55 +1,106 @@
 import pygame
 
 from config import *
+from spatial import SpatialGrid
+from sound_bank import SoundBank
+from assistant import Assistant
 
 class Projectile(pygame.sprite.Sprite):
     """
     Clase que instancia objetos de tipo Projectile que serán utilizados para disparar por el Player de este juego.
+    Todos los proyectiles comparten la misma imagen y el mismo sonido, que se cargan una sola vez.
 
     Args:
         pygame.sprite.Sprite (Clase Sprite): Hereda de la Biblioteca "pygame" y del modulo "sprite" la clase "Sprite".
     """
-    
-    def __init__(self, pos_x:int, pos_y:int) -> None:
+    shared_image = None
+    shared_sound = None
+
+    def __init__(self, pos_x:int, pos_y:int, pool=None) -> None:
         """
         Constructor de la clase.
 
         Args:
             pos_x (int): Un entero que representa la posición en el eje x en el cual comenzara el Projectile.
             pos_y (int): Un entero que representa la posición en el eje y en el cual comenzara el Projectile.
+            pool (ProjectilePool, optional): Pool al que vuelve el proyectil cuando se libera. Defaults to None.
         """
         super().__init__()
         """
         Constructor de la clase de la cual hereda la clase Projectile.
         """
         if isinstance(pos_x, int) and pos_x and isinstance(pos_y, int) and pos_y:
-            self.image = pygame.image.load(PATH_IMAGE+"Varios/Cositas/Enemies/Trunk/Bullet.png")
-            self.image = pygame.transform.scale(self.image, (30,30))
+            Projectile.load_shared()
+            self.image = Projectile.shared_image
             self.rect = self.image.get_rect()
             self.rect.center = (pos_x, pos_y)
             self.speed = 5
-            self.sound = pygame.mixer.Sound(PATH_SOUND+"disparo.mp3")
-            self.sound.set_volume(0.2)
-            self.sound.play()
+            self.sound = Projectile.shared_sound
+            self.pool = pool
+
+
+    @staticmethod
+    def load_shared() -> None:
+        """
+        Método estático que carga la imagen y el sonido de los proyectiles la primera vez que se necesitan.
+        """
+        if Projectile.shared_image is None:
+            image = Assistant.load_image(SHEET_BULLET)
+            Projectile.shared_image = pygame.transform.scale(image, (30,30))
+        if Projectile.shared_sound is None:
+            Projectile.shared_sound = SoundBank.get("disparo.mp3", 0.2)
+
+
+    @staticmethod
+    def clear_shared() -> None:
+        """
+        Método estático que libera la imagen y el sonido compartidos, se vuelven a cargar con el próximo proyectil.
+        Los proyectiles ya creados conservan los suyos.
+        """
+        Projectile.shared_image = None
+        Projectile.shared_sound = None
+
+
+    def fire(self, pos_x:int, pos_y:int, direction:int) -> None:
+        """
+        Método que reutiliza el proyectil para un disparo nuevo: lo ubica, le da la dirección y reproduce el sonido.
+
+        Args:
+            pos_x (int): Posición en el eje x del centro del proyectil.
+            pos_y (int): Posición en el eje y del centro del proyectil.
+            direction (int): DIRECTION_R o DIRECTION_L.
+        """
+        self.rect.center = (pos_x, pos_y)
+        self.speed = abs(self.speed) * direction
+        self.sound.play()
+
+
+    def release(self) -> None:
+        """
+        Método que saca el proyectil del juego y lo devuelve al pool (si tiene uno) para reutilizarlo.
+        """
+        if self.alive():
+            self.kill()
+            if self.pool is not None:
+                self.pool.recycle(self)
 
 
     def collided_enemy(self, enemy_list:list) -> None:
         """
         Método que verifica si el proyectil colisiono con un enemigo si es asi elimina el proyectil, reproduce el
-        sonido de muerte del enemigo y aplica gravedad al enemigo para que caiga fuera de la pantalla. 
+        sonido de muerte del enemigo y lo marca como golpeado para que caiga fuera de la pantalla. Solo se revisan
+        los enemigos cercanos al proyectil.
 
         Args:
             enemy_list (list): Lista de enemigos.
         """
         if isinstance(enemy_list, list) and enemy_list:
-            for enemy in enemy_list:
+            for enemy in SpatialGrid.nearby(enemy_list, self.rect):
                 if self.rect.colliderect(enemy.rect_collision_body):
                     enemy.was_hit = True
-                    self.kill()
-                    enemy.sound_death.play()
-                if enemy.was_hit:
-                    enemy.add_y(enemy.gravity)
                     enemy.move_x = 0
+                    self.release()
+                    enemy.archetype.sound_death.play()
 
 
     def collided_traps(self, traps_list:list) -> None:
@@ -60,9 +111,9 @@ class Projectile(pygame.sprite.Sprite):
             traps_list (list): Lista de trampas.
         """
         if isinstance(traps_list, list) and traps_list:
-            for trap in traps_list:
+            for trap in SpatialGrid.nearby(traps_list, self.rect):
                 if self.rect.colliderect(trap.rect):
-                    self.kill()
+                    self.release()
 
 
     def collided_platform(self, platform_list:list) -> None:
@@ -73,9 +124,9 @@ class Projectile(pygame.sprite.Sprite):
             platform_list (list): Lista de plataformas.
         """
         if isinstance(platform_list, list) and platform_list:
-            for platform in platform_list:
+            for platform in SpatialGrid.nearby(platform_list, self.rect):
                 if platform.collided and self.rect.colliderect(platform.rect):
-                    self.kill()
+                    self.release()
 
 
     def add_x(self, delta_x:int) -> None:
@@ -91,7 +142,8 @@ class Projectile(pygame.sprite.Sprite):
 
     def update(self, enemy_list:list, traps_list:list, platform_list:list) -> None:
         """
-        Método que se llama en cada iteración del bucle principal del juego, llama a los métodos de colisión.
+        Método que se llama en cada iteración del bucle principal del juego, llama a los métodos de colisión y
+        libera el proyectil cuando sale de la pantalla.
 
         Args:
             enemy_list (list): Lista de enemigos.
@@ -102,6 +154,115 @@ class Projectile(pygame.sprite.Sprite):
            isinstance(platform_list, list) and platform_list):
             self.collided_enemy(enemy_list)
             self.collided_traps(traps_list)
-            self.collided_traps(platform_list)
+            self.collided_platform(platform_list)
             self.add_x(self.speed)
-            
\ No newline at end of file
+
+            if self.rect.right < 0 or self.rect.left > WIDTH:
+                self.release()
+            
+
+class ProjectilePool(pygame.sprite.Group):
+    """
+    Grupo de proyectiles activos con proyectiles preasignados. Disparar toma un proyectil libre en lugar de crear uno
+    nuevo, y los proyectiles vuelven a estar libres cuando chocan o salen de la pantalla. Si todos están en uso se
+    reutiliza el más viejo.
+
+    Args:
+        pygame.sprite.Group (Clase Group): Hereda de la Biblioteca "pygame" y del modulo "sprite" la clase "Group".
+    """
+    def __init__(self, size:int=PROJECTILE_POOL_SIZE) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            size (int, optional): Cantidad de proyectiles preasignados. Defaults to PROJECTILE_POOL_SIZE.
+        """
+        super().__init__()
+        self.size = size
+        self.free = [Projectile(-WIDTH, -HEIGHT, self) for _ in range(size)]
+        self.fired = 0
+        self.recycled = 0
+        self.evicted = 0
+        self.peak = 0
+
+
+    def acquire(self, pos_x:int, pos_y:int, direction:int) -> Projectile:
+        """
+        Método que dispara un proyectil del pool.
+
+        Args:
+            pos_x (int): Posición en el eje x del centro del proyectil.
+            pos_y (int): Posición en el eje y del centro del proyectil.
+            direction (int): DIRECTION_R o DIRECTION_L.
+
+        Returns:
+            Projectile: El proyectil disparado.
+        """
+        if not self.free:
+            self.evicted += 1
+            self.sprites()[0].release()
+
+        projectile = self.free.pop()
+        self.add(projectile)
+        projectile.fire(pos_x, pos_y, direction)
+
+        self.fired += 1
+        self.peak = max(self.peak, len(self))
+        return projectile
+
+
+    def recycle(self, projectile:Projectile) -> None:
+        """
+        Método que recibe un proyectil liberado para volver a usarlo.
+
+        Args:
+            projectile (Projectile): Proyectil que ya salió del grupo.
+        """
+        self.free.append(projectile)
+        self.recycled += 1
+
+
+    def snapshot(self) -> list:
+        """
+        Método que devuelve la posición y la velocidad de los proyectiles activos, del más viejo al más nuevo.
+
+        Returns:
+            list: Lista de tuplas (x, y, speed).
+        """
+        return [(projectile.rect.x, projectile.rect.y, projectile.speed) for projectile in self.sprites()]
+
+
+    def restore(self, states:list) -> None:
+        """
+        Método que deja activos exactamente los proyectiles indicados, sin reproducir el sonido del disparo.
+
+        Args:
+            states (list): Lista de tuplas (x, y, speed) devuelta por "snapshot".
+        """
+        for projectile in self.sprites():
+            projectile.release()
+
+        for pos_x, pos_y, speed in states[-self.size:]:
+            projectile = self.free.pop()
+            self.add(projectile)
+            projectile.rect.topleft = (pos_x, pos_y)
+            projectile.speed = speed
+
+
+    def stats(self) -> dict:
+        """
+        Método que resume la ocupación del pool.
+
+        Returns:
+            dict: Diccionario con el tamaño, los proyectiles activos y libres, el pico de activos, los disparos,
+            los proyectiles devueltos y los que se reutilizaron estando activos.
+        """
+        return {
+            "size": self.size,
+            "active": len(self),
+            "free": len(self.free),
+            "peak": self.peak,
+            "fired": self.fired,
+            "recycled": self.recycled,
+            "evicted": self.evicted
+        }
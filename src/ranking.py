@@ -0,0 +1,189 @@
+import os
+import json
+import sqlite3
+
+from config import *
+
+class RankingStore:
+    """
+    Clase que guarda el ranking en una base SQLite. Cada partida ganada es una fila nueva y la tabla tiene un índice
+    ordenado por score (de mayor a menor) y tiempo (de menor a mayor), así agregar una partida cuesta O(log n) y pedir
+    los primeros puestos solo lee esas filas, sin ordenar nada. Cada escritura es una transacción, si el juego se
+    cierra a mitad de camino la base queda como estaba.
+
+    El tiempo se guarda en segundos; la primera vez que se abre la base se importa el ranking.json viejo.
+    """
+    def __init__(self, path:str=RANKING_DB, legacy_json:str=RANKING_JSON) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            path (str, optional): Ruta de la base. Defaults to RANKING_DB.
+            legacy_json (str, optional): Ruta del ranking en json a importar. Defaults to RANKING_JSON.
+        """
+        self.path = path
+        self.legacy_json = legacy_json
+        self.revision = 0
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS ranking (id INTEGER PRIMARY KEY, username TEXT NOT NULL, "
+                "game_time INTEGER NOT NULL, score INTEGER NOT NULL)")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS ranking_order ON ranking (score DESC, game_time ASC, id ASC)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.migrate()
+
+
+    @staticmethod
+    def parse_time(game_time) -> int:
+        """
+        Método estático que convierte el tiempo del ranking viejo ("mm:ss") a segundos.
+
+        Args:
+            game_time (str | int): Tiempo con el formato "mm:ss" o ya en segundos.
+
+        Returns:
+            int: Segundos.
+        """
+        if isinstance(game_time, int):
+            return game_time
+        minutes, seconds = str(game_time).split(":")
+        return int(minutes) * 60 + int(seconds)
+
+
+    @staticmethod
+    def format_time(seconds:int) -> str:
+        """
+        Método estático que muestra los segundos con el formato "mm:ss", los minutos pueden pasar de 99.
+
+        Args:
+            seconds (int): Segundos.
+
+        Returns:
+            str: Tiempo formateado.
+        """
+        return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+    def migrate(self) -> int:
+        """
+        Método que importa el ranking.json viejo, una sola vez y en una sola transacción. El archivo no se toca. Si no
+        se puede leer (por ejemplo quedó escrito a medias) no se importa nada y el error queda en "migration_error" y
+        en la tabla meta; como la importación no se marca como hecha, se vuelve a intentar al abrir la base otra vez.
+
+        Returns:
+            int: Cantidad de filas importadas.
+        """
+        self.migration_error = None
+        if self.connection.execute("SELECT 1 FROM meta WHERE key = 'migrated_json'").fetchone():
+            return 0
+
+        rows = []
+        if os.path.exists(self.legacy_json):
+            try:
+                with open(self.legacy_json, "r", encoding="utf-8") as file:
+                    ranking = json.load(file)
+                for data in ranking:
+                    rows.append((data["Username"], RankingStore.parse_time(data["Game_time"]), int(data["Score"])))
+            except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as error:
+                self.migration_error = f"No se pudo importar {self.legacy_json}: {error!r}"
+                with self.connection:
+                    self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrate_json_error', ?)",
+                                            (self.migration_error,))
+                return 0
+
+        with self.connection:
+            self.connection.executemany("INSERT INTO ranking (username, game_time, score) VALUES (?, ?, ?)", rows)
+            self.connection.execute("INSERT INTO meta (key, value) VALUES ('migrated_json', ?)", (str(len(rows)),))
+            self.connection.execute("DELETE FROM meta WHERE key = 'migrate_json_error'")
+        if rows:
+            self.revision += 1
+        return len(rows)
+
+
+    def insert(self, username:str, game_time:int, score:int) -> None:
+        """
+        Método que agrega una partida al ranking.
+
+        Args:
+            username (str): Nombre del jugador.
+            game_time (int): Segundos que tardó en terminar el juego.
+            score (int): Score total.
+        """
+        with self.connection:
+            self.connection.execute("INSERT INTO ranking (username, game_time, score) VALUES (?, ?, ?)",
+                                    (username, game_time, score))
+        self.revision += 1
+
+
+    def top(self, n:int=10, offset:int=0) -> list:
+        """
+        Método que devuelve los mejores puestos, en el orden del índice.
+
+        Args:
+            n (int, optional): Cantidad de puestos. Defaults to 10.
+            offset (int, optional): Puestos que se saltean desde el primero. Defaults to 0.
+
+        Returns:
+            list: Lista de diccionarios con "Username", "Game_time" ("mm:ss") y "Score", igual que el ranking viejo.
+        """
+        rows = self.connection.execute(
+            "SELECT username, game_time, score FROM ranking ORDER BY score DESC, game_time ASC, id ASC "
+            "LIMIT ? OFFSET ?", (n, offset))
+        return [{"Username": username, "Game_time": RankingStore.format_time(game_time), "Score": score}
+                for username, game_time, score in rows]
+
+
+    def page(self, size:int, after:tuple=None) -> tuple:
+        """
+        Método que devuelve una página del ranking a partir de la última fila de la anterior (paginación por clave).
+        La cota "score <= ?" hace que SQLite busque esa posición en el índice en lugar de recorrerlo desde el primer
+        puesto, así cualquier página cuesta lo mismo que la primera, sin importar cuántas filas haya antes.
+
+        Args:
+            size (int): Cantidad de filas de la página.
+            after (tuple, optional): Clave (score, game_time, id) de la última fila de la página anterior, None para
+            la primera página. Defaults to None.
+
+        Returns:
+            tuple: Lista de diccionarios como los de "top" y la clave para pedir la página siguiente, None si es la
+            última.
+        """
+        if after is None:
+            rows = self.connection.execute(
+                "SELECT username, game_time, score, id FROM ranking ORDER BY score DESC, game_time ASC, id ASC "
+                "LIMIT ?", (size + 1,)).fetchall()
+        else:
+            score, game_time, row_id = after
+            rows = self.connection.execute(
+                "SELECT username, game_time, score, id FROM ranking "
+                "WHERE score <= ? AND (score < ? OR game_time > ? OR (game_time = ? AND id > ?)) "
+                "ORDER BY score DESC, game_time ASC, id ASC LIMIT ?",
+                (score, score, game_time, game_time, row_id, size + 1)).fetchall()
+
+        cursor = None
+        if len(rows) > size:
+            rows = rows[:size]
+            username, game_time, score, row_id = rows[-1]
+            cursor = (score, game_time, row_id)
+        return ([{"Username": username, "Game_time": RankingStore.format_time(game_time), "Score": score}
+                 for username, game_time, score, _ in rows], cursor)
+
+
+    def count(self) -> int:
+        """
+        Método que devuelve la cantidad de partidas guardadas.
+
+        Returns:
+            int: Cantidad de filas.
+        """
+        return self.connection.execute("SELECT COUNT(*) FROM ranking").fetchone()[0]
+
+
+    def close(self) -> None:
+        """
+        Método que cierra la conexión con la base.
+        """
+        self.connection.close()
@@ -0,0 +1,71 @@
+import pygame
+
+class DirtyRenderer:
+    """
+    Clase que redibuja solo lo que cambia. La capa estática (fondo y plataformas) se compone una sola vez; en cada
+    fotograma se borran las zonas donde estaban las entidades copiando esa capa encima, se dibujan las entidades y se
+    actualizan en pantalla solo las zonas viejas y nuevas.
+    """
+    def __init__(self) -> None:
+        """
+        Constructor de la clase.
+        """
+        self.static = None
+        self.dirty = []
+        self.full = True
+
+
+    def set_static(self, surface:pygame.Surface) -> None:
+        """
+        Método que define la capa estática y fuerza a redibujar la ventana completa en el próximo fotograma.
+
+        Args:
+            surface (pygame.Surface): Capa estática del tamaño de la ventana.
+        """
+        if isinstance(surface, pygame.Surface):
+            self.static = surface
+            self.invalidate()
+
+
+    def invalidate(self) -> None:
+        """
+        Método que fuerza a redibujar la ventana completa en el próximo fotograma, por ejemplo al volver de otra
+        pantalla que dibujó encima.
+        """
+        self.full = True
+
+
+    def begin(self, window:pygame.Surface) -> None:
+        """
+        Método que prepara la ventana para dibujar las entidades: copia la capa estática completa o solo sobre las
+        zonas sucias del fotograma anterior.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+        """
+        if isinstance(window, pygame.Surface) and self.static is not None:
+            if self.full:
+                window.blit(self.static, (0, 0))
+            else:
+                for rect in self.dirty:
+                    window.blit(self.static, rect, rect)
+
+
+    def present(self, rects:list) -> list | None:
+        """
+        Método que cierra el fotograma y devuelve qué zonas hay que actualizar en pantalla.
+
+        Args:
+            rects (list): Zonas donde se dibujaron las entidades en este fotograma.
+
+        Returns:
+            list | None: Zonas del fotograma anterior y del actual, o None si hay que actualizar la ventana completa.
+        """
+        if self.full:
+            self.full = False
+            self.dirty = rects
+            return None
+
+        update_rects = self.dirty + rects
+        self.dirty = rects
+        return update_rects
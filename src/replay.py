@@ -0,0 +1,232 @@
+import os
+import time
+import struct
+import random
+import itertools
+import argparse
+import pygame
+
+from config import *
+
+#Teclas que lee el Player, cada una ocupa un bit de la máscara de un paso
+RECORD_KEYS = (pygame.K_UP, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE)
+
+class InputRecording:
+    """
+    Clase que graba las teclas de cada paso fijo de un nivel como una máscara de bits, junto con la semilla del azar
+    y el paso de tiempo. Como la simulación avanza en pasos fijos, volver a pasar la misma máscara paso a paso con la
+    misma semilla repite la partida exactamente.
+
+    El archivo es binario: una cabecera (firma, versión, semilla, milisegundos por paso y nivel) y luego las máscaras
+    agrupadas en tramos (máscara, cantidad de pasos), así mantener una tecla apretada ocupa tres bytes.
+    """
+    MAGIC = b"CMIY"
+    VERSION = 1
+    HEADER = struct.Struct("<4sBIHH")
+    RUN = struct.Struct("<BH")
+    MAX_RUN = 0xFFFF
+
+    def __init__(self, json_file:str, seed:int=None, dt_ms:int=FIXED_STEP_MS) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            json_file (str): Archivo json del nivel grabado.
+            seed (int, optional): Semilla del azar, si no se pasa se elige una. Defaults to None.
+            dt_ms (int, optional): Milisegundos que avanza cada paso. Defaults to FIXED_STEP_MS.
+        """
+        self.json_file = json_file
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.dt_ms = dt_ms
+        self.runs = []
+
+
+    def __len__(self) -> int:
+        """
+        Cantidad de pasos grabados.
+        """
+        return sum(count for _, count in self.runs)
+
+
+    def start(self) -> None:
+        """
+        Método que siembra el azar con la semilla de la grabación. Se llama justo antes del primer paso, al grabar y
+        al reproducir.
+        """
+        random.seed(self.seed)
+
+
+    @staticmethod
+    def mask(keys) -> int:
+        """
+        Método estático que convierte el estado del teclado en la máscara de bits de RECORD_KEYS.
+
+        Args:
+            keys (pygame.key.ScancodeWrapper): Teclas presionadas.
+
+        Returns:
+            int: Máscara con un bit por tecla presionada.
+        """
+        mask = 0
+        for bit, key in enumerate(RECORD_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+        return mask
+
+
+    @staticmethod
+    def keys(mask:int) -> set:
+        """
+        Método estático que convierte una máscara en el conjunto de teclas presionadas.
+
+        Args:
+            mask (int): Máscara de bits de RECORD_KEYS.
+
+        Returns:
+            set: Teclas presionadas, por ejemplo {pygame.K_RIGHT, pygame.K_SPACE}.
+        """
+        return {key for bit, key in enumerate(RECORD_KEYS) if mask & (1 << bit)}
+
+
+    def record(self, keys) -> None:
+        """
+        Método que agrega un paso a la grabación.
+
+        Args:
+            keys (pygame.key.ScancodeWrapper): Teclas presionadas en el paso.
+        """
+        mask = InputRecording.mask(keys)
+        if self.runs and self.runs[-1][0] == mask and self.runs[-1][1] < InputRecording.MAX_RUN:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+
+
+    def masks(self):
+        """
+        Generador que devuelve la máscara de cada paso grabado, en orden.
+
+        Yields:
+            int: Máscara del paso.
+        """
+        for mask, count in self.runs:
+            for _ in range(count):
+                yield mask
+
+
+    def save(self, path:str) -> bool:
+        """
+        Método que guarda la grabación en un archivo binario.
+
+        Args:
+            path (str): Ruta del archivo.
+
+        Returns:
+            bool: True si se pudo guardar.
+        """
+        name = self.json_file.encode("utf-8")
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(InputRecording.HEADER.pack(InputRecording.MAGIC, InputRecording.VERSION, self.seed,
+                                                      self.dt_ms, len(name)))
+                file.write(name)
+                file.write(struct.pack("<I", len(self.runs)))
+                for mask, count in self.runs:
+                    file.write(InputRecording.RUN.pack(mask, count))
+            return True
+        except OSError:
+            return False
+
+
+    @staticmethod
+    def load(path:str) -> "InputRecording | None":
+        """
+        Método estático que lee una grabación guardada con "save".
+
+        Args:
+            path (str): Ruta del archivo.
+
+        Returns:
+            InputRecording | None: La grabación, None si el archivo no existe o no es una grabación válida.
+        """
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+
+            magic, version, seed, dt_ms, name_length = InputRecording.HEADER.unpack_from(data, 0)
+            if magic != InputRecording.MAGIC or version != InputRecording.VERSION:
+                return None
+            offset = InputRecording.HEADER.size
+            json_file = data[offset:offset + name_length].decode("utf-8")
+            offset += name_length
+            (run_count,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+
+            recording = InputRecording(json_file, seed, dt_ms)
+            recording.runs = [list(run) for run in InputRecording.RUN.iter_unpack(
+                data[offset:offset + run_count * InputRecording.RUN.size])]
+            return recording
+
+        except (FileNotFoundError, struct.error, UnicodeDecodeError):
+            return None
+
+
+    def replay(self, simulation=None) -> dict:
+        """
+        Método que reproduce la grabación en una HeadlessSimulation, sin ventana y tan rápido como se pueda. Si la
+        simulación ya avanzó (por ejemplo tras "rewind" a un snapshot de esta misma grabación) la reproducción sigue
+        desde su paso actual, sin volver a sembrar el azar.
+
+        Args:
+            simulation (HeadlessSimulation, optional): Simulación a usar, si no se pasa se arma una con el nivel de la
+            grabación. Defaults to None.
+
+        Returns:
+            dict: Estado final de la simulación, ver "HeadlessSimulation.state".
+        """
+        from headless import HeadlessSimulation
+
+        if simulation is None:
+            simulation = HeadlessSimulation(self.json_file, self.dt_ms)
+        keys = {}
+
+        masks = self.masks()
+        if simulation.frame:
+            masks = itertools.islice(masks, simulation.frame, None)
+        else:
+            self.start()
+        for mask in masks:
+            if mask not in keys:
+                keys[mask] = HeadlessSimulation.make_keys(InputRecording.keys(mask))
+            if simulation.step(keys[mask]) != "playing":
+                break
+        return simulation.state()
+
+
+if __name__ == "__main__":
+    from profiler import Profiler
+
+    parser = argparse.ArgumentParser(description="Reproduce una grabación de teclas sin ventana.")
+    parser.add_argument("recording")
+    parser.add_argument("--repeat", type=int, default=1, help="Veces que se reproduce, para medir.")
+    parser.add_argument("--profile", help="Ruta (.csv o .json) donde exportar la traza del Profiler.")
+    args = parser.parse_args()
+
+    recording = InputRecording.load(args.recording)
+    if recording is None:
+        raise SystemExit(f"No se pudo leer la grabación {args.recording}")
+
+    if args.profile:
+        Profiler.toggle()
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        result = recording.replay()
+    seconds = time.perf_counter() - start
+
+    result["steps_per_second"] = round(args.repeat * result["frame"] / seconds)
+    print(result)
+    if args.profile:
+        Profiler.export(args.profile)
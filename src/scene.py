@@ -0,0 +1,236 @@
+import pygame
+
+from config import *
+from profiler import Profiler
+
+class Scene:
+    """
+    Clase base de las pantallas del juego. Cada pantalla carga sus recursos en "enter" y los libera en "exit", de modo que
+    al salir de ella no queda nada vivo.
+    """
+    def __init__(self, game) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            game (Game): Instancia del juego, da acceso a la ventana, las fuentes y el SceneManager.
+        """
+        self.game = game
+
+
+    def enter(self) -> None:
+        """
+        Método que se llama cuando la pantalla entra a la pila. Aquí se cargan los fondos, la música y las entidades.
+        """
+        pass
+
+
+    def exit(self) -> None:
+        """
+        Método que se llama cuando la pantalla sale de la pila. Aquí se liberan los recursos cargados en "enter".
+        """
+        pass
+
+
+    def pause(self) -> None:
+        """
+        Método que se llama cuando otra pantalla se apila encima de esta.
+        """
+        pass
+
+
+    def resume(self) -> None:
+        """
+        Método que se llama cuando la pantalla vuelve a quedar arriba de la pila.
+        """
+        pass
+
+
+    def handle_event(self, event:pygame.event.Event) -> None:
+        """
+        Método que recibe cada evento de pygame mientras la pantalla está arriba de la pila.
+
+        Args:
+            event (pygame.event.Event): Evento a procesar.
+        """
+        pass
+
+
+    def update(self, delta_ms:int) -> None:
+        """
+        Método que actualiza la lógica de la pantalla una vez por fotograma.
+
+        Args:
+            delta_ms (int): Variable que hace referencia al tiempo transcurrido desde que se actualizo la pantalla.
+        """
+        pass
+
+
+    def draw(self, window:pygame.Surface) -> list | None:
+        """
+        Método que dibuja la pantalla en la ventana una vez por fotograma.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+
+        Returns:
+            list | None: Zonas de la ventana que cambiaron, o None si hay que actualizar la ventana completa.
+        """
+        pass
+
+
+class SceneManager:
+    """
+    Clase que maneja la pila de pantallas con un único bucle plano. Los cambios de pantalla pedidos durante un fotograma
+    se aplican al final de ese fotograma, así ninguna pantalla se llama a sí misma ni a otra de forma recursiva.
+    """
+    def __init__(self, clock:pygame.time.Clock, fps:int=FPS) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            clock (pygame.time.Clock): Reloj con el que se limita la velocidad del bucle.
+            fps (int, optional): Fotogramas por segundo. Defaults to FPS.
+        """
+        self.clock = clock
+        self.fps = fps
+        self.stack = []
+        self._pending = []
+        self.running = False
+
+
+    @property
+    def top(self) -> Scene | None:
+        """
+        Pantalla que está arriba de la pila, o None si la pila está vacía.
+        """
+        return self.stack[-1] if self.stack else None
+
+
+    def push(self, scene:Scene) -> None:
+        """
+        Método que apila una pantalla encima de la actual, la actual queda pausada.
+
+        Args:
+            scene (Scene): Pantalla a apilar.
+        """
+        self._pending.append(("push", scene))
+
+
+    def pop(self) -> None:
+        """
+        Método que quita la pantalla de arriba y reanuda la que queda debajo.
+        """
+        self._pending.append(("pop", None))
+
+
+    def replace(self, scene:Scene) -> None:
+        """
+        Método que reemplaza la pantalla de arriba por otra.
+
+        Args:
+            scene (Scene): Pantalla nueva.
+        """
+        self._pending.append(("replace", scene))
+
+
+    def reset(self, scene:Scene) -> None:
+        """
+        Método que vacía toda la pila y deja solo la pantalla indicada.
+
+        Args:
+            scene (Scene): Pantalla que queda sola en la pila.
+        """
+        self._pending.append(("reset", scene))
+
+
+    def quit(self) -> None:
+        """
+        Método que vacía la pila, lo que termina el bucle principal.
+        """
+        self._pending.append(("quit", None))
+
+
+    def apply_pending(self) -> None:
+        """
+        Método que aplica los cambios de pantalla pedidos durante el fotograma, llamando a los hooks correspondientes.
+        """
+        while self._pending:
+            operation, scene = self._pending.pop(0)
+
+            if operation in ("pop", "replace") and self.stack:
+                self.stack.pop().exit()
+            elif operation in ("reset", "quit"):
+                while self.stack:
+                    self.stack.pop().exit()
+            elif operation == "push" and self.stack:
+                self.stack[-1].pause()
+
+            if scene is not None:
+                self.stack.append(scene)
+                scene.enter()
+            elif operation == "pop" and self.stack:
+                self.stack[-1].resume()
+
+
+    def run(self, scene:Scene, window:pygame.Surface) -> None:
+        """
+        Método con el bucle principal del juego. Corre hasta que la pila queda vacía.
+
+        Args:
+            scene (Scene): Primera pantalla.
+            window (pygame.Surface): Es la ventana principal del juego.
+        """
+        self.push(scene)
+        self.apply_pending()
+        self.running = True
+
+        while self.running and self.stack:
+            delta_ms = self.clock.tick(self.fps)
+            Profiler.begin_frame()
+            rects = self.step(delta_ms, pygame.event.get(), window)
+            with Profiler.scope("display.update"):
+                if rects is None:
+                    pygame.display.update()
+                elif rects:
+                    pygame.display.update(rects)
+            Profiler.end_frame()
+
+        self.running = False
+
+
+    def step(self, delta_ms:int, events:list, window:pygame.Surface | None) -> list | None:
+        """
+        Método que avanza un fotograma de la pantalla de arriba: eventos, lógica y dibujo. Las teclas F3 (mostrar u
+        ocultar el Profiler) y F4 (exportar su traza) se atienden aquí para todas las pantallas.
+
+        Args:
+            delta_ms (int): Variable que hace referencia al tiempo transcurrido desde que se actualizo la pantalla.
+            events (list): Eventos de pygame de este fotograma.
+            window (pygame.Surface | None): Ventana donde dibujar, None para no dibujar.
+
+        Returns:
+            list | None: Zonas de la ventana que cambiaron según la pantalla, None para actualizar la ventana completa.
+        """
+        scene = self.top
+
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.quit()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                Profiler.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                Profiler.export()
+            else:
+                scene.handle_event(event)
+
+        with Profiler.scope("update"):
+            scene.update(delta_ms)
+
+        rects = None
+        if window is not None:
+            with Profiler.scope("draw"):
+                rects = scene.draw(window)
+
+        self.apply_pending()
+        return rects
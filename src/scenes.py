@@ -0,0 +1,645 @@
+import pygame
+import os
+from collections import OrderedDict
+
+from config import *
+from scene import Scene
+from renderer import DirtyRenderer
+from hud import Hud
+from profiler import Profiler
+from replay import InputRecording
+
+class MainScene(Scene):
+    """
+    Pantalla principal que se muestra al ejecutar el juego, con botones de "Play", "Controls" y "Exit".
+    """
+    def enter(self) -> None:
+        """
+        Carga el fondo, arranca la música del menú, libera el punto de control del último nivel jugado y empieza a
+        precargar el nivel 1.
+        """
+        self.game.drop_checkpoints()
+        self.background = pygame.image.load(PATH_IMAGE + "Fondos/fondo_principal.jpg").convert()
+        self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+
+        pygame.mixer.music.load(PATH_SOUND+"Sound_menu.ogg")
+        pygame.mixer.music.set_volume(0.1)
+        pygame.mixer.music.play(-1)
+
+        self.ranking_hint = self.game.font.render("R: Ranking", True, WHITE)
+
+        self.game.preload_level(0)
+
+
+    def exit(self) -> None:
+        """
+        Libera el fondo y el texto.
+        """
+        self.background = None
+        self.ranking_hint = None
+
+
+    def handle_event(self, event:pygame.event.Event) -> None:
+        """
+        Maneja los clicks sobre los botones y la tecla "r" que muestra el ranking.
+
+        Args:
+            event (pygame.event.Event): Evento a procesar.
+        """
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+            self.game.scenes.push(LeaderboardScene(self.game))
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            buttons = self.game.main_screen_buttons
+            for button in buttons:
+                if button.rect.collidepoint(event.pos):
+                    if button == buttons[0]:
+                        self.game.scenes.replace(LevelScene(self.game, 0))
+                    if button == buttons[1]:
+                        self.game.scenes.push(ControlsScene(self.game))
+                    if button == buttons[2]:
+                        self.game.scenes.quit()
+
+
+    def update(self, delta_ms:int) -> None:
+        """
+        Avanza la precarga del nivel 1.
+
+        Args:
+            delta_ms (int): Variable que hace referencia al tiempo transcurrido desde que se actualizo la pantalla.
+        """
+        self.game.preloader.pump()
+
+
+    def draw(self, window:pygame.Surface) -> None:
+        """
+        Dibuja el fondo, los botones y el aviso del ranking.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+        """
+        self.game.render(self.game.main_screen_buttons, self.background)
+        window.blit(self.ranking_hint, self.ranking_hint.get_rect(bottomright=(WIDTH - 20, HEIGHT - 10)))
+
+
+class ControlsScene(Scene):
+    """
+    Pantalla donde se muestran los controles a usar en el juego, se apila encima de la pantalla principal.
+    """
+    def enter(self) -> None:
+        """
+        Carga el fondo.
+        """
+        self.background = pygame.image.load(PATH_IMAGE + "Fondos/fondo_controlss.jpg").convert()
+        self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+
+
+    def exit(self) -> None:
+        """
+        Libera el fondo.
+        """
+        self.background = None
+
+
+    def handle_event(self, event:pygame.event.Event) -> None:
+        """
+        El botón "Back" vuelve a la pantalla principal.
+
+        Args:
+            event (pygame.event.Event): Evento a procesar.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            for button in self.game.controls_screen_buttons:
+                if button.rect.collidepoint(event.pos):
+                    self.game.scenes.pop()
+
+
+    def draw(self, window:pygame.Surface) -> None:
+        """
+        Dibuja el fondo y los botones.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+        """
+        self.game.render(self.game.controls_screen_buttons, self.background)
+
+
+class LevelScene(Scene):
+    """
+    Pantalla de un nivel. Qué nivel se juega lo define su descripción en "game.levels", así que todos los niveles usan
+    este mismo bucle. Se instancian todos los objetos que intervendrán en el juego, se muestra el tiempo desde que se
+    empezó la partida, la cantidad de vidas y el score acumulado.
+    """
+    def __init__(self, game, index:int) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            game (Game): Instancia del juego.
+            index (int): Posición del nivel en la lista "game.levels".
+        """
+        super().__init__(game)
+        self.index = index
+        self.descriptor = game.levels[index]
+
+
+    def enter(self) -> None:
+        """
+        Construye el nivel (o toma el precargado), compone el fondo con las plataformas en una sola capa y empieza a
+        precargar el siguiente. El primer nivel reinicia el cronómetro y los scores de la partida.
+        """
+        self.level, background = self.game.load_level(self.descriptor)
+        self.background = self.level.bake_static(background, self.descriptor["background"])
+        self.renderer = DirtyRenderer()
+        self.renderer.set_static(self.background)
+        self.hud = Hud(self.game.font)
+        self.pause_start = 0
+        self.accumulator = 0
+        self.alpha = 1
+        self.recording = None
+
+        if RECORD_INPUTS:
+            self.recording = InputRecording(self.descriptor["json_file"])
+            self.recording.start()
+
+        if self.index == 0:
+            self.game.start_time = pygame.time.get_ticks()
+            self.game.elapsed_time = 0
+            self.game.scores = []
+
+        del self.game.scores[self.index:]
+        self.game.scores.append(0)
+        self.score = self.game.score_total
+
+        self.game.preload_level(self.index + 1)
+
+
+    def exit(self) -> None:
+        """
+        Libera el nivel, el fondo, la capa estática y el HUD. Si se estaban grabando las teclas guarda la grabación
+        en PATH_REPLAYS.
+        """
+        if self.recording is not None and len(self.recording):
+            name = os.path.splitext(os.path.basename(self.descriptor["json_file"]))[0]
+            self.recording.save(os.path.join(PATH_REPLAYS, f"{name}_{self.recording.seed}.rec"))
+        self.recording = None
+        self.level = None
+        self.background = None
+        self.renderer = None
+        self.hud = None
+
+
+    def pause(self) -> None:
+        """
+        Guarda el momento en que se pausó para no contar ese tiempo.
+        """
+        self.pause_start = pygame.time.get_ticks()
+
+
+    def resume(self) -> None:
+        """
+        Descuenta del cronómetro el tiempo que el juego estuvo pausado y redibuja la ventana completa, ya que la
+        pausa dibujó encima.
+        """
+        self.game.start_time += pygame.time.get_ticks() - self.pause_start
+        self.renderer.invalidate()
+
+
+    def next_scene(self) -> Scene:
+        """
+        Método que devuelve la pantalla que sigue al terminar el nivel: el siguiente nivel o, si era el último, la
+        pantalla del ganador.
+
+        Returns:
+            Scene: Pantalla siguiente.
+        """
+        if self.index + 1 < len(self.game.levels):
+            return LevelScene(self.game, self.index + 1)
+        return WinnerScene(self.game)
+
+
+    def handle_event(self, event:pygame.event.Event) -> None:
+        """
+        La tecla "esc" apila la pantalla de pausa.
+
+        Args:
+            event (pygame.event.Event): Evento a procesar.
+        """
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.game.scenes.push(PauseScene(self.game))
+
+
+    def update(self, delta_ms:int) -> None:
+        """
+        Actualiza todas las entidades del nivel y cambia de pantalla si el Player perdió o recolectó todo.
+        La simulación avanza en pasos fijos de FIXED_STEP_MS: el tiempo del fotograma se acumula y se simulan tantos
+        pasos como entren, así el juego se comporta igual sin importar los fotogramas por segundo. Si RECORD_INPUTS
+        está activo se graban las teclas de cada paso.
+
+        Args:
+            delta_ms (int): Variable que hace referencia al tiempo transcurrido desde que se actualizo la pantalla.
+        """
+        keys = pygame.key.get_pressed()
+        self.game.preloader.pump()
+
+        self.game.elapsed_time = (pygame.time.get_ticks() - self.game.start_time) // 1000
+
+        self.accumulator += min(delta_ms, MAX_FRAME_MS)
+        while self.accumulator >= FIXED_STEP_MS:
+            if self.recording is not None:
+                self.recording.record(keys)
+            self.level.update(FIXED_STEP_MS, keys)
+            self.accumulator -= FIXED_STEP_MS
+        self.alpha = self.accumulator / FIXED_STEP_MS
+
+        self.game.scores[self.index] = self.level.score
+        self.score = self.game.score_total
+
+        if self.level.is_lost():
+            self.game.scenes.replace(GameOverScene(self.game))
+        elif self.level.is_cleared():
+            self.game.drop_checkpoints()
+            self.game.scenes.replace(self.next_scene())
+
+
+    def draw(self, window:pygame.Surface) -> list | None:
+        """
+        Dibuja el tiempo, las entidades, las vidas y el score sobre la capa estática (fondo y plataformas). Solo se
+        repinta la capa estática donde había algo en el fotograma anterior, y el HUD solo vuelve a componer un texto
+        cuando cambia su valor.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+
+        Returns:
+            list | None: Zonas de la ventana que cambiaron, None si se redibujó completa.
+        """
+        with Profiler.scope("static.restore"):
+            self.renderer.begin(window)
+        with Profiler.scope("hud"):
+            rects = [self.hud.draw_timer(window, self.game.elapsed_time)]
+        rects.extend(self.level.draw(window, self.alpha, False))
+        with Profiler.scope("hud"):
+            rects.extend(self.hud.draw_status(window, self.level.lives, self.score))
+        rects.append(Profiler.draw(window))
+
+        return self.renderer.present([rect for rect in rects if rect is not None])
+
+
+class LeaderboardScene(Scene):
+    """
+    Pantalla con el ranking, se apila encima de la pantalla principal o de la de volver a jugar. Muestra una página de
+    RANKING_PAGE_SIZE puestos, con las flechas se pasa de página y con "esc", "enter" o el botón "Back" se vuelve.
+
+    Solo se consulta la página visible (ver RankingStore.page). Las filas de cada página se dibujan en una franja que
+    queda guardada entre aperturas, pero solo las RANKING_PAGE_CACHE usadas más recientemente; de las demás se guarda
+    la clave para volver a consultarlas. Las franjas y las claves se descartan cuando llega un score nuevo, que es lo
+    único que cambia el orden.
+    """
+    _revision = None
+    _pages = OrderedDict()
+    _cursors = [None]
+
+    def enter(self) -> None:
+        """
+        Carga el fondo y el título, descarta las páginas guardadas si el ranking cambió y muestra la primera página.
+        """
+        self.background = pygame.image.load(PATH_IMAGE + "Fondos/fondo.jpg").convert()
+        self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+        self.title = self.game.font.render("Ranking", True, WHITE)
+
+        if LeaderboardScene._revision != self.game.ranking.revision:
+            LeaderboardScene._revision = self.game.ranking.revision
+            LeaderboardScene._pages.clear()
+            LeaderboardScene._cursors = [None]
+        self.page_index = 0
+        self.load_page()
+
+
+    def exit(self) -> None:
+        """
+        Libera el fondo y los textos. Las páginas quedan guardadas para la próxima vez.
+        """
+        self.background = None
+        self.title = None
+        self.surface = None
+        self.navigation = None
+
+
+    def load_page(self) -> None:
+        """
+        Método que toma la franja de la página actual, si no está guardada consulta solo esas filas y la dibuja. Si
+        se superan RANKING_PAGE_CACHE franjas se descarta la usada hace más tiempo.
+        """
+        pages = LeaderboardScene._pages
+        cursors = LeaderboardScene._cursors
+        self.surface = pages.get(self.page_index)
+
+        if self.surface is not None:
+            pages.move_to_end(self.page_index)
+        else:
+            rows, cursor = self.game.ranking.page(RANKING_PAGE_SIZE, cursors[self.page_index])
+            if self.page_index + 1 == len(cursors):
+                cursors.append(cursor)
+            self.surface = self.render_page(rows, self.page_index * RANKING_PAGE_SIZE + 1)
+            pages[self.page_index] = self.surface
+            if len(pages) > RANKING_PAGE_CACHE:
+                pages.popitem(last=False)
+
+        has_next = cursors[self.page_index + 1] is not None
+        navigation = f"{'<  ' if self.page_index else '   '}Pagina {self.page_index + 1}{'  >' if has_next else ''}"
+        self.navigation = self.game.font.render(navigation, True, WHITE)
+
+
+    def render_page(self, rows:list, first:int) -> pygame.Surface:
+        """
+        Método que dibuja una fila por puesto de una página.
+
+        Args:
+            rows (list): Filas de la página, ver RankingStore.page.
+            first (int): Puesto de la primera fila.
+
+        Returns:
+            pygame.Surface: Franja transparente con las filas, se dibuja en (200, 150).
+        """
+        font = self.game.font
+        surface = pygame.Surface((WIDTH - 400, RANKING_PAGE_SIZE * RANKING_ROW_HEIGHT), pygame.SRCALPHA)
+
+        y = 0
+        if not rows:
+            surface.blit(font.render("Todavia no hay partidas", True, WHITE), (0, y))
+        for position, data in enumerate(rows, first):
+            surface.blit(font.render(f"{position}.", True, WHITE), (0, y))
+            surface.blit(font.render(data["Username"][:16], True, WHITE), (90, y))
+            surface.blit(font.render(data["Game_time"], True, WHITE), (540, y))
+            score = font.render(str(data["Score"]), True, WHITE)
+            surface.blit(score, score.get_rect(topright=(surface.get_width(), y)))
+            y += RANKING_ROW_HEIGHT
+        return surface
+
+
+    def handle_event(self, event:pygame.event.Event) -> None:
+        """
+        Maneja las flechas, las teclas para volver y el click sobre el botón "Back".
+
+        Args:
+            event (pygame.event.Event): Evento a procesar.
+        """
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RIGHT and LeaderboardScene._cursors[self.page_index + 1] is not None:
+                self.page_index += 1
+                self.load_page()
+            elif event.key == pygame.K_LEFT and self.page_index > 0:
+                self.page_index -= 1
+                self.load_page()
+            elif event.key in (pygame.K_ESCAPE, pygame.K_RETURN):
+                self.game.scenes.pop()
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            for button in self.game.leaderboard_buttons:
+                if button.rect.collidepoint(event.pos):
+                    self.game.scenes.pop()
+
+
+    def draw(self, window:pygame.Surface) -> None:
+        """
+        Dibuja el fondo, el título, las filas de la página actual, la navegación y el botón.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+        """
+        self.game.render(self.game.leaderboard_buttons, self.background)
+        window.blit(self.title, (200, 60))
+        window.blit(self.surface, (200, 150))
+        window.blit(self.navigation, self.navigation.get_rect(midtop=(WIDTH // 2, 680)))
+
+
+class PauseScene(Scene):
+    """
+    Pantalla de pausa, se apila sobre el nivel presionando la tecla "esc". Tiene botones para volver al menu principal,
+    para silenciar la música de fondo del nivel, para volver activar el sonido y para reanudar el juego.
+    """
+    def enter(self) -> None:
+        """
+        Carga el fondo semitransparente y el texto de pausa.
+        """
+        self.background = pygame.image.load(PATH_IMAGE + "Fondos/window_pause.png")
+        self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+        self.text_surface = self.game.font_pause.render("Pause", True, (BLACK))
+
+
+    def exit(self) -> None:
+        """
+        Libera el fondo y el texto.
+        """
+        self.background = None
+        self.text_surface = None
+
+
+    def handle_event(self, event:pygame.event.Event) -> None:
+        """
+        Maneja la tecla "esc" y los clicks sobre los botones.
+
+        Args:
+            event (pygame.event.Event): Evento a procesar.
+        """
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.game.scenes.pop()
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            buttons = self.game.pause_screen_buttons
+            for button in buttons:
+                if button.rect.collidepoint(event.pos):
+                    if button == buttons[0]:
+                        self.game.scenes.pop()
+                    if button == buttons[1]:
+                        pygame.mixer.music.play()
+                    if button == buttons[2]:
+                        pygame.mixer.music.stop()
+                    if button == buttons[3]:
+                        self.game.scenes.reset(MainScene(self.game))
+
+
+    def draw(self, window:pygame.Surface) -> None:
+        """
+        Dibuja el texto de pausa, el fondo y los botones encima del último fotograma del nivel.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+        """
+        text_rect = self.text_surface.get_rect(center=(WIDTH // 2, HEIGHT // 7))
+        window.blit(self.text_surface, text_rect)
+        self.game.render(self.game.pause_screen_buttons, self.background)
+
+
+class GameOverScene(Scene):
+    """
+    Pantalla que se muestra si el player perdió sus 3 vidas.
+    """
+    def enter(self) -> None:
+        """
+        Carga el fondo y arranca la música de game over.
+        """
+        self.background = pygame.image.load(PATH_IMAGE + "Fondos/fondo_game_over.jpg").convert()
+        self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+
+        pygame.mixer.music.load(PATH_SOUND+"sound_game_over.mp3")
+        pygame.mixer.music.set_volume(0.1)
+        pygame.mixer.music.play(-1)
+
+
+    def exit(self) -> None:
+        """
+        Libera el fondo.
+        """
+        self.background = None
+
+
+    def handle_event(self, event:pygame.event.Event) -> None:
+        """
+        "Yes" vuelve a empezar desde el nivel 1, "No" vuelve al menu principal.
+
+        Args:
+            event (pygame.event.Event): Evento a procesar.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            buttons = self.game.screen_game_over_buttons
+            for button in buttons:
+                if button.rect.collidepoint(event.pos):
+                    if button == buttons[0]:
+                        self.game.scenes.replace(LevelScene(self.game, 0))
+                    if button == buttons[1]:
+                        self.game.scenes.reset(MainScene(self.game))
+
+
+    def draw(self, window:pygame.Surface) -> None:
+        """
+        Dibuja el fondo y los botones.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+        """
+        self.game.render(self.game.screen_game_over_buttons, self.background)
+
+
+class WinnerScene(Scene):
+    """
+    Pantalla que se muestra luego de ganar todos los niveles y pide el nombre del usuario para guardarlo junto
+    con el tiempo que tardo en terminar el juego y los puntos que hizo durante todo el juego.
+    """
+    def enter(self) -> None:
+        """
+        Carga el fondo, arranca la música y prepara el campo de texto.
+        """
+        self.background = pygame.image.load(PATH_IMAGE + "Fondos/fondo_winner.jpg").convert()
+        self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+
+        pygame.mixer.music.load(PATH_SOUND+"winner.mp3")
+        pygame.mixer.music.set_volume(0.5)
+        pygame.mixer.music.play()
+
+        self.username = ""
+        self.input_rect = pygame.Rect(400, 570, 400, 50)
+
+
+    def exit(self) -> None:
+        """
+        Libera el fondo.
+        """
+        self.background = None
+
+
+    def handle_event(self, event:pygame.event.Event) -> None:
+        """
+        Maneja la escritura del nombre y la tecla "enter" que guarda el ranking y lo muestra.
+
+        Args:
+            event (pygame.event.Event): Evento a procesar.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.input_rect.collidepoint(event.pos):
+                self.game.active = True
+            else:
+                self.game.active = False
+
+        if event.type == pygame.KEYDOWN:
+            if self.game.active:
+                if event.key == pygame.K_BACKSPACE:
+                    self.username = self.username[:-1]
+                else:
+                    self.username += event.unicode
+            if event.key == pygame.K_RETURN:
+                self.game.upload_json(self.username, self.game.elapsed_time, self.game.score_total)
+                self.game.scenes.replace(PlayAgainScene(self.game))
+                self.game.scenes.push(LeaderboardScene(self.game))
+
+
+    def draw(self, window:pygame.Surface) -> None:
+        """
+        Dibuja el fondo y el campo de texto con el nombre.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+        """
+        window.blit(self.background, self.background.get_rect())
+
+        if self.game.active:
+            color = self.game.color_active
+        else:
+            color = self.game.color_passive
+
+        pygame.draw.rect(window, color, self.input_rect, 2)
+
+        text_surface = self.game.font.render(self.username, True, WHITE)
+        window.blit(text_surface, (self.input_rect.x + 5, self.input_rect.y-2))
+
+        self.input_rect.w = max(400, text_surface.get_width()+9)
+
+
+class PlayAgainScene(Scene):
+    """
+    Pantalla que se muestra luego de ingresar el nombre del usuario. Tiene botones para reiniciar el juego y para
+    volver al menu principal.
+    """
+    def enter(self) -> None:
+        """
+        Carga el fondo.
+        """
+        self.background = pygame.image.load(PATH_IMAGE + "Fondos/fondo.jpg").convert()
+        self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+
+
+    def exit(self) -> None:
+        """
+        Libera el fondo.
+        """
+        self.background = None
+
+
+    def handle_event(self, event:pygame.event.Event) -> None:
+        """
+        "Yes" vuelve a empezar desde el nivel 1, "No" vuelve al menu principal.
+
+        Args:
+            event (pygame.event.Event): Evento a procesar.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            buttons = self.game.play_again_buttons
+            for button in buttons:
+                if button.rect.collidepoint(event.pos):
+                    if button == buttons[0]:
+                        self.game.scenes.replace(LevelScene(self.game, 0))
+                    if button == buttons[1]:
+                        self.game.scenes.reset(MainScene(self.game))
+
+
+    def draw(self, window:pygame.Surface) -> None:
+        """
+        Dibuja el fondo y los botones.
+
+        Args:
+            window (pygame.Surface): Es la ventana principal del juego.
+        """
+        self.game.render(self.game.play_again_buttons, self.background)
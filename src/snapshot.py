@@ -0,0 +1,187 @@
+import random
+import struct
+
+#Nombres de las animaciones de cada arquetipo, el snapshot guarda la posición de la animación actual en la tupla
+PLAYER_ANIMATIONS = ("still_r", "still_l", "walking_r", "walking_l", "jumping_r", "jumping_l")
+ENEMY_ANIMATIONS = ("still_r", "still_l", "walking_r", "walking_l", "running_r", "running_l")
+
+class LevelSnapshot:
+    """
+    Clase que guarda el estado vivo de un nivel (Players y sus proyectiles, enemigos, frutas que quedan, trampas y un
+    reloj) en un bloque binario compacto, y lo vuelve a aplicar sobre el mismo nivel. Restaurar solo copia números a
+    las entidades que ya existen, sin leer el disco ni construir nada, así que cuesta lo mismo que recorrerlas.
+
+    Sirve para reintentar un nivel al instante, para guardar puntos de control y para saltar hacia atrás en una
+    reproducción. Para esto último el snapshot puede llevar también el estado del azar (las reapariciones de los
+    enemigos lo usan), así la reproducción sigue igual que la grabación desde ese punto.
+    """
+    MAGIC = b"CMIS"
+    VERSION = 2
+    HEADER = struct.Struct("<4sBqHHHH?")
+    RANDOM = struct.Struct("<625I?d")
+    PLAYER = struct.Struct("<19i5?B")
+    PROJECTILE = struct.Struct("<3i")
+    ENEMY = struct.Struct("<18i3?")
+    COLLECTIBLE = struct.Struct("<5i?")
+    TRAP = struct.Struct("<2i")
+
+    @staticmethod
+    def animation_index(archetype, names:tuple, animation) -> int:
+        """
+        Método estático que busca qué animación del arquetipo es la actual.
+
+        Args:
+            archetype (Archetype): Arquetipo de la entidad.
+            names (tuple): Nombres de las animaciones del arquetipo.
+            animation (tuple): Animación actual de la entidad.
+
+        Returns:
+            int: Posición del nombre en "names", 0 si no se encontró.
+        """
+        for index, name in enumerate(names):
+            if getattr(archetype, name) is animation:
+                return index
+        return 0
+
+
+    @staticmethod
+    def capture(level, clock:int=0, rng:bool=False) -> bytes:
+        """
+        Método estático que toma el snapshot de un nivel.
+
+        Args:
+            level (Level): Nivel ya construido.
+            clock (int, optional): Milisegundos de juego que se guardan junto al estado. Defaults to 0.
+            rng (bool, optional): True para guardar también el estado del módulo "random". Defaults to False.
+
+        Returns:
+            bytes: El snapshot.
+        """
+        for store in (level.trap_store, level.collectible_store):
+            if store is not None:
+                store.sync()
+
+        built_index = {id(collectible): index for index, collectible in enumerate(level.built_collectibles)}
+        parts = [LevelSnapshot.HEADER.pack(LevelSnapshot.MAGIC, LevelSnapshot.VERSION, clock, len(level.players),
+                                           len(level.enemies), len(level.collectibles), len(level.traps), rng)]
+        if rng:
+            _, internal, gauss = random.getstate()
+            parts.append(LevelSnapshot.RANDOM.pack(*internal, gauss is not None, gauss or 0.0))
+
+        for player in level.players:
+            projectiles = player.projectile.snapshot()
+            parts.append(LevelSnapshot.PLAYER.pack(
+                player.rect.x, player.rect.y, player.rect_collision_feet.x, player.rect_collision_feet.y,
+                player.rect_collision_body.x, player.rect_collision_body.y, player.frame, player.direction,
+                LevelSnapshot.animation_index(player.archetype, PLAYER_ANIMATIONS, player.animation),
+                player.move_x, player.move_y, player.lives, player.score, player.y_start_jump,
+                player.animation_elapsed_time, player.movement_elapsed_time, player.hit_cooldown, player.prev_x,
+                player.prev_y, player.is_jumping, player.falling, player.is_shooting, player.facing_right,
+                player.can_shooting, len(projectiles)))
+            for projectile in projectiles:
+                parts.append(LevelSnapshot.PROJECTILE.pack(*projectile))
+
+        for enemy in level.enemies:
+            parts.append(LevelSnapshot.ENEMY.pack(
+                enemy.rect.x, enemy.rect.y, enemy.rect_collision_head.x, enemy.rect_collision_head.y,
+                enemy.rect_collision_body.x, enemy.rect_collision_body.y, enemy.rect_collision_feet.x,
+                enemy.rect_collision_feet.y, enemy.frame, enemy.direction,
+                LevelSnapshot.animation_index(enemy.archetype, ENEMY_ANIMATIONS, enemy.animation),
+                enemy.move_x, enemy.movement_elapsed_time, enemy.animation_elapsed_time, enemy.patrol_wait_time,
+                enemy.elapsed_time_of_death, enemy.prev_x, enemy.prev_y, enemy.was_hit, enemy.is_falling,
+                enemy.patrol_state == "moving"))
+
+        for collectible in level.collectibles:
+            parts.append(LevelSnapshot.COLLECTIBLE.pack(
+                built_index[id(collectible)], collectible.frame, collectible.animation_elapsed_time,
+                collectible.collected_elapsed_time, int(collectible.animation is collectible.archetype.image_collected),
+                collectible.collected))
+
+        for trap in level.traps:
+            parts.append(LevelSnapshot.TRAP.pack(trap.frame, trap.animation_elapsed_time))
+
+        return b"".join(parts)
+
+
+    @staticmethod
+    def restore(level, data:bytes) -> int | None:
+        """
+        Método estático que vuelve a dejar el nivel como estaba cuando se tomó el snapshot. El nivel tiene que ser
+        el mismo (mismos Players, enemigos y trampas), las frutas recolectadas después vuelven a aparecer. Si el
+        snapshot guardó el azar, también se restaura.
+
+        Args:
+            level (Level): Nivel sobre el que se tomó el snapshot.
+            data (bytes): Snapshot devuelto por "capture".
+
+        Returns:
+            int | None: El reloj guardado en el snapshot, None si el snapshot no corresponde a este nivel.
+        """
+        try:
+            magic, version, clock, players, enemies, collectibles, traps, rng = \
+                LevelSnapshot.HEADER.unpack_from(data, 0)
+        except struct.error:
+            return None
+        if(magic != LevelSnapshot.MAGIC or version != LevelSnapshot.VERSION or players != len(level.players) or
+           enemies != len(level.enemies) or traps != len(level.traps)):
+            return None
+        offset = LevelSnapshot.HEADER.size
+
+        if rng:
+            *internal, has_gauss, gauss = LevelSnapshot.RANDOM.unpack_from(data, offset)
+            offset += LevelSnapshot.RANDOM.size
+            random.setstate((3, tuple(internal), gauss if has_gauss else None))
+
+        for player in level.players:
+            values = LevelSnapshot.PLAYER.unpack_from(data, offset)
+            offset += LevelSnapshot.PLAYER.size
+            (player.rect.x, player.rect.y, player.rect_collision_feet.x, player.rect_collision_feet.y,
+             player.rect_collision_body.x, player.rect_collision_body.y, player.frame, player.direction, animation,
+             player.move_x, player.move_y, player.lives, player.score, player.y_start_jump,
+             player.animation_elapsed_time, player.movement_elapsed_time, player.hit_cooldown, player.prev_x,
+             player.prev_y, player.is_jumping, player.falling, player.is_shooting, player.facing_right,
+             player.can_shooting, projectile_count) = values
+            player.animation = getattr(player.archetype, PLAYER_ANIMATIONS[animation])
+
+            projectiles = []
+            for _ in range(projectile_count):
+                projectiles.append(LevelSnapshot.PROJECTILE.unpack_from(data, offset))
+                offset += LevelSnapshot.PROJECTILE.size
+            player.projectile.restore(projectiles)
+
+        for enemy in level.enemies:
+            values = LevelSnapshot.ENEMY.unpack_from(data, offset)
+            offset += LevelSnapshot.ENEMY.size
+            (enemy.rect.x, enemy.rect.y, enemy.rect_collision_head.x, enemy.rect_collision_head.y,
+             enemy.rect_collision_body.x, enemy.rect_collision_body.y, enemy.rect_collision_feet.x,
+             enemy.rect_collision_feet.y, enemy.frame, enemy.direction, animation, enemy.move_x,
+             enemy.movement_elapsed_time, enemy.animation_elapsed_time, enemy.patrol_wait_time,
+             enemy.elapsed_time_of_death, enemy.prev_x, enemy.prev_y, enemy.was_hit, enemy.is_falling,
+             moving) = values
+            enemy.animation = getattr(enemy.archetype, ENEMY_ANIMATIONS[animation])
+            enemy.patrol_state = "moving" if moving else "waiting"
+            enemy.update_grid()
+
+        remaining = []
+        for _ in range(collectibles):
+            index, frame, elapsed, collected_elapsed, animation, collected = \
+                LevelSnapshot.COLLECTIBLE.unpack_from(data, offset)
+            offset += LevelSnapshot.COLLECTIBLE.size
+            collectible = level.built_collectibles[index]
+            collectible.frame = frame
+            collectible.animation_elapsed_time = elapsed
+            collectible.collected_elapsed_time = collected_elapsed
+            collectible.collected = collected
+            collectible.animation = collectible.animations[animation]
+            remaining.append(collectible)
+        level.collectibles[:] = remaining
+
+        for trap in level.traps:
+            trap.frame, trap.animation_elapsed_time = LevelSnapshot.TRAP.unpack_from(data, offset)
+            offset += LevelSnapshot.TRAP.size
+
+        for store in (level.trap_store, level.collectible_store):
+            if store is not None:
+                store.load()
+
+        return clock
@@ -0,0 +1,149 @@
+import pygame
+
+from config import *
+
+class SharedSound:
+    """
+    Clase que representa un sonido del SoundBank tal como lo usa una entidad: el Sound decodificado es compartido, pero
+    cada SharedSound tiene su propio volumen, que se aplica al canal en el que suena.
+    """
+    def __init__(self, path:str, sound:pygame.mixer.Sound, volume:float) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            path (str): Ruta del archivo, identifica las voces del sonido en el SoundBank.
+            sound (pygame.mixer.Sound): Sonido decodificado y compartido.
+            volume (float): Volumen con el que suena esta copia.
+        """
+        self.path = path
+        self.sound = sound
+        self.volume = volume
+
+
+    def set_volume(self, volume:float) -> None:
+        """
+        Método que cambia el volumen con el que suena esta copia, sin afectar a las demás.
+
+        Args:
+            volume (float): Volumen entre 0 y 1.
+        """
+        if isinstance(volume, (int, float)):
+            self.volume = volume
+
+
+    def play(self) -> pygame.mixer.Channel | None:
+        """
+        Método que reproduce el sonido respetando el límite de voces del SoundBank.
+
+        Returns:
+            pygame.mixer.Channel | None: Canal en el que suena, None si no había canales disponibles.
+        """
+        return SoundBank.play(self)
+
+
+class SoundBank:
+    """
+    Clase auxiliar que decodifica cada archivo de sonido una sola vez y lo comparte entre todas las entidades. Además
+    limita cuántas veces puede sonar el mismo archivo a la vez: si se supera el límite se corta la voz más vieja, así
+    muchos sonidos iguales juntos no ocupan todos los canales del mixer.
+    """
+    _sounds = {}
+    _voices = {}
+    _limits = {}
+
+    @staticmethod
+    def get(name:str, volume:float=1, max_voices:int=SOUND_MAX_VOICES) -> SharedSound | None:
+        """
+        Método estático que devuelve un sonido compartido, decodificándolo solo la primera vez.
+
+        Args:
+            name (str): Nombre del archivo dentro de PATH_SOUND.
+            volume (float, optional): Volumen con el que suena la copia devuelta. Defaults to 1.
+            max_voices (int, optional): Cantidad máxima de veces que el archivo puede sonar a la vez.
+            Defaults to SOUND_MAX_VOICES.
+
+        Returns:
+            SharedSound | None: El sonido compartido, None si el nombre no es válido.
+        """
+        if isinstance(name, str) and name:
+            path = PATH_SOUND + name
+            sound = SoundBank._sounds.get(path)
+            if sound is None:
+                sound = pygame.mixer.Sound(path)
+                SoundBank._sounds[path] = sound
+                SoundBank._voices[path] = []
+            SoundBank._limits[path] = max_voices
+            return SharedSound(path, sound, volume)
+        else:
+            return None
+
+
+    @staticmethod
+    def play(shared_sound:SharedSound) -> pygame.mixer.Channel | None:
+        """
+        Método estático que reproduce un sonido compartido. Primero descarta las voces que ya terminaron y, si el
+        archivo llegó a su límite, corta la más vieja. Si el banco se vació con "clear" mientras la copia seguía en
+        uso, el archivo se vuelve a registrar con el sonido que ya tiene la copia.
+
+        Args:
+            shared_sound (SharedSound): Sonido a reproducir.
+
+        Returns:
+            pygame.mixer.Channel | None: Canal en el que suena, None si no había canales disponibles.
+        """
+        path = shared_sound.path
+        shared_sound.sound = SoundBank._sounds.setdefault(path, shared_sound.sound)
+        voices = SoundBank._voices.setdefault(path, [])
+        voices[:] = [channel for channel in voices if channel.get_busy() and channel.get_sound() is shared_sound.sound]
+
+        if len(voices) >= SoundBank._limits.setdefault(path, SOUND_MAX_VOICES):
+            voices.pop(0).stop()
+
+        channel = shared_sound.sound.play()
+        if channel is not None:
+            channel.set_volume(shared_sound.volume)
+            voices.append(channel)
+        return channel
+
+
+    @staticmethod
+    def preload(names) -> None:
+        """
+        Método estático que decodifica de antemano varios sonidos.
+
+        Args:
+            names (iterable): Nombres de archivo dentro de PATH_SOUND.
+        """
+        for name in names:
+            path = PATH_SOUND + name
+            if path not in SoundBank._sounds:
+                SoundBank._sounds[path] = pygame.mixer.Sound(path)
+                SoundBank._voices[path] = []
+                SoundBank._limits.setdefault(path, SOUND_MAX_VOICES)
+
+
+    @staticmethod
+    def info() -> dict:
+        """
+        Método estático que resume el estado del banco.
+
+        Returns:
+            dict: Diccionario con la cantidad de sonidos decodificados y las voces activas por archivo.
+        """
+        return {
+            "sounds": len(SoundBank._sounds),
+            "voices": {path: len(voices) for path, voices in SoundBank._voices.items()}
+        }
+
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Método estático que detiene y libera todos los sonidos del banco.
+        """
+        for sound in SoundBank._sounds.values():
+            sound.stop()
+        SoundBank._sounds.clear()
+        SoundBank._voices.clear()
+        SoundBank._limits.clear()
@@ -0,0 +1,211 @@
+import pygame
+
+from config import *
+
+COLLISION_RECTS = ("rect_collision_top", "rect_collision_bottom", "rect_collision_left", "rect_collision_right",
+                   "rect_collision_head", "rect_collision_body", "rect_collision_feet")
+
+class SpatialGrid(list):
+    """
+    Lista de plataformas indexada con una grilla uniforme. Como las plataformas no se mueven, cada una se ubica una sola
+    vez en las celdas que cubre, y las colisiones solo revisan las plataformas de las celdas cercanas en lugar de toda
+    la lista. Sigue siendo una lista, así que recorrerla para dibujar funciona igual que antes.
+
+    Las celdas guardan posiciones de la lista, por eso solo se puede agregar al final (append y extend); los métodos que
+    quitan, insertan, reemplazan o reordenan elementos lanzan TypeError en lugar de dejar la grilla desactualizada.
+    """
+    def __init__(self, items=(), cell_size:int=GRID_CELL_SIZE) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            items (iterable, optional): Plataformas iniciales. Defaults to ().
+            cell_size (int, optional): Lado en píxeles de cada celda. Defaults to GRID_CELL_SIZE.
+        """
+        super().__init__()
+        self.cell_size = cell_size
+        self.cells = {}
+        self.extend(items)
+
+
+    @staticmethod
+    def bounds(platform) -> pygame.Rect:
+        """
+        Método estático que calcula el rectángulo que abarca la entidad y todos sus rectángulos de colisión.
+
+        Args:
+            platform (Platform | Enemy | Traps): Entidad a ubicar.
+
+        Returns:
+            pygame.Rect: Rectángulo envolvente.
+        """
+        rects = [getattr(platform, name) for name in COLLISION_RECTS if hasattr(platform, name)]
+        return platform.rect.unionall(rects)
+
+
+    def cell_range(self, rect:pygame.Rect) -> tuple:
+        """
+        Método que calcula qué celdas cubre un rectángulo.
+
+        Args:
+            rect (pygame.Rect): Rectángulo a ubicar.
+
+        Returns:
+            tuple: Tupla (columna inicial, columna final, fila inicial, fila final), ambas inclusive.
+        """
+        return (rect.left // self.cell_size, (rect.right - 1) // self.cell_size,
+                rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size)
+
+
+    def append(self, platform) -> None:
+        """
+        Método que agrega una plataforma a la lista y la ubica en la grilla.
+
+        Args:
+            platform (Platform): Plataforma a agregar.
+        """
+        index = len(self)
+        super().append(platform)
+
+        if hasattr(platform, "rect"):
+            first_column, last_column, first_row, last_row = self.cell_range(SpatialGrid.bounds(platform))
+            for column in range(first_column, last_column + 1):
+                for row in range(first_row, last_row + 1):
+                    self.cells.setdefault((column, row), []).append(index)
+
+
+    def extend(self, platforms) -> None:
+        """
+        Método que agrega varias plataformas.
+
+        Args:
+            platforms (iterable): Plataformas a agregar.
+        """
+        for platform in platforms:
+            self.append(platform)
+
+
+    def _append_only(self, *args, **kwargs):
+        """
+        Método que reemplaza a los de list que cambiarían las posiciones de los elementos ya ubicados en la grilla.
+
+        Raises:
+            TypeError: Siempre.
+        """
+        raise TypeError(f"{type(self).__name__} solo admite agregar elementos al final (append o extend)")
+
+    remove = pop = insert = clear = sort = reverse = _append_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _append_only
+
+
+    def query(self, rect:pygame.Rect) -> list:
+        """
+        Método que devuelve las plataformas de las celdas que toca el rectángulo, en el mismo orden que en la lista.
+
+        Args:
+            rect (pygame.Rect): Rectángulo de la entidad que se quiere revisar.
+
+        Returns:
+            list: Plataformas candidatas a colisionar con el rectángulo.
+        """
+        first_column, last_column, first_row, last_row = self.cell_range(rect)
+        indexes = set()
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                indexes.update(self.cells.get((column, row), ()))
+        return [self[index] for index in sorted(indexes)]
+
+
+    @staticmethod
+    def nearby(platform_list:list, rect:pygame.Rect) -> list:
+        """
+        Método estático que devuelve las entidades cercanas al rectángulo si la lista está indexada, o la lista completa
+        si es una lista común.
+
+        Args:
+            platform_list (list): Lista de plataformas (o de enemigos o trampas).
+            rect (pygame.Rect): Rectángulo de la entidad que se quiere revisar.
+
+        Returns:
+            list: Entidades a revisar.
+        """
+        if isinstance(platform_list, SpatialGrid):
+            return platform_list.query(rect)
+        return platform_list
+
+
+class DynamicGrid(SpatialGrid):
+    """
+    Lista de entidades que se mueven (enemigos) o que pueden moverse (trampas), indexada con la misma grilla uniforme.
+    Cada entidad guarda una referencia a la grilla y avisa con "move" cuando cambia de posición desde "add_x" o "add_y";
+    solo se actualizan las celdas si la entidad pasó a cubrir otras, lo que en la mayoría de los pasos no ocurre.
+    Si el nivel arma un EntityStore para las entidades queda en "store", para probar colisiones contra todas a la vez.
+    """
+    def __init__(self, items=(), cell_size:int=GRID_CELL_SIZE) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            items (iterable, optional): Entidades iniciales. Defaults to ().
+            cell_size (int, optional): Lado en píxeles de cada celda. Defaults to GRID_CELL_SIZE.
+        """
+        self.item_cells = []
+        self.max_radius = 0
+        self.store = None
+        super().__init__(items, cell_size)
+
+
+    def append(self, item) -> None:
+        """
+        Método que agrega una entidad a la lista, la ubica en la grilla y le deja la referencia para que avise al moverse.
+
+        Args:
+            item (Enemy | Traps): Entidad a agregar.
+        """
+        index = len(self)
+        list.append(self, item)
+        self.item_cells.append(None)
+
+        if hasattr(item, "rect"):
+            item.grid = self
+            item.grid_index = index
+            self.max_radius = max(self.max_radius, getattr(item, "radius", 0))
+            self.move(item)
+
+
+    def move(self, item) -> None:
+        """
+        Método que vuelve a ubicar una entidad en la grilla luego de moverse.
+
+        Args:
+            item (Enemy | Traps): Entidad que se movió.
+        """
+        index = item.grid_index
+        cell_range = self.cell_range(SpatialGrid.bounds(item))
+        old_range = self.item_cells[index]
+
+        if cell_range != old_range:
+            if old_range is not None:
+                self._unlink(index, old_range)
+            first_column, last_column, first_row, last_row = cell_range
+            for column in range(first_column, last_column + 1):
+                for row in range(first_row, last_row + 1):
+                    self.cells.setdefault((column, row), []).append(index)
+            self.item_cells[index] = cell_range
+
+
+    def _unlink(self, index:int, cell_range:tuple) -> None:
+        """
+        Método que saca una entidad de las celdas que cubría.
+
+        Args:
+            index (int): Posición de la entidad en la lista.
+            cell_range (tuple): Celdas que cubría, ver "cell_range".
+        """
+        first_column, last_column, first_row, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self.cells[(column, row)]
+                cell.remove(index)
+                if not cell:
+                    del self.cells[(column, row)]
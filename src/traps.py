@@ -2,13 +2,55 @@ import pygame
 import json
 
 from config import *
-from assistant import Assistant
+from animation import AnimationBank
+from archetype import Archetype
+
+class TrapArchetype(Archetype):
+    """
+    Clase que guarda lo que comparten todas las trampas con la misma animación y escala: los fotogramas, el radio de
+    colisión y la velocidad de la animación.
+    """
+    __slots__ = ("animation", "scale", "frame_rate", "radius")
+
+    def __init__(self, animations:dict, scale:int|float) -> None:
+        """
+        Constructor de la clase.
+
+        Args:
+            animations (dict): Diccionario que contiene el path de la imagen y cuantas columnas tiene la imagen.
+            scale (int | float) Escala de la imagen del objeto.
+        """
+        self.animation = AnimationBank.get(PATH_IMAGE+animations["path"],animations["columns"],1,False,scale)
+        self.scale = scale
+        self.frame_rate = 30
+        if self.scale == 2:
+            self.radius = 35
+        else:
+            self.radius = 25
+
+
+    @staticmethod
+    def get(animations:dict, scale:int|float) -> "TrapArchetype":
+        """
+        Método estático que devuelve el arquetipo compartido para esa animación y escala.
+
+        Args:
+            animations (dict): Diccionario que contiene el path de la imagen y cuantas columnas tiene la imagen.
+            scale (int | float) Escala de la imagen del objeto.
+
+        Returns:
+            TrapArchetype: Arquetipo compartido.
+        """
+        return Archetype.shared(TrapArchetype, animations, scale)
+
 
 class Traps:
     """
     Clase que instancia objetos de tipo Traps que serán utilizados en este juego para matar al Player.
-
+    Lo que no cambia entre trampas iguales vive en su TrapArchetype.
     """
+    __slots__ = ("archetype", "frame", "rect", "animation_elapsed_time", "grid", "grid_index")
+
     def __init__(self, animations:dict, pos_x:int, pos_y:int, scale:int) -> None:
         """
         Método constructor de la clase.
@@ -21,20 +63,30 @@ class Traps:
         """
         if(isinstance(animations, dict) and animations and isinstance(pos_x, int) and pos_x and isinstance(pos_y, int) and 
            pos_y and isinstance(scale, (int, float))):
-            self.image_trap = Assistant.get_surface_sprite(PATH_IMAGE+animations["path"],animations["columns"],1,False,scale)
+            self.archetype = TrapArchetype.get(animations, scale)
             self.frame = 0
-            self.animation = self.image_trap
-            self.image = self.animation[self.frame]
-            self.rect = self.image.get_rect()
+            self.rect = self.archetype.animation[self.frame].get_rect()
             self.rect.x = pos_x
             self.rect.y = pos_y
-            self.scale = scale
             self.animation_elapsed_time = 0
-            self.frame_rate = 30
-            if self.scale == 2:
-                self.radius = 35
-            else:
-                self.radius = 25
+            self.grid = None
+            self.grid_index = None
+
+
+    @property
+    def radius(self) -> int:
+        """
+        Radio de la trampa para las colisiones de círculo.
+        """
+        return self.archetype.radius
+
+
+    @property
+    def animations(self) -> tuple:
+        """
+        Animaciones que puede mostrar la trampa, las usa el EntityStore.
+        """
+        return (self.archetype.animation,)
 
     
     @staticmethod
@@ -49,32 +101,47 @@ class Traps:
             list: Retorna la lista de Players o None en caso de error.
         """
         try:
-            trap_list = []
-
             with open (json_file, "r") as file:
                 data = json.load(file)
 
-                if "traps" in data:
-                    traps_data = data["traps"]
-
-                    for trap in traps_data:
-                        animations = trap["animations"]
-                        pos_x = trap["pos_x"]
-                        pos_y = trap["pos_y"]
-                        scale = trap["scale"]
-
-                        trap = Traps(animations, pos_x, pos_y, scale)
-                        trap_list.append(trap)
-            
-            return trap_list
+            return Traps.create_traps_list(data)
 
         except (FileNotFoundError, json.JSONDecodeError):
             return None
+
+
+    @staticmethod
+    def create_traps_list(data:dict) -> list:
+        """
+        Método estático que construye las trampas a partir del documento del nivel ya parseado.
+
+        Args:
+            data (dict): Documento del nivel, se usa la clave "traps".
+
+        Returns:
+            list: Retorna la lista de trampas, vacía si el documento no tiene la clave.
+        """
+        trap_list = []
+
+        if isinstance(data, dict) and "traps" in data:
+            traps_data = data["traps"]
+
+            for trap in traps_data:
+                animations = trap["animations"]
+                pos_x = trap["pos_x"]
+                pos_y = trap["pos_y"]
+                scale = trap["scale"]
+
+                trap = Traps(animations, pos_x, pos_y, scale)
+                trap_list.append(trap)
+
+        return trap_list
     
 
     def has_collided(self, player) -> bool:
         """
         Verifica si la trampa ha colisionado con el jugador utilizando colisiones de círculo, mediante el radio.
+        Se comparan las distancias al cuadrado para no calcular la raíz.
 
         Args:
             player (Player): Instancia de la clase Player.
@@ -85,16 +152,15 @@ class Traps:
         if player:
             delta_x = self.rect.centerx - player.rect_collision_body.centerx
             delta_y = self.rect.centery - player.rect_collision_body.centery
+            reach = self.archetype.radius + player.radius
 
-            distance = (delta_x ** 2 + delta_y ** 2) ** 0.5
-
-            return distance < self.radius + player.radius
+            return delta_x * delta_x + delta_y * delta_y < reach * reach
 
     
     def do_animation(self, delta_ms:int) -> None:
         """
         Método que se encarga las animaciones. Se encarga de establecer en 0 el frame cada vez que el tiempo sea mayor al
-        al atributo self.frame_rate.
+        al atributo self.archetype.frame_rate.
 
         Args:
             delta_ms (int): Variable que hace referencia al tiempo transcurrido desde que se actualizo la pantalla.
@@ -102,9 +168,9 @@ class Traps:
         if isinstance(delta_ms, int) and delta_ms:
             self.animation_elapsed_time += delta_ms
 
-            if self.animation_elapsed_time >= self.frame_rate:
+            if self.animation_elapsed_time >= self.archetype.frame_rate:
                 self.animation_elapsed_time = 0 
-                self.frame = (self.frame + 1) % len(self.animation)
+                self.frame = (self.frame + 1) % len(self.archetype.animation)
 
     
     def update(self, delta_ms:int) -> None:
@@ -119,14 +185,16 @@ class Traps:
             self.do_animation(delta_ms)
 
     
-    def draw(self, window:pygame.Surface) -> None:
+    def draw(self, window:pygame.Surface) -> pygame.Rect | None:
         """
         Método que se encarga de dibujar las trampas en la ventana.
 
         Args:
             window (pygame.Surface): Es la ventana principal del juego.
+
+        Returns:
+            pygame.Rect | None: Zona de la ventana donde se dibujó, None si la ventana no es válida.
         """
         if isinstance(window, pygame.Surface) and window:
-            self.image =  self.animation[self.frame]
-            window.blit(self.image, self.rect)
+            return window.blit(self.archetype.animation[self.frame], self.rect)
 